@@ -12,6 +12,7 @@ from app.config import active_config  # Import active_config
 from app.database import db  # Import the db instance from database.py
 from app.database.user_db import init_user_db  # Import user database initialization
 from app.middleware.maintenance import maintenance_middleware
+from app.utils.json_provider import FastJSONProvider
 from app.utils.logger import logger
 
 # Setup logging as early as possible
@@ -22,6 +23,7 @@ def create_app():
     """Create and configure an instance of the Flask application."""
     app = Flask(__name__)
     app.config.from_object(active_config)  # Use active_config directly
+    app.json = FastJSONProvider(app)  # orjson when installed
 
     # Ensure SECRET_KEY is consistent from environment
     import os
@@ -123,6 +125,8 @@ def create_app():
 
     # Import models here to ensure they are registered with SQLAlchemy
     from app.database import models  # noqa
+    from app.database import count_cache  # noqa
+    from app.database import naics_index  # noqa
     from app.database import user_models  # noqa
 
     # Automatic database initialization
@@ -169,6 +173,7 @@ def create_app():
     from app.api.auth import auth_bp  # Import auth blueprint
     from app.api.decisions import decisions_bp  # Import decisions blueprint
     from app.api.tools import tools_bp  # Import tools blueprint
+    from app.api.events import events_bp  # Import event stream blueprint
     from app.web.routes import main as web_main_bp  # Import the web blueprint
 
     app.register_blueprint(web_main_bp)  # Register the web blueprint
@@ -187,6 +192,7 @@ def create_app():
     app.register_blueprint(auth_bp)  # Register auth blueprint
     app.register_blueprint(decisions_bp)  # Register decisions blueprint
     app.register_blueprint(tools_bp)  # Register tools blueprint
+    app.register_blueprint(events_bp)  # Register event stream blueprint
 
     # Set common security headers on all responses
     @app.after_request
@@ -201,6 +207,7 @@ def create_app():
 
     # Initialize enhancement queue and cleanup utilities
     with app.app_context():
+        from app.services.duplicate_scan import duplicate_scan_service
         from app.services.enhancement_queue import enhancement_queue  # noqa: F401
         from app.services.llm_service import llm_service  # noqa: F401
         from app.utils.enhancement_cleanup import cleanup_all_in_progress_enhancements
@@ -210,6 +217,8 @@ def create_app():
         enhancement_queue.set_app(app)
         # Set the app reference in the LLM service for background threads
         llm_service.set_app(app)
+        # Set the app reference for background duplicate scans
+        duplicate_scan_service.set_app(app)
 
         # Database is already initialized above, so tables should exist
         # Run cleanup functions
@@ -247,6 +256,17 @@ def create_app():
                         )
                 except Exception as e:
                     logger.warning(f"Failed to clean up stuck scrapers: {e}")
+
+            # Scans running when the server stopped can be resumed later
+            try:
+                interrupted_scans = duplicate_scan_service.recover_interrupted_scans()
+                if interrupted_scans > 0:
+                    logger.info(
+                        f"Marked {interrupted_scans} interrupted duplicate scans as resumable"
+                    )
+            except Exception as e:
+                db.session.rollback()
+                logger.warning(f"Failed to recover interrupted duplicate scans: {e}")
         else:
             logger.info("Skipping cleanup functions - database tables not available")
 
@@ -8,13 +8,34 @@ from app.api.factory import (
     success_response,
 )
 from app.database import db
+from app.database.crud import prospects_version
 from app.database.models import DataSource, Prospect, ScraperStatus
+from app.database.naics_index import delete_prospect_naics_where
+from app.database.write_generation import write_generation
 from app.exceptions import DatabaseError, NotFoundError, ValidationError
 
 data_sources_bp, logger = create_blueprint("data_sources")
 
 
-@api_route(data_sources_bp, "/", methods=["GET"], auth="super_admin")
+def _data_sources_version():
+    """Version token of the data source list, see api_route's etag."""
+    newest = db.session.query(
+        func.max(DataSource.last_scraped), func.max(ScraperStatus.last_checked)
+    ).one()
+    return (
+        prospects_version(),
+        write_generation(ScraperStatus.__tablename__),
+        *newest,
+    )
+
+
+@api_route(
+    data_sources_bp,
+    "/",
+    methods=["GET"],
+    auth="super_admin",
+    etag=_data_sources_version,
+)
 def get_data_sources():
     """Get all data sources."""
     logger.info("GET /api/data-sources/ called")
@@ -288,6 +309,7 @@ def delete_data_source(source_id):
         )
 
         # Delete related prospects first (cascade might not be configured)
+        delete_prospect_naics_where(db.session, Prospect.source_id == source_id)
         db.session.query(Prospect).filter(Prospect.source_id == source_id).delete()
 
         # Delete related scraper status
@@ -336,6 +358,7 @@ def clear_data_source_data(source_id):
         )
 
         # Delete related prospects
+        delete_prospect_naics_where(db.session, Prospect.source_id == source_id)
         db.session.query(Prospect).filter(Prospect.source_id == source_id).delete()
         db.session.commit()
 
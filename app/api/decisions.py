@@ -18,6 +18,7 @@ from app.api.factory import (
     success_response,
 )
 from app.database.models import GoNoGoDecision, Prospect, db
+from app.database.write_generation import write_generation
 from app.utils.user_utils import get_user_data_dict, get_users_by_ids
 
 decisions_bp, logger = create_blueprint("decisions", "/api/decisions")
@@ -206,7 +207,30 @@ def get_user_decisions():
         return error_response(500, "Failed to get user decisions")
 
 
-@api_route(decisions_bp, "/stats", methods=["GET"], auth="login")
+def _decision_stats_version():
+    """Version token of the user's decision stats, see api_route's etag."""
+    newest = (
+        db.session.query(
+            func.count(GoNoGoDecision.id), func.max(GoNoGoDecision.updated_at)
+        )
+        .filter_by(user_id=session.get("user_id"))
+        .one()
+    )
+    return (
+        write_generation(GoNoGoDecision.__tablename__, Prospect.__tablename__),
+        *newest,
+        # The recent activity window moves with the clock
+        datetime.datetime.now(UTC).strftime("%Y-%m-%d %H"),
+    )
+
+
+@api_route(
+    decisions_bp,
+    "/stats",
+    methods=["GET"],
+    auth="login",
+    etag=_decision_stats_version,
+)
 def get_decision_stats():
     """Get statistics about the current user's decisions."""
     try:
@@ -0,0 +1,99 @@
+"""Server-sent events stream of enhancement, scraper and scan progress.
+
+Each open stream holds a server thread, so streams end after
+EVENT_STREAM_MAX_SECONDS and at most EVENT_STREAM_MAX_CONNECTIONS are open at
+once. EventSource reconnects on its own and is replayed what it missed.
+"""
+
+import threading
+import time
+
+from flask import Response, request, session, stream_with_context
+
+from app.api.factory import create_blueprint, error_response, login_required
+from app.config import active_config
+from app.services.event_bus import TOPICS, event_bus
+
+events_bp, logger = create_blueprint("events_api", "/api/events")
+
+# Topics limited to some roles, the others are open to any signed-in user
+TOPIC_ROLES = {"scraper": ("super_admin",)}
+
+# Seconds between keep-alive comments on an idle stream
+KEEPALIVE_SECONDS = 15
+
+# Milliseconds EventSource waits before reconnecting to an ended stream
+RECONNECT_MILLISECONDS = 1000
+
+_stream_slots = threading.BoundedSemaphore(active_config.EVENT_STREAM_MAX_CONNECTIONS)
+
+
+@events_bp.route("/stream", methods=["GET"])
+@login_required
+def stream_events():
+    """Stream bus events as server-sent events.
+
+    Query params:
+        topics: Comma-separated topics to receive, defaults to all the
+            user may read
+
+    Each event is named after its topic and its data is a JSON object with a
+    ``type`` field. Reconnecting EventSources send Last-Event-ID and are
+    replayed the retained events they missed. Responds 503 when
+    EVENT_STREAM_MAX_CONNECTIONS streams are already open.
+    """
+    role = session.get("user_role", "user")
+    requested = request.args.get("topics", "", type=str)
+    if requested:
+        topics = [topic.strip() for topic in requested.split(",") if topic.strip()]
+        unknown = [topic for topic in topics if topic not in TOPICS]
+        if unknown:
+            return error_response(
+                400,
+                f"Unknown topics: {', '.join(unknown)}. "
+                f"Expected any of: {', '.join(TOPICS)}",
+            )
+        if any(role not in TOPIC_ROLES.get(topic, (role,)) for topic in topics):
+            return error_response(403, "Not allowed to subscribe to these topics")
+    else:
+        topics = [t for t in TOPICS if role in TOPIC_ROLES.get(t, (role,))]
+
+    if not _stream_slots.acquire(blocking=False):
+        response, status = error_response(
+            503, "Too many open event streams, poll for updates instead"
+        )
+        response.headers["Retry-After"] = "30"
+        return response, status
+
+    last_event_id = request.headers.get("Last-Event-ID", type=int)
+    subscription = event_bus.subscribe(topics, last_event_id)
+
+    def generate():
+        try:
+            # Opens the stream at once so clients see the connection succeed
+            yield f"retry: {RECONNECT_MILLISECONDS}\n: connected\n\n"
+            deadline = time.monotonic() + active_config.EVENT_STREAM_MAX_SECONDS
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # Frees the thread, the client reconnects with Last-Event-ID
+                    return
+                published = subscription.get(timeout=min(KEEPALIVE_SECONDS, remaining))
+                if subscription.overflowed:
+                    subscription.overflowed = False
+                    yield "event: resync\ndata: {}\n\n"
+                if published is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield published.to_sse()
+        finally:
+            event_bus.unsubscribe(subscription)
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # Also runs for clients that disconnect before the stream starts
+    response.call_on_close(_stream_slots.release)
+    return response
@@ -6,10 +6,12 @@ Provides:
 - Common response formatters
 """
 
+import hashlib
+import math
 from functools import wraps
 from typing import Any, Callable, Optional
 
-from flask import Blueprint, jsonify, session
+from flask import Blueprint, jsonify, make_response, request, session
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.exceptions import (
@@ -51,6 +53,7 @@ def api_route(
     rule: str,
     methods: Optional[list[str]] = None,
     auth: Optional[str] = None,
+    etag: Optional[Callable[..., Any]] = None,
     **options,
 ):
     """Decorator for API routes with built-in auth and error handling.
@@ -60,6 +63,10 @@ def api_route(
         rule: The URL rule string
         methods: List of HTTP methods (default ["GET"])
         auth: Auth level - None, "login", "admin", or "super_admin"
+        etag: Optional function taking the view's arguments and returning a
+            cheap version token of the data behind the response. GET
+            responses then carry an ETag and If-None-Match requests that
+            still match are answered 304 without running the view.
         **options: Additional route options
 
     Example:
@@ -84,6 +91,8 @@ def api_route(
 
             # Execute the route function with error handling
             try:
+                if etag is not None and request.method in ("GET", "HEAD"):
+                    return _conditional_response(etag, f, args, kwargs)
                 return f(*args, **kwargs)
             except ValidationError as e:
                 return error_response(
@@ -140,6 +149,34 @@ def api_route(
     return decorator
 
 
+def _conditional_response(etag: Callable[..., Any], f: Callable, args, kwargs):
+    """Run a GET view unless the client's If-None-Match is still current.
+
+    The ETag hashes the version token with the full request path and the
+    session's user and role, so responses differing by query string or user
+    never share a tag.
+    """
+    token = (
+        etag(*args, **kwargs),
+        request.full_path,
+        session.get("user_id"),
+        session.get("user_role"),
+    )
+    tag = hashlib.sha1(repr(token).encode()).hexdigest()
+
+    if request.if_none_match.contains_weak(tag):
+        response = make_response("", 304)
+        response.set_etag(tag, weak=True)
+        return response
+
+    response = make_response(f(*args, **kwargs))
+    if response.status_code == 200:
+        response.set_etag(tag, weak=True)
+        # Browsers may store the response but must revalidate before reuse
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
 def _check_auth(level: str) -> Optional[tuple[dict, int]]:
     """Check if the current session has the required authentication level.
 
@@ -265,6 +302,46 @@ def paginated_response(
     return jsonify(response), 200
 
 
+def cursor_paginated_response(
+    items: list[Any],
+    per_page: int,
+    next_cursor: Optional[str],
+    total_items: Optional[int] = None,
+    **kwargs,
+) -> tuple[dict, int]:
+    """Create a standardized response for a keyset (cursor) paginated page.
+
+    Args:
+        items: List of items for current page
+        per_page: Items per page
+        next_cursor: Cursor of the next page, None on the last page
+        total_items: Total number of items, if it was counted
+        **kwargs: Additional response fields
+
+    Returns:
+        JSON response tuple
+    """
+    pagination = {
+        "per_page": per_page,
+        "next_cursor": next_cursor,
+        "has_next": next_cursor is not None,
+    }
+    if total_items is not None:
+        pagination["total_items"] = total_items
+        pagination["total_pages"] = math.ceil(total_items / per_page)
+
+    response = {
+        "status": "success",
+        "data": {"items": items, "pagination": pagination},
+    }
+
+    # Add any additional fields to data
+    if kwargs:
+        response["data"].update(kwargs)
+
+    return jsonify(response), 200
+
+
 # Backward compatibility exports for existing decorators
 def login_required(f):
     """Backward compatibility wrapper for login_required decorator."""
@@ -6,7 +6,6 @@ UTC = timezone.utc
 from datetime import datetime, timedelta
 
 from flask import request
-from sqlalchemy import func
 
 from app.api.factory import (
     api_route,
@@ -14,6 +13,7 @@ from app.api.factory import (
     error_response,
     success_response,
 )
+from app.database.crud import get_prospect_coverage
 from app.database.models import (
     AIEnrichmentLog,
     LLMOutput,
@@ -22,6 +22,7 @@ from app.database.models import (
 )
 from app.services.enhancement_queue import add_individual_enhancement, enhancement_queue
 from app.services.llm_service import llm_service
+from app.utils.llm_cache import get_llm_cache
 
 llm_bp, logger = create_blueprint("llm_api", "/api/llm")
 
@@ -29,88 +30,35 @@ llm_bp, logger = create_blueprint("llm_api", "/api/llm")
 @api_route(llm_bp, "/status", methods=["GET"], auth="admin")
 def get_llm_status():
     """Get current LLM processing status and statistics"""
-    # Get total prospects count
-    total_prospects = db.session.query(func.count(Prospect.id)).scalar()
-
-    # Get processed prospects count - only count those that have been fully processed
-    # This counts prospects with ollama_processed_at timestamp, indicating complete AI processing
-    processed_prospects = (
-        db.session.query(func.count(Prospect.id))
-        .filter(Prospect.ollama_processed_at.isnot(None))
-        .scalar()
-    )
-
-    # Get NAICS coverage statistics
-    naics_original = (
-        db.session.query(func.count(Prospect.id))
-        .filter(Prospect.naics.isnot(None), Prospect.naics_source == "original")
-        .scalar()
-    )
-
-    naics_llm_inferred = (
-        db.session.query(func.count(Prospect.id))
-        .filter(Prospect.naics.isnot(None), Prospect.naics_source == "llm_inferred")
-        .scalar()
-    )
-
-    total_with_naics = naics_original + naics_llm_inferred
-    naics_coverage_percentage = (
-        (total_with_naics / total_prospects * 100) if total_prospects > 0 else 0
-    )
-
-    # Get value parsing statistics
-    value_parsed_count = (
-        db.session.query(func.count(Prospect.id))
-        .filter(Prospect.estimated_value_single.isnot(None))
-        .scalar()
-    )
-
-    value_parsing_percentage = (
-        (value_parsed_count / total_prospects * 100) if total_prospects > 0 else 0
-    )
-
-    # Get title enhancement statistics
-    title_enhanced_count = (
-        db.session.query(func.count(Prospect.id))
-        .filter(Prospect.ai_enhanced_title.isnot(None))
-        .scalar()
-    )
-
-    title_enhancement_percentage = (
-        (title_enhanced_count / total_prospects * 100) if total_prospects > 0 else 0
-    )
+    # All coverage counts come from one aggregate query, memoized until
+    # prospects change
+    coverage = get_prospect_coverage()
+    total_prospects = coverage["total_prospects"]
+    processed_prospects = coverage["llm_processed"]
 
-    # Get set-aside standardization statistics
-    set_aside_standardized_count = (
-        db.session.query(func.count(Prospect.id))
-        .filter(Prospect.set_aside_standardized.isnot(None))
-        .scalar()
-    )
+    def percentage(count):
+        return count / total_prospects * 100 if total_prospects > 0 else 0
 
-    set_aside_percentage = (
-        (set_aside_standardized_count / total_prospects * 100)
-        if total_prospects > 0
-        else 0
-    )
+    # Get NAICS coverage statistics
+    naics_original = coverage["naics_original"]
+    naics_llm_inferred = coverage["naics_llm_inferred"]
+    naics_coverage_percentage = percentage(naics_original + naics_llm_inferred)
+
+    # Get value parsing, title enhancement and set-aside statistics
+    value_parsed_count = coverage["with_parsed_values"]
+    value_parsing_percentage = percentage(value_parsed_count)
+    title_enhanced_count = coverage["with_enhanced_title"]
+    title_enhancement_percentage = percentage(title_enhanced_count)
+    set_aside_standardized_count = coverage["with_standardized_set_aside"]
+    set_aside_percentage = percentage(set_aside_standardized_count)
 
     # Get last processed timestamp and model version
-    last_processed_prospect = (
-        db.session.query(Prospect)
-        .filter(Prospect.ollama_processed_at.isnot(None))
-        .order_by(Prospect.ollama_processed_at.desc())
-        .first()
-    )
-
     last_processed = (
-        last_processed_prospect.ollama_processed_at.isoformat() + "Z"
-        if last_processed_prospect
-        else None
-    )
-    model_version = (
-        last_processed_prospect.ollama_model_version
-        if last_processed_prospect
+        coverage["last_processed_at"].isoformat() + "Z"
+        if coverage["last_processed_at"]
         else None
     )
+    model_version = coverage["model_version"]
 
     # Gather queue and LLM availability status for frontend
     try:
@@ -118,11 +66,14 @@ def get_llm_status():
     except Exception:
         queue_status = {"is_processing": False, "total_items": 0}
 
+    # Availability comes from the background heartbeat, not an inline request
     try:
-        llm_status = llm_service.check_ollama_status()
+        llm_status = llm_service.get_ollama_status()
     except Exception:
         llm_status = {"available": False, "error": "unavailable"}
 
+    response_cache = get_llm_cache().stats()
+
     response_data = {
         "total_prospects": total_prospects,
         "processed_prospects": processed_prospects,
@@ -147,6 +98,7 @@ def get_llm_status():
         "model_version": model_version,
         "queue_status": queue_status,
         "llm_status": llm_status,
+        "response_cache": response_cache,
     }
 
     logger.info(
@@ -468,7 +420,9 @@ def _process_value_enhancement(prospect, llm_service, force_redo):
             value_to_parse = str(prospect.estimated_value)
 
     if value_to_parse:
-        parsed_value = llm_service.parse_contract_value_with_llm(
+        parsed_value = llm_service.parse_contract_value_with_rules(
+            value_to_parse
+        ) or llm_service.parse_contract_value_with_llm(
             value_to_parse, prospect_id=prospect.id
         )
 
@@ -867,8 +821,7 @@ def enhance_single_prospect():
     llm_status = llm_service.check_ollama_status()
     if not llm_status.get("available"):
         logger.warning(
-            "LLM service unavailable when queuing enhancement for prospect %s",
-            prospect_id,
+            f"LLM service unavailable when queuing enhancement for prospect {prospect_id}"
         )
         return error_response(
             503,
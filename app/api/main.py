@@ -3,7 +3,7 @@ from datetime import date, datetime, timezone
 UTC = timezone.utc
 
 from flask import request
-from sqlalchemy import desc, func
+from sqlalchemy import func
 
 from app.api.factory import (
     api_route,
@@ -12,11 +12,15 @@ from app.api.factory import (
     success_response,
 )
 from app.database import db
+from app.database.crud import prospects_version
+from app.database.dashboard_summary import get_dashboard_summary
 from app.database.models import (
     DataSource,
     Prospect,
     ScraperStatus,
 )
+from app.database.naics_index import delete_prospect_naics_where
+from app.database.write_generation import write_generation
 
 main_bp, logger = create_blueprint("main")
 
@@ -68,40 +72,33 @@ def health_check():
         )
 
 
-@api_route(main_bp, "/dashboard", methods=["GET"])
+def _dashboard_version():
+    """Version token of the dashboard data, see api_route's etag."""
+    newest = db.session.query(
+        func.max(DataSource.last_scraped), func.max(ScraperStatus.last_checked)
+    ).one()
+    return (
+        prospects_version(),
+        write_generation(ScraperStatus.__tablename__),
+        *newest,
+        # Upcoming prospects are relative to today
+        date.today(),
+    )
+
+
+@api_route(main_bp, "/dashboard", methods=["GET"], etag=_dashboard_version)
 def get_dashboard():
     """Get dashboard summary information."""
     session = db.session
     try:
-        # Get total number of prospects
-        total_prospects = session.query(func.count(Prospect.id)).scalar()
+        # Prospect aggregates come from the stored summary row
+        summary = get_dashboard_summary(session)
 
         # Get newest data source update (last_scraped from DataSource)
         latest_successful_scrape = session.query(
             func.max(DataSource.last_scraped)
         ).scalar()
 
-        # Get top agencies by prospect count
-        top_agencies = (
-            session.query(
-                Prospect.agency, func.count(Prospect.id).label("prospect_count")
-            )
-            .group_by(Prospect.agency)
-            .order_by(desc("prospect_count"))
-            .limit(5)
-            .all()
-        )
-
-        # Get upcoming prospects (using release_date)
-        today = date.today()  # Use date.today() for date comparison
-        upcoming_prospects_data = (
-            session.query(Prospect)
-            .filter(Prospect.release_date >= today)
-            .order_by(Prospect.release_date)
-            .limit(5)
-            .all()
-        )
-
         # Get recent scraper activity (last 5 completed or failed)
         recent_scraper_activity = (
             session.query(
@@ -118,28 +115,14 @@ def get_dashboard():
 
         return success_response(
             data={
-                "total_proposals": total_prospects,
+                "total_proposals": summary["total_proposals"],
                 "latest_successful_scrape": (
                     latest_successful_scrape.isoformat().replace("+00:00", "Z")
                     if latest_successful_scrape
                     else None
                 ),
-                "top_agencies": [
-                    {"agency": agency, "count": count} for agency, count in top_agencies
-                ],
-                "upcoming_proposals": [
-                    {
-                        "id": p.id,
-                        "title": p.title,
-                        "agency": p.agency,
-                        "proposal_date": (
-                            p.release_date.isoformat().replace("+00:00", "Z")
-                            if p.release_date
-                            else None
-                        ),
-                    }
-                    for p in upcoming_prospects_data
-                ],
+                "top_agencies": summary["top_agencies"],
+                "upcoming_proposals": summary["upcoming_proposals"],
                 "recent_scraper_activity": [
                     {
                         "data_source_name": name,
@@ -201,6 +184,7 @@ def _clear_database_impl(clear_type="all"):
     def _clear_all_data():
         # Delete all prospects first (due to foreign key constraints)
         prospect_count = db.session.query(func.count(Prospect.id)).scalar()
+        delete_prospect_naics_where(db.session)
         db.session.query(Prospect).delete()
 
         # Reset the auto-increment counters if using SQLite
@@ -238,6 +222,9 @@ def _clear_database_impl(clear_type="all"):
         )
 
         # Delete AI-enriched prospects
+        delete_prospect_naics_where(
+            db.session, Prospect.ollama_processed_at.isnot(None)
+        )
         db.session.query(Prospect).filter(
             Prospect.ollama_processed_at.isnot(None)
         ).delete()
@@ -266,6 +253,7 @@ def _clear_database_impl(clear_type="all"):
         )
 
         # Delete non-AI-enriched prospects
+        delete_prospect_naics_where(db.session, Prospect.ollama_processed_at.is_(None))
         db.session.query(Prospect).filter(
             Prospect.ollama_processed_at.is_(None)
         ).delete()
@@ -436,312 +424,76 @@ def set_ai_preservation_config():
         return error_response(500, f"Failed to update configuration: {str(e)}")
 
 
-def _setup_progress_tracking():
-    """Initialize progress tracking for duplicate detection scan."""
-    import threading
-    import time
-
-    scan_id = f"scan_{int(time.time())}_{threading.get_ident()}"
-
-    # Initialize progress in a global store
-    global_progress_store = getattr(detect_duplicates, "progress_store", {})
-
-    global_progress_store[scan_id] = {
-        "status": "starting",
-        "current": 0,
-        "total": 0,
-        "message": "Initializing scan...",
-        "start_time": time.time(),
-    }
-
-    # Ensure the store is attached to the function
-    detect_duplicates.progress_store = global_progress_store
-
-    logger.info(f"Started duplicate scan with ID: {scan_id}")
-    return scan_id
-
-
-def _get_prospects_to_process(source_id, limit):
-    """Get the list of prospects to process for duplicate detection."""
-    from app.database.models import Prospect
-
-    query = db.session.query(Prospect)
-    if source_id:
-        query = query.filter(Prospect.source_id == source_id)
-
-    # If limit is very high (10000+), treat as "scan all"
-    if limit >= 10000:
-        prospects = query.order_by(Prospect.loaded_at.desc()).all()
-    else:
-        prospects = query.order_by(Prospect.loaded_at.desc()).limit(limit * 2).all()
-
-    # Process up to the limit (or all if scanning all)
-    return prospects if limit >= 10000 else prospects[:limit]
-
-
-def _format_prospect_for_api(prospect):
-    """Format a single prospect for API response."""
-    return {
-        "id": prospect.id,
-        "native_id": prospect.native_id,
-        "title": (
-            prospect.title[:100] + "..."
-            if prospect.title and len(prospect.title) > 100
-            else prospect.title
-        ),
-        "description": (
-            prospect.description[:150] + "..."
-            if prospect.description and len(prospect.description) > 150
-            else prospect.description
-        ),
-        "agency": prospect.agency,
-        "naics": prospect.naics,
-        "place_city": prospect.place_city,
-        "place_state": prospect.place_state,
-        "ai_processed": prospect.ollama_processed_at is not None,
-        "loaded_at": (
-            prospect.loaded_at.isoformat().replace("+00:00", "Z")
-            if prospect.loaded_at
-            else None
-        ),
-    }
-
-
-def _create_duplicate_group(
-    prospect, high_confidence_matches, matched_prospects_cache=None
-):
-    """Create a duplicate group from a prospect and its matches."""
-    from app.database.models import Prospect
-
-    # Use cache if provided, otherwise fetch
-    if matched_prospects_cache is None:
-        # Get prospect details for the matches
-        match_ids = [m.prospect_id for m in high_confidence_matches]
-        matched_prospects = (
-            db.session.query(Prospect).filter(Prospect.id.in_(match_ids)).all()
-        )
-
-        matched_prospects_dict = {p.id: p for p in matched_prospects}
-    else:
-        matched_prospects_dict = matched_prospects_cache
-
-    duplicate_group = {"original": _format_prospect_for_api(prospect), "matches": []}
-
-    for match in high_confidence_matches:
-        matched_prospect = matched_prospects_dict.get(match.prospect_id)
-        if matched_prospect:
-            match_data = _format_prospect_for_api(matched_prospect)
-            match_data.update(
-                {
-                    "confidence_score": match.confidence_score,
-                    "match_type": match.match_type,
-                    "matched_fields": match.matched_fields,
-                }
-            )
-            duplicate_group["matches"].append(match_data)
-
-    return duplicate_group
-
-
-def _process_prospects_for_duplicates(prospects_to_process, scan_id, min_confidence):
-    """Process prospects to find duplicates with progress tracking."""
-    from app.utils.duplicate_prevention import DuplicateDetector
-
-    detector = DuplicateDetector()
-    potential_duplicates = []
-
-    # Update progress with total count
-    detect_duplicates.progress_store[scan_id].update(
-        {
-            "status": "processing",
-            "total": len(prospects_to_process),
-            "message": f"Scanning {len(prospects_to_process)} prospects for duplicates...",
-        }
-    )
-
-    logger.info(f"Processing {len(prospects_to_process)} prospects for scan {scan_id}")
-
-    # Group prospects by source_id and preload data for each source
-    prospects_by_source = {}
-    for prospect in prospects_to_process:
-        source_id = prospect.source_id or 0
-        if source_id not in prospects_by_source:
-            prospects_by_source[source_id] = []
-        prospects_by_source[source_id].append(prospect)
-
-    # Pre-fetch all prospects that might be needed for matching
-    # This prevents N+1 queries in the duplicate detection logic
-    all_prospect_ids = set()
-    all_matches_by_prospect = {}
-
-    # Process all prospects with progress tracking
-    processed_count = 0
-    for source_id, source_prospects in prospects_by_source.items():
-        # Preload all prospects for this source to optimize matching
-        detector.preload_source_prospects(db.session, source_id)
-
-        # Process prospects from this source
-        for prospect in source_prospects:
-            # Update progress every 25 records or on last record for better performance
-            if (
-                processed_count % 25 == 0
-                or processed_count == len(prospects_to_process) - 1
-            ):
-                detect_duplicates.progress_store[scan_id].update(
-                    {
-                        "current": processed_count + 1,
-                        "message": f"Processing prospect {processed_count + 1} of {len(prospects_to_process)}...",
-                    }
-                )
-                logger.debug(
-                    f"Scan {scan_id} progress: {processed_count + 1}/{len(prospects_to_process)}"
-                )
-
-            # Convert prospect to dict for matching
-            prospect_data = {
-                "native_id": prospect.native_id,
-                "title": prospect.title,
-                "description": prospect.description,
-                "naics": prospect.naics,
-                "agency": prospect.agency,
-                "place_city": prospect.place_city,
-                "place_state": prospect.place_state,
-                "source_id": prospect.source_id,  # Add source_id for cache lookup
-            }
-
-            # Find potential matches
-            matches = detector.find_potential_matches(
-                db.session, prospect_data, prospect.source_id or 0
-            )
-
-            # Filter by confidence and exclude self-matches
-            high_confidence_matches = [
-                match
-                for match in matches
-                if match.confidence_score >= min_confidence
-                and match.prospect_id != prospect.id
-            ]
-
-            if high_confidence_matches:
-                all_matches_by_prospect[prospect.id] = high_confidence_matches
-                # Collect all prospect IDs that will be needed
-                for match in high_confidence_matches:
-                    all_prospect_ids.add(match.prospect_id)
-
-            processed_count += 1
-
-    # Pre-fetch all needed prospects in a single query
-    matched_prospects_cache = {}
-    if all_prospect_ids:
-        all_matched_prospects = (
-            db.session.query(Prospect)
-            .filter(Prospect.id.in_(list(all_prospect_ids)))
-            .all()
-        )
-        matched_prospects_cache = {p.id: p for p in all_matched_prospects}
-
-    # Second pass: create duplicate groups using cached data
-    for prospect in prospects_to_process:
-        if prospect.id in all_matches_by_prospect:
-            high_confidence_matches = all_matches_by_prospect[prospect.id]
-            duplicate_group = _create_duplicate_group(
-                prospect, high_confidence_matches, matched_prospects_cache
-            )
-            potential_duplicates.append(duplicate_group)
-
-    return potential_duplicates
-
-
 @api_route(main_bp, "/duplicates/detect", methods=["POST"])
 def detect_duplicates():
-    """Detect potential duplicate prospects in the database."""
+    """Start a background scan for potential duplicate prospects.
+
+    Returns a scan_id immediately; progress and results are polled from
+    /duplicates/progress/<scan_id>. With mode "clusters" the results are
+    non-overlapping duplicate clusters instead of per-prospect match lists.
+    """
     try:
-        import time
+        from app.services.duplicate_scan import SCAN_MODES, duplicate_scan_service
 
         # Parse request parameters
         data = request.get_json() or {}
         source_id = data.get("source_id")
         min_confidence = float(data.get("min_confidence", 0.7))
         limit = int(data.get("limit", 100))
+        mode = data.get("mode", "matches")
+        if mode not in SCAN_MODES:
+            return error_response(400, f"mode must be one of: {', '.join(SCAN_MODES)}")
 
-        # Setup progress tracking
-        scan_id = _setup_progress_tracking()
-
-        # Get prospects to process
-        prospects_to_process = _get_prospects_to_process(source_id, limit)
-
-        # Process prospects for duplicates
-        potential_duplicates = _process_prospects_for_duplicates(
-            prospects_to_process, scan_id, min_confidence
-        )
-
-        # Mark scan as completed and store results
-        processing_time = (
-            time.time() - detect_duplicates.progress_store[scan_id]["start_time"]
-        )
-        detect_duplicates.progress_store[scan_id].update(
-            {
-                "status": "completed",
-                "current": len(prospects_to_process),
-                "message": f"Scan completed! Found {len(potential_duplicates)} duplicate groups.",
-                "end_time": time.time(),
-                "results": {
-                    "potential_duplicates": potential_duplicates,
-                    "total_found": len(potential_duplicates),
-                    "scan_parameters": {
-                        "source_id": source_id,
-                        "min_confidence": min_confidence,
-                        "limit": limit,
-                    },
-                    "processing_time": processing_time,
-                },
-            }
-        )
-
-        logger.info(
-            f"Scan {scan_id} completed in {processing_time:.2f}s. Found {len(potential_duplicates)} duplicate groups."
+        scan_id = duplicate_scan_service.start_scan(
+            source_id, min_confidence, limit, mode
         )
 
-        # Return the scan results
         return success_response(
             data={
-                "potential_duplicates": potential_duplicates,
-                "total_found": len(potential_duplicates),
+                "scan_id": scan_id,
+                "status": "queued",
                 "scan_parameters": {
                     "source_id": source_id,
                     "min_confidence": min_confidence,
                     "limit": limit,
+                    "mode": mode,
                 },
-                "scan_id": scan_id,
-                "processing_time": processing_time,
-            }
+            },
+            status_code=202,
         )
 
     except Exception as e:
-        # Mark scan as failed in progress store
-        if "scan_id" in locals():
-            detect_duplicates.progress_store[scan_id].update(
-                {
-                    "status": "error",
-                    "message": f"Scan failed: {str(e)}",
-                    "end_time": time.time(),
-                }
-            )
-
-        logger.error(f"Error detecting duplicates: {str(e)}", exc_info=True)
+        logger.error(f"Error starting duplicate scan: {str(e)}", exc_info=True)
         return error_response(500, f"Failed to detect duplicates: {str(e)}")
 
 
+@api_route(main_bp, "/duplicates/scans/<scan_id>/resume", methods=["POST"])
+def resume_duplicate_scan(scan_id):
+    """Resume an interrupted or failed duplicate scan from its last checkpoint."""
+    try:
+        from app.services.duplicate_scan import duplicate_scan_service
+
+        if not duplicate_scan_service.resume_scan(scan_id):
+            return error_response(404, "No resumable scan found")
+
+        return success_response(
+            data={"scan_id": scan_id, "status": "queued"}, status_code=202
+        )
+
+    except Exception as e:
+        logger.error(f"Error resuming duplicate scan: {str(e)}", exc_info=True)
+        return error_response(500, f"Failed to resume scan: {str(e)}")
+
+
 @api_route(main_bp, "/duplicates/progress/<scan_id>", methods=["GET"])
 def get_duplicate_scan_progress(scan_id):
     """Get progress of a duplicate detection scan."""
     try:
         import time
 
-        if not hasattr(detect_duplicates, "progress_store"):
-            return error_response(404, "No active scans found")
+        from app.services.duplicate_scan import duplicate_scan_service
 
-        progress = detect_duplicates.progress_store.get(scan_id)
+        progress = duplicate_scan_service.get_progress(scan_id)
         if not progress:
             return error_response(404, "Scan not found")
 
@@ -751,7 +503,9 @@ def get_duplicate_scan_progress(scan_id):
             percentage = min(100, (progress["current"] / progress["total"]) * 100)
 
         # Calculate elapsed time
-        elapsed_time = time.time() - progress["start_time"]
+        elapsed_time = (progress.get("end_time") or time.time()) - progress[
+            "start_time"
+        ]
 
         # Estimate remaining time
         eta = None
@@ -760,18 +514,21 @@ def get_duplicate_scan_progress(scan_id):
             remaining_items = progress["total"] - progress["current"]
             eta = remaining_items / rate if rate > 0 else None
 
-        return success_response(
-            data={
-                "scan_id": scan_id,
-                "status": progress["status"],
-                "current": progress["current"],
-                "total": progress["total"],
-                "percentage": round(percentage, 1),
-                "message": progress["message"],
-                "elapsed_time": round(elapsed_time, 1),
-                "eta": round(eta, 1) if eta else None,
-            }
-        )
+        data = {
+            "scan_id": scan_id,
+            "status": progress["status"],
+            "current": progress["current"],
+            "total": progress["total"],
+            "percentage": round(percentage, 1),
+            "message": progress["message"],
+            "elapsed_time": round(elapsed_time, 1),
+            "eta": round(eta, 1) if eta else None,
+        }
+        if progress.get("results"):
+            data["results"] = progress["results"]
+            data["duplicates_found"] = progress["results"]["total_found"]
+
+        return success_response(data=data)
 
     except Exception as e:
         logger.error(f"Error getting scan progress: {str(e)}", exc_info=True)
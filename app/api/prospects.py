@@ -1,28 +1,43 @@
 from flask import request
 from sqlalchemy import (
-    String,
     asc,
-    cast,
     desc,
-    or_,
 )
 
 from app.api.factory import (
     api_route,
     create_blueprint,
+    cursor_paginated_response,
     error_response,
     paginated_response,
     success_response,
 )
 from app.database import db
-from app.database.crud import paginate_sqlalchemy_query
+from app.database.count_cache import filter_cache_key
+from app.database.crud import (
+    paginate_keyset,
+    paginate_sqlalchemy_query,
+    prospects_version,
+)
 from app.database.models import Prospect
+from app.database.naics_index import naics_filter_condition
+from app.database.prospect_fields import (
+    parse_fields,
+    project_prospects,
+    serialize_prospect_row,
+)
+from app.database.search import (
+    KEYWORD_COLUMNS,
+    SEARCH_COLUMNS,
+    apply_text_search,
+    search_backend,
+)
 from app.exceptions import NotFoundError, ValidationError
 
 prospects_bp, logger = create_blueprint("prospects_api", "/api/prospects")
 
 
-@api_route(prospects_bp, "", methods=["GET"])
+@api_route(prospects_bp, "", methods=["GET"], etag=prospects_version)
 def get_prospects_route():
     # Only log errors and warnings, not successful requests to reduce noise
     try:
@@ -60,41 +75,42 @@ def get_prospects_route():
         # Construct the base query
         base_query = Prospect.query
 
-        # Apply search filter if provided
+        # Text filters use the full-text index when the database has one
+        backend = search_backend(db.session) if search_term or keywords_filter else None
+
+        # Apply search (all indexed text) and keywords (titles and description)
+        search_criteria = []
         if search_term:
-            search_filter = (
-                (Prospect.title.ilike(f"%{search_term}%"))
-                | (Prospect.description.ilike(f"%{search_term}%"))
-                | (Prospect.agency.ilike(f"%{search_term}%"))
+            search_criteria.append((search_term, SEARCH_COLUMNS))
+        if keywords_filter:
+            search_criteria.append((keywords_filter, KEYWORD_COLUMNS))
+        relevance = None
+        if search_criteria:
+            base_query, relevance = apply_text_search(
+                base_query, Prospect, backend, search_criteria
             )
-            base_query = base_query.filter(search_filter)
 
-        # Apply NAICS filter - check both primary and all alternate codes
-        if naics_filter:
-            # Check primary NAICS code OR any alternate codes in extra JSON
-            # Use cast to convert JSON to string for searching
-            naics_condition = or_(
-                Prospect.naics.ilike(f"%{naics_filter}%"),
-                cast(Prospect.extra, String).ilike(
-                    f"%{naics_filter}%"
-                ),  # Search entire extra JSON
-            )
-            base_query = base_query.filter(naics_condition)
+        # Filters applied to base_query, they key its cached total count
+        applied_filters = {
+            "search": search_term,
+            "keywords": keywords_filter,
+            "naics": naics_filter,
+            "backend": backend,
+        }
 
-        # Apply keywords filter (search in title and description)
-        if keywords_filter:
-            keywords_search_filter = (Prospect.title.ilike(f"%{keywords_filter}%")) | (
-                Prospect.description.ilike(f"%{keywords_filter}%")
-            )
-            base_query = base_query.filter(keywords_search_filter)
+        # Apply NAICS filter - primary, extra field and LLM codes by code prefix
+        if naics_filter:
+            base_query = base_query.filter(naics_filter_condition(naics_filter))
 
         # Apply AI enrichment filter
         if ai_enrichment_filter == "enhanced":
             # Show only prospects that have been processed by AI (have LLM timestamp)
             base_query = base_query.filter(Prospect.ollama_processed_at.isnot(None))
+            applied_filters["ai_enrichment"] = ai_enrichment_filter
         elif ai_enrichment_filter == "original":
             # Show only prospects that have NOT been processed by AI
             base_query = base_query.filter(Prospect.ollama_processed_at.is_(None))
+            applied_filters["ai_enrichment"] = ai_enrichment_filter
         # 'all' or any other value means no filter applied
 
         # Apply source IDs filter
@@ -106,26 +122,75 @@ def get_prospects_route():
                 ]
                 if source_ids:
                     base_query = base_query.filter(Prospect.source_id.in_(source_ids))
+                    applied_filters["source_ids"] = source_ids
             except ValueError:
                 # Log warning for invalid source ID format but continue without filter
                 logger.warning(
                     f"Invalid source_ids format: '{source_ids_filter}'. Expected comma-separated integers."
                 )
 
-        # Apply sorting
-        sort_column = getattr(
-            Prospect, sort_by, Prospect.id
-        )  # Default to Prospect.id if sort_by is invalid
+        count_key = filter_cache_key("prospects", applied_filters)
+
+        # Select only the requested fields, with source names joined in
+        fields = parse_fields(request.args.get("fields", type=str))
+        description_length = request.args.get("description_length", type=int)
+        if description_length is not None and description_length < 0:
+            return error_response(400, "description_length must not be negative")
+        base_query = project_prospects(base_query, fields, description_length)
+
+        # Apply sorting, "relevance" ranks full-text search matches
+        if sort_by == "relevance" and relevance is not None:
+            sort_column = relevance
+        else:
+            sort_column = getattr(
+                Prospect, sort_by, Prospect.id
+            )  # Default to Prospect.id if sort_by is invalid
+
+        # Opt-in keyset pagination: pass cursor= (empty for the first page)
+        # and the next_cursor of each response for the following page
+        cursor = request.args.get("cursor", type=str)
+        if cursor is not None:
+            if sort_column is not relevance and sort_by not in Prospect.__table__.c:
+                sort_by, sort_column = "id", Prospect.id
+            results = paginate_keyset(
+                base_query,
+                sort_column,
+                Prospect.id,
+                sort_by,
+                sort_order.lower(),
+                per_page=limit,
+                cursor=cursor or None,
+                include_total=request.args.get(
+                    "include_total", "false", type=str
+                ).lower()
+                == "true",
+                count_key=count_key,
+            )
+            prospect_items_dict = [
+                serialize_prospect_row(row, fields) for row in results["items"]
+            ]
+            return cursor_paginated_response(
+                items=prospect_items_dict,
+                per_page=results["per_page"],
+                next_cursor=results["next_cursor"],
+                total_items=results["total_items"],
+                prospects=prospect_items_dict,
+            )
+
         if sort_order.lower() == "desc":
             base_query = base_query.order_by(desc(sort_column))
         else:
             base_query = base_query.order_by(asc(sort_column))
 
         # Call the pagination function
-        results = paginate_sqlalchemy_query(query=base_query, page=page, per_page=limit)
+        results = paginate_sqlalchemy_query(
+            query=base_query, page=page, per_page=limit, count_key=count_key
+        )
 
-        # Convert prospect items to dictionaries
-        prospect_items_dict = [prospect.to_dict() for prospect in results["items"]]
+        # Convert prospect rows to dictionaries
+        prospect_items_dict = [
+            serialize_prospect_row(row, fields) for row in results["items"]
+        ]
 
         # Use paginated_response helper
         return paginated_response(
@@ -146,7 +211,12 @@ def get_prospects_route():
         )
 
 
-@api_route(prospects_bp, "/<string:prospect_id>", methods=["GET"])
+@api_route(
+    prospects_bp,
+    "/<string:prospect_id>",
+    methods=["GET"],
+    etag=lambda prospect_id: prospects_version(),
+)
 def get_prospect_by_id_route(prospect_id: str):
     # Only log errors and warnings for individual prospect requests
     # session = db.session # Not strictly necessary if using .get() on the Model itself with Flask-SQLAlchemy
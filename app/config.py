@@ -43,6 +43,17 @@ class Config:
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", 5001))
+    WAITRESS_THREADS: int = int(
+        os.getenv("WAITRESS_THREADS", "16")
+    )  # Request threads of the production server, see EVENT_STREAM_MAX_CONNECTIONS
+
+    # Server-sent events stream, each open stream holds a server thread
+    EVENT_STREAM_MAX_SECONDS: float = float(
+        os.getenv("EVENT_STREAM_MAX_SECONDS", "45")
+    )  # Streams end after this, EventSource reconnects with Last-Event-ID
+    EVENT_STREAM_MAX_CONNECTIONS: int = int(
+        os.getenv("EVENT_STREAM_MAX_CONNECTIONS", "8")
+    )  # Streams open at once, further clients get a 503 and poll instead
 
     # Session configuration for authentication
     SESSION_COOKIE_SECURE: bool = (
@@ -166,6 +177,87 @@ class Config:
     DUPLICATE_FUZZY_CONTENT_THRESHOLD: float = float(
         os.getenv("DUPLICATE_FUZZY_CONTENT_THRESHOLD", "0.90")
     )  # Very high threshold for content-only matching
+    DUPLICATE_SIMILARITY_BACKEND: str = os.getenv(
+        "DUPLICATE_SIMILARITY_BACKEND", "difflib"
+    )  # 'difflib' (exact) or 'trigram' (approximate prefilter)
+    DUPLICATE_TRIGRAM_MIN_JACCARD: float = float(
+        os.getenv("DUPLICATE_TRIGRAM_MIN_JACCARD", "0.20")
+    )  # Trigram overlap below which the trigram backend skips a pair
+    DUPLICATE_SIMILARITY_CACHE_SIZE: int = int(
+        os.getenv("DUPLICATE_SIMILARITY_CACHE_SIZE", "10000")
+    )  # Text pairs kept in the similarity cache
+
+    # Background duplicate scans
+    DUPLICATE_SCAN_MAX_CONCURRENT: int = int(
+        os.getenv("DUPLICATE_SCAN_MAX_CONCURRENT", "2")
+    )  # Scans running at once, further scans wait in the pool
+    DUPLICATE_SCAN_PROCESSES: int = int(
+        os.getenv("DUPLICATE_SCAN_PROCESSES", str(min(4, os.cpu_count() or 1)))
+    )  # Processes used to scan sources in parallel
+    DUPLICATE_SCAN_PARALLEL_MIN_PROSPECTS: int = int(
+        os.getenv("DUPLICATE_SCAN_PARALLEL_MIN_PROSPECTS", "5000")
+    )  # Smaller scans run in the scan thread
+    DUPLICATE_SCAN_TTL_HOURS: int = int(os.getenv("DUPLICATE_SCAN_TTL_HOURS", "24"))
+
+    # Cached prospect counts, dropped whenever prospects are written
+    COUNT_CACHE_TTL_SECONDS: int = int(
+        os.getenv("COUNT_CACHE_TTL_SECONDS", "300")
+    )  # Bounds staleness from writes made by other processes, 0 disables
+    COUNT_CACHE_MAX_ENTRIES: int = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "512"))
+
+    # Stored dashboard aggregates, recomputed live once older than this
+    DASHBOARD_SUMMARY_MAX_AGE_SECONDS: int = int(
+        os.getenv("DASHBOARD_SUMMARY_MAX_AGE_SECONDS", "900")
+    )  # 0 always computes the dashboard live
+
+    # LLM service
+    OLLAMA_HEARTBEAT_SECONDS: float = float(
+        os.getenv("OLLAMA_HEARTBEAT_SECONDS", "15")
+    )  # Interval of the background Ollama availability check
+    LLM_CONCURRENT_FIELDS: bool = (
+        os.getenv("LLM_CONCURRENT_FIELDS", "true").lower() == "true"
+    )  # Send a prospect's title, value, NAICS and set-aside prompts at once
+    LLM_FIELD_WORKERS: int = int(
+        os.getenv("LLM_FIELD_WORKERS", "4")
+    )  # Prompts of one prospect in flight at once
+    LLM_ENHANCEMENT_WORKERS: int = int(
+        os.getenv("LLM_ENHANCEMENT_WORKERS", "4")
+    )  # Prospects enhanced at once by bulk runs, match OLLAMA_NUM_PARALLEL
+    LLM_COMMIT_BATCH_SIZE: int = int(
+        os.getenv("LLM_COMMIT_BATCH_SIZE", "10")
+    )  # Enhanced prospects per commit of a bulk worker
+    LLM_BACKOFF_BASE_SECONDS: float = float(
+        os.getenv("LLM_BACKOFF_BASE_SECONDS", "1")
+    )  # Pause of bulk workers after a failure, doubled per further failure
+    LLM_BACKOFF_MAX_SECONDS: float = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "30"))
+
+    # Persistent cache of LLM responses, keyed by model, prompt and options
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_PATH: str = os.getenv(
+        "LLM_CACHE_PATH", os.path.join(DATA_DIR, "llm_cache.db")
+    )
+    LLM_CACHE_TTL_DAYS: float = float(os.getenv("LLM_CACHE_TTL_DAYS", "30"))
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "100000"))
+
+    # Ollama HTTP client, shared by every generate call
+    OLLAMA_POOL_SIZE: int = int(
+        os.getenv("OLLAMA_POOL_SIZE", "4")
+    )  # Kept-alive connections to Ollama
+    OLLAMA_CONNECT_TIMEOUT_SECONDS: float = float(
+        os.getenv("OLLAMA_CONNECT_TIMEOUT_SECONDS", "5")
+    )
+    OLLAMA_TIMEOUT_SECONDS: float = float(
+        os.getenv("OLLAMA_TIMEOUT_SECONDS", "240")
+    )  # Per call read timeout, inference can be slow
+    OLLAMA_MAX_RETRIES: int = int(
+        os.getenv("OLLAMA_MAX_RETRIES", "2")
+    )  # Retries of timed out and 5xx calls
+    OLLAMA_RETRY_BACKOFF_SECONDS: float = float(
+        os.getenv("OLLAMA_RETRY_BACKOFF_SECONDS", "1")
+    )  # Doubled per retry, with jitter
+    OLLAMA_KEEP_ALIVE: str | None = os.getenv(
+        "OLLAMA_KEEP_ALIVE"
+    )  # How long Ollama keeps the model loaded (e.g. "10m"), server default if unset
 
     # Backup configuration
     BACKUP_RETENTION_DAYS: int = int(os.getenv("BACKUP_RETENTION_DAYS", "7"))
@@ -222,6 +314,7 @@ class TestingConfig(Config):
     # Use in-memory SQLite for testing
     SQLALCHEMY_DATABASE_URI: str = "sqlite:///:memory:"
     USER_DATABASE_URI: str = "sqlite:///:memory:"
+    LLM_CACHE_ENABLED: bool = False
 
 
 # Configuration dictionary
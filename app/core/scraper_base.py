@@ -56,6 +56,7 @@ from datetime import datetime
 from typing import Any
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 
 # Playwright imports
@@ -72,13 +73,173 @@ from playwright.async_api import (
 
 from app.config import active_config
 from app.database import db
-from app.database.crud import bulk_upsert_prospects
+from app.database.crud import bulk_upsert_prospects, dataframe_to_records
+from app.database.dashboard_summary import refresh_dashboard_summary
 from app.database.models import DataSource
-from app.services.llm_service import LLMService
 from app.utils.file_processing import create_processing_log, update_processing_log
 
 # Application imports
 from app.utils.logger import get_logger
+from app.utils.naics_lookup import normalize_naics_series
+from app.utils.value_and_date_parsing import (
+    map_unique,
+    parse_fiscal_quarter_series,
+    parse_value_range_series,
+)
+
+
+def _md5_hexdigests(keys: pd.Series) -> pd.Series:
+    """Hash a Series of strings to MD5 hex digests in one batched pass."""
+    md5 = hashlib.md5
+    return pd.Series(
+        [md5(key.encode()).hexdigest() for key in keys],
+        index=keys.index,
+        dtype=object,
+    )
+
+
+def _row_wise_columns(df: pd.DataFrame, columns: list[str]) -> dict[str, pd.Series]:
+    """Return object Series holding each column's values as ``df.apply(axis=1)`` sees them.
+
+    Frames with any object column expose each cell as its object value, while
+    homogeneous non-object frames are upcast to the frame's common dtype.
+    """
+    if any((df.columns == column).sum() > 1 for column in columns):
+        raise ValueError(f"Duplicate column names in {columns}")
+
+    if (df.dtypes == object).any():
+        return {column: df[column].astype(object) for column in columns}
+
+    frame_values = df.to_numpy()
+    return {
+        column: pd.Series(
+            frame_values[:, df.columns.get_loc(column)], index=df.index, dtype=object
+        )
+        for column in columns
+    }
+
+
+def _parse_existing_extras(existing: pd.Series) -> list[Any]:
+    """Parse an extras_json column (dicts or JSON strings) into per-row values.
+
+    Each distinct JSON string is decoded once; rows get their own shallow copy.
+    Anything that is neither a string nor a dict becomes an empty dict.
+    """
+    parsed_strings: dict[str, Any] = {}
+    parsed = []
+    for value in existing:
+        if isinstance(value, str):
+            if value not in parsed_strings:
+                try:
+                    parsed_strings[value] = (
+                        json.loads(value) if value and value != "{}" else {}
+                    )
+                except (json.JSONDecodeError, TypeError):
+                    parsed_strings[value] = {}
+            value = parsed_strings[value]
+            parsed.append(dict(value) if isinstance(value, dict) else value)
+        elif isinstance(value, dict):
+            parsed.append(value)
+        else:
+            parsed.append({})
+    return parsed
+
+
+def _extras_value(value: Any) -> Any:
+    """Keep JSON-native scalars as-is and stringify everything else."""
+    if isinstance(value, (int, float, str, bool)):
+        return value
+    return str(value)
+
+
+# "FY24 Q2" / "FY 2025 Q2" and detailed quarters like "3rd (April 1 - June 30)"
+_FY_QUARTER_RE = re.compile(r"FY\s*(\d{2,4})\s*Q(\d)")
+_QUARTER_ORDINAL_RE = re.compile(r"(\d+)(?:st|nd|rd|th)\s*\(")
+# Money amounts like "$1.5M", "500K", "$1,000,000"
+_MONEY_RE = re.compile(r"\$?([0-9,]+\.?[0-9]*)\s*([KMB]?)", re.IGNORECASE)
+_MONEY_MULTIPLIERS = {"K": 1000, "M": 1000000, "B": 1000000000}
+
+
+def _fiscal_quarter_start(fiscal_year: int, quarter: int):
+    """Return the first day of a fiscal quarter (Q1 starts the previous October)."""
+    if quarter == 1:
+        return datetime(fiscal_year - 1, 10, 1).date()
+    if quarter == 2:
+        return datetime(fiscal_year, 1, 1).date()
+    if quarter == 3:
+        return datetime(fiscal_year, 4, 1).date()
+    return datetime(fiscal_year, 7, 1).date()
+
+
+def _parse_fiscal_quarter_label(value: Any) -> tuple[Any, Any]:
+    """Parse a fiscal quarter label into (date, fiscal_year), or (None, None)."""
+    if pd.isna(value):
+        return None, None
+
+    value_str = str(value)
+
+    # Try standard FY Q pattern first
+    match = _FY_QUARTER_RE.search(value_str)
+    if match:
+        year_str = match.group(1)
+        quarter = int(match.group(2))
+
+        # Convert 2-digit year to 4-digit (assume 20XX)
+        if len(year_str) == 2:
+            fiscal_year = 2000 + int(year_str)
+        else:
+            fiscal_year = int(year_str)
+
+        return _fiscal_quarter_start(fiscal_year, quarter), fiscal_year
+
+    # Try detailed quarter pattern like "3rd (April 1 - June 30)"
+    quarter_match = _QUARTER_ORDINAL_RE.search(value_str)
+    if quarter_match:
+        quarter = int(quarter_match.group(1))
+        if quarter not in (1, 2, 3, 4):
+            return None, None
+        # Assume current fiscal year (can be improved later with context)
+        fiscal_year = datetime.now().year
+        return _fiscal_quarter_start(fiscal_year, quarter), fiscal_year
+
+    return None, None
+
+
+def _parse_money_text(text: Any) -> tuple[Any, Any]:
+    """Extract (value, unit) from money text like "$1.5M", or (None, None)."""
+    if pd.isna(text):
+        return None, None
+
+    match = _MONEY_RE.search(str(text).strip())
+    if match:
+        value_str = match.group(1).replace(",", "")
+        unit = match.group(2).upper() if match.group(2) else ""
+
+        try:
+            value = float(value_str)
+        except ValueError:
+            return None, None
+
+        # Convert K, M, B to actual values
+        if unit in _MONEY_MULTIPLIERS:
+            value *= _MONEY_MULTIPLIERS[unit]
+        return value, unit
+
+    return None, None
+
+
+def _split_location(location: Any) -> tuple[Any, Any, Any]:
+    """Split "City, State, Country" into its parts (missing parts are None)."""
+    if pd.isna(location):
+        return None, None, None
+
+    parts = [part.strip() for part in str(location).split(",")]
+
+    city = parts[0] if len(parts) > 0 else None
+    state = parts[1] if len(parts) > 1 else None
+    country = parts[2] if len(parts) > 2 else None
+
+    return city, state, country
 
 
 @dataclass
@@ -2045,68 +2206,8 @@ class ConsolidatedScraperBase:
             return df
 
         try:
-            # Extract fiscal year and quarter from strings like "FY24 Q2", "FY 2025 Q2", or "3rd (April 1 - June 30)"
-            fiscal_pattern = r"FY\s*(\d{2,4})\s*Q(\d)"
-            quarter_detailed_pattern = r"(\d+)(?:st|nd|rd|th)\s*\("
-
-            def parse_fiscal_quarter(value):
-                if pd.isna(value):
-                    return None, None
-
-                value_str = str(value)
-
-                # Try standard FY Q pattern first
-                match = re.search(fiscal_pattern, value_str)
-                if match:
-                    year_str = match.group(1)
-                    quarter = int(match.group(2))
-
-                    # Convert 2-digit year to 4-digit (assume 20XX)
-                    if len(year_str) == 2:
-                        fiscal_year = 2000 + int(year_str)
-                    else:
-                        fiscal_year = int(year_str)
-
-                    # Fiscal year typically starts in October
-                    # Q1: Oct-Dec, Q2: Jan-Mar, Q3: Apr-Jun, Q4: Jul-Sep
-                    if quarter == 1:
-                        date = datetime(fiscal_year - 1, 10, 1).date()
-                    elif quarter == 2:
-                        date = datetime(fiscal_year, 1, 1).date()
-                    elif quarter == 3:
-                        date = datetime(fiscal_year, 4, 1).date()
-                    else:  # quarter == 4
-                        date = datetime(fiscal_year, 7, 1).date()
-
-                    return date, fiscal_year
-
-                # Try detailed quarter pattern like "3rd (April 1 - June 30)"
-                quarter_match = re.search(quarter_detailed_pattern, value_str)
-                if quarter_match:
-                    quarter = int(quarter_match.group(1))
-                    # Assume current fiscal year (can be improved later with context)
-                    current_year = datetime.now().year
-                    fiscal_year = (
-                        current_year if datetime.now().month >= 10 else current_year
-                    )
-
-                    if quarter == 1:
-                        date = datetime(fiscal_year - 1, 10, 1).date()
-                    elif quarter == 2:
-                        date = datetime(fiscal_year, 1, 1).date()
-                    elif quarter == 3:
-                        date = datetime(fiscal_year, 4, 1).date()
-                    elif quarter == 4:
-                        date = datetime(fiscal_year, 7, 1).date()
-                    else:
-                        return None, None
-
-                    return date, fiscal_year
-
-                return None, None
-
-            # Apply parsing
-            parsed_data = df[source_col].apply(parse_fiscal_quarter)
+            # Parse each distinct label once ("FY24 Q2", "FY 2025 Q2", "3rd (April 1 - June 30)")
+            parsed_data = map_unique(df[source_col], _parse_fiscal_quarter_label)
 
             if target_date_col:
                 df[target_date_col] = [item[0] for item in parsed_data]
@@ -2136,39 +2237,8 @@ class ConsolidatedScraperBase:
                 if not source_col or source_col not in df.columns:
                     continue
 
-                # Extract numeric values and units from text
-                def parse_value(text):
-                    if pd.isna(text):
-                        return None, None
-
-                    text = str(text).strip()
-
-                    # Look for patterns like "$1.5M", "500K", "$1,000,000"
-                    money_pattern = r"\$?([0-9,]+\.?[0-9]*)\s*([KMB]?)"
-                    match = re.search(money_pattern, text, re.IGNORECASE)
-
-                    if match:
-                        value_str = match.group(1).replace(",", "")
-                        unit = match.group(2).upper() if match.group(2) else ""
-
-                        try:
-                            value = float(value_str)
-
-                            # Convert K, M, B to actual values
-                            if unit == "K":
-                                value *= 1000
-                            elif unit == "M":
-                                value *= 1000000
-                            elif unit == "B":
-                                value *= 1000000000
-
-                            return value, unit
-                        except ValueError:
-                            pass
-
-                    return None, None
-
-                parsed_data = df[source_col].apply(parse_value)
+                # Extract numeric values and units from text, once per distinct value
+                parsed_data = map_unique(df[source_col], _parse_money_text)
 
                 if target_value_col:
                     df[target_value_col] = [item[0] for item in parsed_data]
@@ -2198,19 +2268,7 @@ class ConsolidatedScraperBase:
                 if not source_col or source_col not in df.columns:
                     continue
 
-                def parse_location(location):
-                    if pd.isna(location):
-                        return None, None, None
-
-                    parts = [part.strip() for part in str(location).split(",")]
-
-                    city = parts[0] if len(parts) > 0 else None
-                    state = parts[1] if len(parts) > 1 else None
-                    country = parts[2] if len(parts) > 2 else None
-
-                    return city, state, country
-
-                parsed_data = df[source_col].apply(parse_location)
+                parsed_data = map_unique(df[source_col], _split_location)
 
                 if target_city_col:
                     df[target_city_col] = [item[0] for item in parsed_data]
@@ -2283,31 +2341,35 @@ class ConsolidatedScraperBase:
             if not naics_columns_to_process:
                 return df
 
-            # Initialize LLM service for NAICS parsing (only when needed)
-            llm_service = LLMService()
-
             processed_count = 0
+            desc_col = "naics_description"
             for col in naics_columns_to_process:
-                # Process each NAICS column
-                for idx, naics_value in df[col].items():
-                    if pd.isna(naics_value) or not str(naics_value).strip():
-                        continue
-
-                    # Parse the NAICS value using the standardized parser
-                    parsed = llm_service.parse_existing_naics(str(naics_value).strip())
-
-                    if parsed["code"]:
-                        # Update the NAICS code column with just the code
-                        df.at[idx, col] = parsed["code"]
+                # Normalize each distinct value once with a single extraction regex
+                parsed = normalize_naics_series(df[col])
+                has_code = parsed["code"].notna()
+                if not has_code.any():
+                    continue
 
-                        # Set description in appropriate column if it exists and is empty
-                        desc_col = "naics_description"
-                        if desc_col in df.columns and parsed["description"]:
-                            current_desc = df.at[idx, desc_col]
-                            if pd.isna(current_desc) or not str(current_desc).strip():
-                                df.at[idx, desc_col] = parsed["description"]
+                # Keep just the code in the NAICS column
+                df[col] = df[col].astype(object).mask(has_code, parsed["code"])
+
+                # Fill descriptions only where the description column is empty
+                if desc_col in df.columns:
+                    current_desc = df[desc_col]
+                    fill_desc = (
+                        has_code
+                        & parsed["description"].notna()
+                        & (
+                            current_desc.isna()
+                            | (current_desc.astype(str).str.strip() == "")
+                        )
+                    )
+                    if fill_desc.any():
+                        df[desc_col] = current_desc.astype(object).mask(
+                            fill_desc, parsed["description"]
+                        )
 
-                        processed_count += 1
+                processed_count += int(has_code.sum())
 
             if processed_count > 0:
                 self.logger.info(
@@ -2332,21 +2394,10 @@ class ConsolidatedScraperBase:
                 df["id"] = df.index.astype(str)  # Fallback to row numbers
                 return df
 
-            # Create MD5 hash from concatenated field values
-            def create_hash(row):
-                values = []
-                for field in available_fields:
-                    value = row.get(field, "")
-                    if pd.notna(value):
-                        values.append(str(value))
-
-                combined = "|".join(values)
-                # Create MD5 hash with source prefix
-                combined_with_source = f"{self.source_name}|{combined}"
-                md5_hash = hashlib.md5(combined_with_source.encode()).hexdigest()
-                return md5_hash
-
-            df["id"] = df.apply(create_hash, axis=1)
+            # Build "source|v1|v2|..." column-wise (nulls are skipped, matching the
+            # original row-wise implementation) and hash all keys in one pass
+            combined = self._concat_hash_fields(df, available_fields)
+            df["id"] = _md5_hexdigests(combined)
             self.logger.debug(f"Generated ID hash using fields: {available_fields}")
 
         except Exception as e:
@@ -2355,6 +2406,62 @@ class ConsolidatedScraperBase:
 
         return df
 
+    def _concat_hash_fields(
+        self, df: pd.DataFrame, hash_fields: list[str]
+    ) -> pd.Series:
+        """Build the pre-hash key ("source|v1|v2|...") for every row column by column.
+
+        Values are stringified exactly as the old row-wise ``df.apply`` saw them.
+        """
+        columns = _row_wise_columns(df, hash_fields)
+
+        body = pd.Series("", index=df.index, dtype=object)
+        for hash_field in hash_fields:
+            values = columns[hash_field]
+            mask = values.notna()
+            piece = pd.Series("", index=df.index, dtype=object)
+            piece[mask] = "|" + values[mask].map(str)
+            body = body + piece
+
+        # Every non-empty body starts with a separator; drop it before prefixing
+        return f"{self.source_name}|" + body.str.slice(1)
+
+    def _build_extras_column(
+        self,
+        df: pd.DataFrame,
+        key_map: dict[str, str],
+        convert: Callable[[Any], Any],
+    ) -> pd.Series:
+        """Build extras_json dicts from ``key_map`` (column -> extras key) column by column.
+
+        Null and empty-string cells are masked out per column and the remaining
+        values (passed through ``convert``) are zipped into per-row dicts in one
+        pass. Any existing extras_json is merged underneath the new keys. Rows
+        that end up without extras get None.
+        """
+        columns = _row_wise_columns(df, list(key_map))
+        rows: list[dict[str, Any] | None] = [None] * len(df)
+
+        for column, extras_key in key_map.items():
+            values = columns[column]
+            mask = (values.notna() & (values != "")).to_numpy(dtype=bool)
+            if not mask.any():
+                continue
+            for position, value in zip(np.flatnonzero(mask), values.to_numpy()[mask]):
+                extras = rows[position]
+                if extras is None:
+                    extras = rows[position] = {}
+                extras[extras_key] = convert(value)
+
+        if "extras_json" in df.columns:
+            existing_rows = _parse_existing_extras(df["extras_json"])
+            rows = [
+                {**existing, **new} if new else (existing if existing else None)
+                for existing, new in zip(existing_rows, rows)
+            ]
+
+        return pd.Series(rows, index=df.index, dtype=object)
+
     def _apply_extras_mapping(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply configured extras field mapping to create extras_json column.
         This replaces per-scraper _create_extras methods with a generic implementation.
@@ -2367,54 +2474,14 @@ class ConsolidatedScraperBase:
                 f"Applying extras mapping with {len(self.config.extras_fields_map)} fields"
             )
 
-            # Vectorized approach for better performance
-            def create_extras_row(row):
-                extras = {}
-                for source_col, extras_key in self.config.extras_fields_map.items():
-                    if source_col in df.columns:
-                        value = row.get(source_col)
-                        # Only include non-null, non-empty values
-                        if pd.notna(value) and value != "":
-                            extras[extras_key] = str(value)
-                return extras if extras else None
-
-            # Apply the mapping to create extras_json
-            new_extras = df.apply(create_extras_row, axis=1)
-
-            # Merge with existing extras_json if present
+            key_map = {
+                source_col: extras_key
+                for source_col, extras_key in self.config.extras_fields_map.items()
+                if source_col in df.columns
+            }
             if "extras_json" in df.columns:
                 self.logger.debug("Merging with existing extras_json")
-
-                def merge_extras(row):
-                    existing = row.get("extras_json")
-                    new = (
-                        new_extras.loc[row.name]
-                        if row.name in new_extras.index
-                        else None
-                    )
-
-                    # Handle existing extras that might be a JSON string
-                    if isinstance(existing, str):
-                        try:
-                            existing = (
-                                json.loads(existing)
-                                if existing and existing != "{}"
-                                else {}
-                            )
-                        except (json.JSONDecodeError, TypeError):
-                            existing = {}
-                    elif not isinstance(existing, dict):
-                        existing = {}
-
-                    # Merge new with existing
-                    if new:
-                        merged = {**existing, **new}
-                        return merged if merged else None
-                    return existing if existing else None
-
-                df["extras_json"] = df.apply(merge_extras, axis=1)
-            else:
-                df["extras_json"] = new_extras
+            df["extras_json"] = self._build_extras_column(df, key_map, str)
 
             # Log statistics
             non_empty_extras = (
@@ -2464,8 +2531,6 @@ class ConsolidatedScraperBase:
         """Derive date from fiscal year and quarter columns.
         Used by DOC, DOJ, DOS scrapers.
         """
-        from app.utils.value_and_date_parsing import fiscal_quarter_to_date
-
         if year_col in df.columns and quarter_col in df.columns:
             # Format quarter column correctly for fiscal_quarter_to_date
             df["_fyq_temp"] = (
@@ -2476,21 +2541,17 @@ class ConsolidatedScraperBase:
                 .apply(lambda x: f'Q{x.split(".")[0]}' if pd.notna(x) and x else "")
             )
 
-            parsed_info = df["_fyq_temp"].apply(
-                lambda x: (
-                    fiscal_quarter_to_date(x.strip())
-                    if pd.notna(x) and x.strip()
-                    else (None, None)
-                )
+            # Blank labels are skipped rather than logged as unparseable
+            parsed_info = parse_fiscal_quarter_series(
+                df["_fyq_temp"].str.strip().replace("", None)
             )
 
-            df[out_date_col] = parsed_info.apply(
-                lambda x: x[0].date() if x[0] else None
+            df[out_date_col] = parsed_info["date"].map(
+                lambda x: x.date() if pd.notna(x) else None
             )
 
             if out_fy_col:
-                df[out_fy_col] = parsed_info.apply(lambda x: x[1])
-                df[out_fy_col] = df[out_fy_col].astype("Int64")
+                df[out_fy_col] = parsed_info["fiscal_year"].astype("Int64")
 
             df.drop("_fyq_temp", axis=1, inplace=True, errors="ignore")
             self.logger.debug(f"Derived '{out_date_col}' from fiscal year and quarter")
@@ -2567,17 +2628,13 @@ class ConsolidatedScraperBase:
         """Parse estimated value with priority (primary then secondary column).
         Used by DOS scraper.
         """
-        from app.utils.value_and_date_parsing import parse_value_range
-
         df[out_value_col] = pd.NA
         df[out_unit_col] = pd.NA
 
         if primary_col in df.columns and df[primary_col].notna().any():
-            parsed_vals = df[primary_col].apply(
-                lambda x: parse_value_range(x) if pd.notna(x) else (None, None)
-            )
-            df[out_value_col] = parsed_vals.apply(lambda x: x[0])
-            df[out_unit_col] = parsed_vals.apply(lambda x: x[1])
+            parsed_vals = parse_value_range_series(df[primary_col])
+            df[out_value_col] = parsed_vals["value"]
+            df[out_unit_col] = parsed_vals["unit"]
             self.logger.debug(f"Parsed values from primary column '{primary_col}'")
         elif secondary_col and secondary_col in df.columns:
             # Fallback to secondary column (assuming numeric)
@@ -2598,8 +2655,6 @@ class ConsolidatedScraperBase:
         """Derive award date with priority: direct date → quarter → fiscal year.
         Used by DOJ and DOS scrapers.
         """
-        from app.utils.value_and_date_parsing import fiscal_quarter_to_date
-
         df[out_date_col] = None
         df[out_fy_col] = pd.NA
 
@@ -2623,13 +2678,13 @@ class ConsolidatedScraperBase:
                 df[out_date_col].isna() & df[out_fy_col].isna() & df[qtr_col].notna()
             )
             if needs_qtr_mask.any():
-                parsed_qtr = df.loc[needs_qtr_mask, qtr_col].apply(
-                    lambda x: fiscal_quarter_to_date(x) if pd.notna(x) else (None, None)
+                parsed_qtr = parse_fiscal_quarter_series(
+                    df.loc[needs_qtr_mask, qtr_col]
                 )
-                df.loc[needs_qtr_mask, out_date_col] = parsed_qtr.apply(
-                    lambda x: x[0].date() if x[0] else None
+                df.loc[needs_qtr_mask, out_date_col] = parsed_qtr["date"].map(
+                    lambda x: x.date() if x else None
                 )
-                df.loc[needs_qtr_mask, out_fy_col] = parsed_qtr.apply(lambda x: x[1])
+                df.loc[needs_qtr_mask, out_fy_col] = parsed_qtr["fiscal_year"]
 
         # Ensure Int64 type for fiscal year
         df[out_fy_col] = df[out_fy_col].astype("Int64")
@@ -2679,55 +2734,18 @@ class ConsolidatedScraperBase:
                 f"Collecting {len(unmapped_columns)} unmapped columns into extras_json: {sorted(unmapped_columns)}"
             )
 
-            # Create extras_json column with unmapped data
-            def create_extras_json(row):
-                extras = {}
-                for col in unmapped_columns:
-                    value = row.get(col)
-                    # Only include non-null, non-empty values
-                    if pd.notna(value) and value != "" and value is not None:
-                        # Convert to string for JSON serialization
-                        if isinstance(value, (int, float, str, bool)):
-                            extras[col] = value
-                        else:
-                            extras[col] = str(value)
-
-                return extras if extras else None
-
-            # Apply the function to create the extras_json column, merging with existing if present
-            if "extras_json" in df.columns:
-                # If extras_json already exists (e.g., from custom transforms), merge the data
-                def merge_with_existing_extras(row):
-                    new_extras = create_extras_json(row)
-                    existing_extras = row.get("extras_json")
-
-                    # Handle existing extras_json that might be a JSON string
-                    if isinstance(existing_extras, str):
-                        try:
-                            existing_extras = (
-                                json.loads(existing_extras)
-                                if existing_extras and existing_extras != "{}"
-                                else {}
-                            )
-                        except (json.JSONDecodeError, TypeError):
-                            existing_extras = {}
-                    elif not isinstance(existing_extras, dict):
-                        existing_extras = {}
-
-                    # Merge new extras with existing ones
-                    if new_extras:
-                        merged = {**existing_extras, **new_extras}
-                        return merged if merged else None
-                    else:
-                        return existing_extras if existing_extras else None
-
-                df["extras_json"] = df.apply(merge_with_existing_extras, axis=1)
+            # Build extras column-wise, merging with existing extras_json if present
+            # (e.g., from custom transforms or the configured extras mapping)
+            merging = "extras_json" in df.columns
+            df["extras_json"] = self._build_extras_column(
+                df,
+                {col: col for col in df.columns if col in unmapped_columns},
+                _extras_value,
+            )
+            if merging:
                 self.logger.debug(
                     "Merged unmapped columns with existing extras_json data"
                 )
-            else:
-                # No existing extras_json, create new one
-                df["extras_json"] = df.apply(create_extras_json, axis=1)
 
             # Log statistics about extras collection
             non_empty_extras = (
@@ -2780,9 +2798,13 @@ class ConsolidatedScraperBase:
             # Validate required fields if specified
             if self.config.required_fields_for_load:
                 initial_count = len(df)
-                for field in self.config.required_fields_for_load:
-                    if field in df.columns:
-                        df = df.dropna(subset=[field])
+                required = [
+                    field
+                    for field in self.config.required_fields_for_load
+                    if field in df.columns
+                ]
+                if required:
+                    df = df.dropna(subset=required)
 
                 if len(df) < initial_count:
                     self.logger.info(
@@ -2813,37 +2835,16 @@ class ConsolidatedScraperBase:
                     f"Filtering out {len(filtered_columns)} non-model columns: {sorted(filtered_columns)}"
                 )
 
-            # Keep only valid columns
-            df = df[columns_to_keep]
-
-            # Rename extras_json to extra to match the model
-            if "extras_json" in df.columns:
-                df = df.rename(columns={"extras_json": "extra"})
-
-            # Convert DataFrame to records for bulk loading
-            records = df.to_dict("records")
-
-            # Clean up records to handle NaN and None values properly
-            cleaned_records = []
-            for record in records:
-                cleaned_record = {}
-                for key, value in record.items():
-                    # Convert NaT and NaN to None
-                    if pd.isna(value):
-                        cleaned_record[key] = None
-                    # Handle Int64 type (nullable integer)
-                    elif hasattr(value, "item"):
-                        cleaned_record[key] = value.item() if pd.notna(value) else None
-                    else:
-                        cleaned_record[key] = value
-                cleaned_records.append(cleaned_record)
-
-            # Convert to DataFrame for bulk upsert
-            df_for_upsert = pd.DataFrame(cleaned_records)
+            # Convert straight to plain-Python records (nulls and numpy scalars
+            # normalized once per column), renaming extras_json to the model's
+            # 'extra' attribute
+            records = dataframe_to_records(
+                df, columns=columns_to_keep, rename={"extras_json": "extra"}
+            )
 
             # Execute bulk upsert
             result = bulk_upsert_prospects(
-                df_for_upsert,
+                records,
                 preserve_ai_data=active_config.PRESERVE_AI_DATA_ON_REFRESH,
                 enable_smart_matching=active_config.ENABLE_SMART_DUPLICATE_MATCHING,
             )
@@ -2859,6 +2860,13 @@ class ConsolidatedScraperBase:
             db.session.commit()
 
             self.logger.info(f"Successfully loaded {loaded_count} records to database")
+
+            # Rebuild the dashboard summary now rather than on the next visit
+            try:
+                refresh_dashboard_summary()
+            except Exception as e:
+                self.logger.warning(f"Could not refresh dashboard summary: {e}")
+
             return loaded_count
 
         except Exception as e:
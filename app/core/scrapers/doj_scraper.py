@@ -7,7 +7,7 @@ import pandas as pd
 from app.config import active_config
 from app.core.scraper_base import ConsolidatedScraperBase
 from app.core.scraper_configs import get_scraper_config
-from app.utils.value_and_date_parsing import fiscal_quarter_to_date
+from app.utils.value_and_date_parsing import parse_fiscal_quarter_series
 
 
 class DOJForecastScraper(ConsolidatedScraperBase):
@@ -44,18 +44,14 @@ class DOJForecastScraper(ConsolidatedScraperBase):
                     self.logger.info(
                         f"Found {needs_fallback_mask.sum()} award dates needing fiscal quarter fallback parsing."
                     )
-                    parsed_qtr_info = df.loc[
-                        needs_fallback_mask, award_date_col_raw
-                    ].apply(
-                        lambda x: (
-                            fiscal_quarter_to_date(x) if pd.notna(x) else (None, None)
-                        )
-                    )
-                    df.loc[needs_fallback_mask, "award_date_final"] = (
-                        parsed_qtr_info.apply(lambda x: x[0])
+                    parsed_qtr_info = parse_fiscal_quarter_series(
+                        df.loc[needs_fallback_mask, award_date_col_raw]
                     )
+                    df.loc[needs_fallback_mask, "award_date_final"] = parsed_qtr_info[
+                        "date"
+                    ]
                     df.loc[needs_fallback_mask, "award_fiscal_year_final"] = (
-                        parsed_qtr_info.apply(lambda x: x[1])
+                        parsed_qtr_info["fiscal_year"]
                     )
 
                 # Final conversion to date object and Int64 for year
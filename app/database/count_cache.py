@@ -0,0 +1,100 @@
+"""Cached prospect counts and aggregates.
+
+List and statistics endpoints are polled far more often than prospects
+change, so their counts are kept in memory and keyed by a normalized form of
+their filters. Every cached value carries the ``prospects`` write generation
+it was computed in (see write_generation), so a committed write to prospects
+makes all older values stale at once.
+
+Writes that bypass the session events call mark_prospects_changed. Values
+also expire after COUNT_CACHE_TTL_SECONDS to bound staleness from writes by
+other processes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.config import active_config
+from app.database.models import Prospect
+from app.database.write_generation import (
+    bump_write_generation,
+    mark_written,
+    write_generation,
+)
+
+_PROSPECTS_TABLE = Prospect.__tablename__
+
+
+class ProspectCountCache:
+    """Generation-checked LRU of values computed from the prospects table."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[int, float, Any]] = OrderedDict()
+
+    @property
+    def generation(self) -> int:
+        return write_generation(_PROSPECTS_TABLE)[0]
+
+    def bump(self):
+        """Invalidate every cached value."""
+        bump_write_generation(_PROSPECTS_TABLE)
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value of key, computing it if missing or stale."""
+        ttl = active_config.COUNT_CACHE_TTL_SECONDS
+        now = time.monotonic()
+        generation = self.generation
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == generation and now - entry[1] < ttl:
+                self._entries.move_to_end(key)
+                return entry[2]
+
+        value = compute()
+
+        with self._lock:
+            # A write committed while computing, the value may already be stale
+            if generation == self.generation and ttl > 0:
+                self._entries[key] = (generation, now, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > active_config.COUNT_CACHE_MAX_ENTRIES:
+                    self._entries.popitem(last=False)
+        return value
+
+
+count_cache = ProspectCountCache()
+
+
+def filter_cache_key(name: str, filters: dict) -> tuple:
+    """Build a cache key from request filters, ignoring order and blanks.
+
+    Strings are stripped and lowercased, iterables become sorted tuples.
+    """
+    normalized = []
+    for field, value in filters.items():
+        if value is None or value == "" or value == []:
+            continue
+        if isinstance(value, str):
+            value = value.strip().lower()
+        elif isinstance(value, Iterable):
+            value = tuple(sorted(set(value)))
+        normalized.append((field, value))
+    return (name, tuple(sorted(normalized)))
+
+
+def cached_count(key: Hashable, query) -> int:
+    """Count the rows of query, reusing the count until prospects change."""
+    return count_cache.get_or_compute(key, lambda: query.order_by(None).count())
+
+
+def mark_prospects_changed(session: Session):
+    """Invalidate cached counts when the session's transaction commits."""
+    mark_written(session, _PROSPECTS_TABLE)
@@ -1,22 +1,48 @@
+import base64
+import json
 import math
+from collections.abc import Hashable
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
 
 import numpy as np
 import pandas as pd
+from sqlalchemy import (
+    Date,
+    DateTime,
+    String,
+    and_,
+    asc,
+    case,
+    desc,
+    func,
+    or_,
+    select,
+    tuple_,
+    type_coerce,
+)
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.database import db
-from app.database.models import Prospect  # Changed back to Prospect
+from app.database.count_cache import cached_count, count_cache
+from app.database.models import DataSource, Prospect  # Changed back to Prospect
+from app.database.write_generation import write_generation
 from app.exceptions import ValidationError
 from app.utils.logger import logger
 
 
-def paginate_sqlalchemy_query(query, page: int, per_page: int):
+def paginate_sqlalchemy_query(
+    query, page: int, per_page: int, count_key: Hashable | None = None
+):
     """Paginates a SQLAlchemy query.
 
     Args:
         query: The SQLAlchemy query object.
         page (int): The current page number (1-indexed).
         per_page (int): The number of items per page.
+        count_key: Cache key of the query's filters, reuses the total count
+            until prospects change (see count_cache.filter_cache_key).
 
     Returns:
         dict: A dictionary containing the paginated items and pagination details.
@@ -36,7 +62,10 @@ def paginate_sqlalchemy_query(query, page: int, per_page: int):
         raise ValidationError("Per_page cannot exceed 100.")
 
     try:
-        total_items = query.count()
+        if count_key is None:
+            total_items = query.count()
+        else:
+            total_items = cached_count(count_key, query)
     except SQLAlchemyError as e:
         logger.exception(f"Database error counting items for pagination: {e}")
         # Depending on desired behavior, could re-raise, or return an error state
@@ -75,66 +104,276 @@ def paginate_sqlalchemy_query(query, page: int, per_page: int):
     }
 
 
-def _preprocess_dataframe(df_in):
-    """Preprocess DataFrame: convert dates, handle nulls, remove loaded_at column."""
-    # Work on a copy to avoid SettingWithCopyWarning
-    df = df_in.copy()
-
-    # Convert Timestamp columns to Python date objects for SQLite compatibility
-    date_columns = ["release_date", "award_date"]
-    for col in date_columns:
-        if col in df.columns:
-            if pd.api.types.is_datetime64_any_dtype(df[col]):
-                df[col] = df[col].apply(lambda x: x.date() if pd.notna(x) else None)
-                logger.debug(f"Converted column '{col}' to Python date objects.")
-            else:
-                logger.debug(
-                    f"Column '{col}' is not datetime type ({df[col].dtype}). Attempting conversion."
+def prospects_version() -> tuple:
+    """Cheap token that changes whenever prospect responses may change.
+
+    Combines this process's write generations with the newest load,
+    processing and enhancement timestamps, which also move on writes made by
+    other processes. Each is an indexed max, so this costs a few lookups.
+    """
+    newest = db.session.query(
+        func.max(Prospect.loaded_at),
+        func.max(Prospect.ollama_processed_at),
+        func.max(Prospect.enhancement_started_at),
+    ).one()
+    return (
+        write_generation(Prospect.__tablename__, DataSource.__tablename__),
+        *newest,
+    )
+
+
+def encode_cursor(sort_by: str, sort_order: str, value, item_id) -> str:
+    """Encode the position after a row as an opaque pagination cursor."""
+    kind = None
+    if isinstance(value, datetime):
+        kind, value = "datetime", value.isoformat()
+    elif isinstance(value, date):
+        kind, value = "date", value.isoformat()
+    elif isinstance(value, Decimal):
+        kind, value = "decimal", str(value)
+    payload = json.dumps(
+        {"s": sort_by, "o": sort_order, "t": kind, "v": value, "id": item_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> tuple[Any, Any]:
+    """Decode a cursor from encode_cursor into its (sort value, id).
+
+    Raises:
+        ValidationError: If the cursor is malformed or was issued for a
+            different sort.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value, kind = payload["v"], payload["t"]
+        if kind == "datetime":
+            value = datetime.fromisoformat(value)
+        elif kind == "date":
+            value = date.fromisoformat(value)
+        elif kind == "decimal":
+            value = Decimal(value)
+        position = (value, payload["id"])
+    except (ValueError, TypeError, KeyError, ArithmeticError) as e:
+        raise ValidationError("Invalid pagination cursor.") from e
+
+    if (payload["s"], payload["o"]) != (sort_by, sort_order):
+        raise ValidationError("Pagination cursor does not match the requested sort.")
+    return position
+
+
+def paginate_keyset(
+    query,
+    sort_column,
+    id_column,
+    sort_by: str,
+    sort_order: str,
+    per_page: int,
+    cursor: str | None = None,
+    include_total: bool = False,
+    count_key: Hashable | None = None,
+):
+    """Paginates a SQLAlchemy query by seeking past the last row seen.
+
+    Rows are ordered by (sort_column, id_column) with NULL sort values last,
+    and each page starts with ``WHERE (sort_column, id) < (:value, :id)``
+    (``>`` when ascending) instead of an OFFSET, so deep pages cost the same
+    as the first one.
+
+    Args:
+        query: The unordered SQLAlchemy query object, of one entity or of
+            several labeled columns including id_column.
+        sort_column: Column or expression to sort on.
+        id_column: Unique column breaking ties between equal sort values.
+        sort_by: Name of the sort, recorded in the cursors.
+        sort_order: "asc" or "desc".
+        per_page (int): The number of items per page.
+        cursor: Cursor returned with the previous page, None for the first.
+        include_total: Also count the matching rows, which costs a scan.
+        count_key: Cache key of the query's filters for the total count.
+
+    Returns:
+        dict: The page items, the cursor of the next page (None on the last
+        page) and the total when requested.
+
+    Raises:
+        ValidationError: If per_page or the cursor are invalid.
+    """
+    if not isinstance(per_page, int) or per_page < 1:
+        raise ValidationError(
+            "Per_page must be a positive integer greater than or equal to 1."
+        )
+    if per_page > 100:
+        raise ValidationError("Per_page cannot exceed 100.")
+
+    descending = sort_order.lower() == "desc"
+    entity_rows = len(query.column_descriptions) == 1
+    total_items = None
+    if include_total:
+        if count_key is None:
+            total_items = query.order_by(None).count()
+        else:
+            total_items = cached_count(count_key, query)
+
+    single_key = sort_column is id_column
+    if isinstance(getattr(sort_column, "type", None), (Date, DateTime)):
+        # Seek timestamps by their stored text, which is also what SQLite
+        # orders by: server defaults store "...12:00:00" while a bound
+        # datetime would be "...12:00:00.000000" and compare unequal
+        sort_column = type_coerce(sort_column, String)
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_by, sort_order)
+        if single_key:
+            query = query.filter(
+                id_column < last_id if descending else id_column > last_id
+            )
+        elif value is None:
+            # Already in the trailing NULL sort values
+            query = query.filter(
+                sort_column.is_(None),
+                id_column < last_id if descending else id_column > last_id,
+            )
+        else:
+            position = tuple_(sort_column, id_column)
+            query = query.filter(
+                or_(
+                    position < tuple_(value, last_id)
+                    if descending
+                    else position > tuple_(value, last_id),
+                    sort_column.is_(None),
                 )
-                try:
-                    df[col] = pd.to_datetime(df[col], errors="coerce").dt.date
-                    logger.debug(
-                        f"Successfully converted column '{col}' to date objects."
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to convert column '{col}' to date: {e}")
-                    df[col] = None
-
-    # Handle NaN/null values
+            )
+
+    direction = desc if descending else asc
+    if single_key:
+        query = query.order_by(direction(id_column))
+    else:
+        query = query.order_by(
+            direction(sort_column).nulls_last(), direction(id_column)
+        )
+
     try:
-        with pd.option_context("future.no_silent_downcasting", True):
-            df = df.fillna(value=np.nan).replace([np.nan], [None])
-        df = df.infer_objects(copy=False)
-        logger.debug(
-            "DataFrame NaN/null values replaced with None using fillna/replace."
+        rows = (
+            query.add_columns(sort_column.label("_sort_value"))
+            .limit(per_page + 1)
+            .all()
         )
-    except ImportError:
-        logger.error(
-            "Numpy not found. Cannot perform robust NaN replacement. Falling back to df.where()."
+    except SQLAlchemyError as e:
+        logger.exception(f"Database error fetching keyset page: {e}")
+        raise
+
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+    next_cursor = None
+    if has_next:
+        last_row = rows[-1]
+        last_item = last_row[0] if entity_rows else last_row
+        next_cursor = encode_cursor(
+            sort_by,
+            sort_order,
+            last_row._sort_value,
+            getattr(last_item, id_column.key),
         )
-        df = df.where(pd.notna(df), None)
 
-    if "loaded_at" in df.columns:
-        df = df.drop(columns=["loaded_at"])
+    return {
+        # Column rows keep the extra _sort_value column
+        "items": [row[0] for row in rows] if entity_rows else rows,
+        "per_page": per_page,
+        "next_cursor": next_cursor,
+        "has_next": has_next,
+        "total_items": total_items,
+    }
+
+
+# Prospect columns stored as dates
+DATE_COLUMNS = ("release_date", "award_date")
+
+
+def _column_to_python(values: pd.Series, as_date: bool = False) -> np.ndarray:
+    """Convert one column to an object array of plain Python values.
+
+    Nulls (None/NaN/NaT/NA) become None and numpy scalars are unboxed. With
+    ``as_date`` the column is coerced to ``datetime.date`` values.
+    """
+    if as_date:
+        try:
+            if not pd.api.types.is_datetime64_any_dtype(values):
+                values = pd.to_datetime(values, errors="coerce")
+            values = values.dt.date
+        except Exception as e:
+            logger.error(f"Failed to convert column '{values.name}' to date: {e}")
+            return np.full(len(values), None, dtype=object)
+
+    converted = np.array(values, dtype=object)
+    nulls = values.isna().to_numpy()
+    if nulls.any():
+        converted[nulls] = None
+
+    # Mixed object columns can still hold numpy scalars (e.g. numpy.int64)
+    if values.dtype == object and pd.api.types.infer_dtype(
+        converted, skipna=True
+    ) not in ("string", "empty", "date"):
+        for position, value in enumerate(converted):
+            if isinstance(value, np.generic):
+                converted[position] = value.item()
+
+    return converted
+
+
+def dataframe_to_records(
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    rename: dict[str, str] | None = None,
+) -> list[dict[str, Any]]:
+    """Convert a prospect DataFrame to plain-Python record dicts in one pass.
+
+    Normalization happens once per column rather than once per value: nulls
+    become None, numpy scalars are unboxed and date columns become
+    ``datetime.date``. ``loaded_at`` is dropped so the model default applies.
+
+    Args:
+        df: Prospect data.
+        columns: Columns to include (defaults to all columns).
+        rename: Optional mapping of column names to record keys.
+
+    Returns:
+        List of record dicts ready for bulk upsert.
+    """
+    rename = rename or {}
+    wanted = set(df.columns if columns is None else columns)
+    wanted.discard("loaded_at")
+
+    keys = []
+    converted = []
+    for position, column in enumerate(df.columns):
+        if column not in wanted:
+            continue
+        key = rename.get(column, column)
+        keys.append(key)
+        converted.append(
+            _column_to_python(df.iloc[:, position], as_date=key in DATE_COLUMNS)
+        )
 
-    return df
+    return [dict(zip(keys, row)) for row in zip(*converted)]
 
 
 def bulk_upsert_prospects(
-    df_in: pd.DataFrame,
+    data: pd.DataFrame | list[dict[str, Any]],
     preserve_ai_data: bool = True,
     enable_smart_matching: bool = False,
 ):
     """Performs a bulk UPSERT (INSERT ON CONFLICT DO UPDATE) of prospect data
-    from a Pandas DataFrame into the prospects table.
+    into the prospects table.
 
     This is now a thin wrapper that delegates to the enhanced_bulk_upsert_prospects
     function which handles all the complex logic including batch processing,
     AI field preservation, and smart duplicate matching.
 
     Args:
-        df_in (pd.DataFrame): DataFrame containing prospect data matching the
-                           Prospect model schema.
+        data: Prospect records matching the Prospect model schema, either as
+            a DataFrame or as records already produced by dataframe_to_records.
         preserve_ai_data (bool): If True, preserves AI-enhanced fields for
                                existing records that have been LLM-processed.
         enable_smart_matching (bool): If True, uses advanced matching strategies
@@ -144,8 +383,14 @@ def bulk_upsert_prospects(
         dict: Statistics about the upsert operation including processed, matched,
               inserted, duplicates_prevented, and ai_preserved counts.
     """
-    if df_in.empty:
-        logger.info("DataFrame is empty, skipping database insertion.")
+    # Normalize values once, straight from the frame to plain-Python records
+    if isinstance(data, pd.DataFrame):
+        records = dataframe_to_records(data)
+    else:
+        records = data
+
+    if not records:
+        logger.info("No records to upsert, skipping database insertion.")
         return {
             "processed": 0,
             "matched": 0,
@@ -154,15 +399,12 @@ def bulk_upsert_prospects(
             "ai_preserved": 0,
         }
 
-    # Preprocess the DataFrame
-    df = _preprocess_dataframe(df_in)
-
     # Import here to avoid circular imports
     from app.utils.duplicate_prevention import enhanced_bulk_upsert_prospects
 
     # Delegate all work to the enhanced function
     stats = enhanced_bulk_upsert_prospects(
-        df,
+        records,
         session=db.session,
         source_id=None,  # Will be extracted from data
         preserve_ai_data=preserve_ai_data,
@@ -278,35 +520,83 @@ def update_prospect_llm_fields(prospect_id: str, llm_data: dict):
         return None
 
 
+def _count_where(*conditions):
+    return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+
+def _query_prospect_coverage() -> dict:
+    latest_model = (
+        select(Prospect.ollama_model_version)
+        .where(Prospect.ollama_processed_at.isnot(None))
+        .order_by(Prospect.ollama_processed_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    row = db.session.query(
+        func.count(Prospect.id).label("total_prospects"),
+        func.count(Prospect.naics).label("with_naics"),
+        _count_where(Prospect.naics_source == "original").label("with_naics_original"),
+        _count_where(Prospect.naics_source == "llm_inferred").label(
+            "with_naics_inferred"
+        ),
+        _count_where(
+            Prospect.naics.isnot(None), Prospect.naics_source == "original"
+        ).label("naics_original"),
+        _count_where(
+            Prospect.naics.isnot(None), Prospect.naics_source == "llm_inferred"
+        ).label("naics_llm_inferred"),
+        func.count(Prospect.estimated_value_single).label("with_parsed_values"),
+        func.count(Prospect.primary_contact_email).label("with_contact_info"),
+        func.count(Prospect.ai_enhanced_title).label("with_enhanced_title"),
+        func.count(Prospect.set_aside_standardized).label(
+            "with_standardized_set_aside"
+        ),
+        func.count(Prospect.ollama_processed_at).label("llm_processed"),
+        func.max(Prospect.ollama_processed_at).label("last_processed_at"),
+        latest_model.label("model_version"),
+    ).one()
+    coverage = dict(row._mapping)
+    coverage["pending_llm"] = coverage["total_prospects"] - coverage["llm_processed"]
+    return coverage
+
+
+def get_prospect_coverage() -> dict:
+    """Count prospects by enhancement coverage in a single aggregate query.
+
+    The result is memoized until prospects are next written.
+
+    Returns:
+        Dictionary of counts plus the last LLM processing time and model
+    """
+    return dict(
+        count_cache.get_or_compute(("prospect_coverage",), _query_prospect_coverage)
+    )
+
+
+# Keys of get_prospect_coverage reported by get_prospect_statistics
+_STATISTICS_KEYS = (
+    "total_prospects",
+    "with_naics",
+    "with_naics_original",
+    "with_naics_inferred",
+    "with_parsed_values",
+    "with_contact_info",
+    "llm_processed",
+    "pending_llm",
+)
+
+
 def get_prospect_statistics():
     """Get statistics about prospects and their enhancement status.
 
+    The counts come from get_prospect_coverage.
+
     Returns:
         Dictionary with various statistics
     """
     try:
-        stats = {
-            "total_prospects": Prospect.query.count(),
-            "with_naics": Prospect.query.filter(Prospect.naics.isnot(None)).count(),
-            "with_naics_original": Prospect.query.filter(
-                Prospect.naics_source == "original"
-            ).count(),
-            "with_naics_inferred": Prospect.query.filter(
-                Prospect.naics_source == "llm_inferred"
-            ).count(),
-            "with_parsed_values": Prospect.query.filter(
-                Prospect.estimated_value_single.isnot(None)
-            ).count(),
-            "with_contact_info": Prospect.query.filter(
-                Prospect.primary_contact_email.isnot(None)
-            ).count(),
-            "llm_processed": Prospect.query.filter(
-                Prospect.ollama_processed_at.isnot(None)
-            ).count(),
-            "pending_llm": Prospect.query.filter(
-                Prospect.ollama_processed_at.is_(None)
-            ).count(),
-        }
+        coverage = get_prospect_coverage()
+        stats = {key: coverage[key] for key in _STATISTICS_KEYS}
 
         # Calculate percentages
         if stats["total_prospects"] > 0:
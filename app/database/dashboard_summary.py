@@ -0,0 +1,142 @@
+"""Stored dashboard summary.
+
+The dashboard's prospect aggregates (total, top agencies and upcoming
+releases) need a scan of the prospects table. They are kept in one
+dashboard_summary row instead, refreshed when scrapers load data and when
+enhancement runs finish, so the dashboard reads a single row.
+
+The dashboard falls back to computing the aggregates live, and stores them,
+when the row is stale: computed on an earlier day, older than
+DASHBOARD_SUMMARY_MAX_AGE_SECONDS, or prospects were written by this process
+since it was refreshed (see write_generation).
+"""
+
+import threading
+from datetime import date, datetime, timezone
+
+from sqlalchemy import desc, func
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import active_config
+from app.database import db
+from app.database.models import DashboardSummary, Prospect
+from app.database.write_generation import write_generation
+from app.utils.logger import logger
+
+UTC = timezone.utc
+
+SUMMARY_KEY = "dashboard"
+
+_lock = threading.Lock()
+# Prospects generation the stored summary is known to include
+_synced_generation = write_generation(Prospect.__tablename__)[0]
+
+
+def compute_dashboard_summary(session=None) -> dict:
+    """Compute the dashboard's prospect aggregates from the prospects table."""
+    session = session or db.session
+    today = date.today()
+
+    total_prospects = session.query(func.count(Prospect.id)).scalar()
+
+    top_agencies = (
+        session.query(Prospect.agency, func.count(Prospect.id).label("prospect_count"))
+        .group_by(Prospect.agency)
+        .order_by(desc("prospect_count"))
+        .limit(5)
+        .all()
+    )
+
+    upcoming_prospects = (
+        session.query(
+            Prospect.id, Prospect.title, Prospect.agency, Prospect.release_date
+        )
+        .filter(Prospect.release_date >= today)
+        .order_by(Prospect.release_date)
+        .limit(5)
+        .all()
+    )
+
+    return {
+        "total_proposals": total_prospects,
+        "top_agencies": [
+            {"agency": agency, "count": count} for agency, count in top_agencies
+        ],
+        "upcoming_proposals": [
+            {
+                "id": p.id,
+                "title": p.title,
+                "agency": p.agency,
+                "proposal_date": (
+                    p.release_date.isoformat().replace("+00:00", "Z")
+                    if p.release_date
+                    else None
+                ),
+            }
+            for p in upcoming_prospects
+        ],
+    }
+
+
+def refresh_dashboard_summary(session=None) -> dict:
+    """Recompute the dashboard summary and store it.
+
+    Commits the session. Failing to store the summary is logged and leaves
+    the stale row in place, the computed summary is returned either way.
+    """
+    global _synced_generation
+
+    session = session or db.session
+    # Read first, prospects written while computing leave the summary stale
+    generation = write_generation(Prospect.__tablename__)[0]
+    summary = compute_dashboard_summary(session)
+
+    try:
+        row = session.get(DashboardSummary, SUMMARY_KEY)
+        if row is None:
+            row = DashboardSummary(key=SUMMARY_KEY)
+            session.add(row)
+        row.data = summary
+        row.summary_date = date.today()
+        row.refreshed_at = datetime.now(UTC)
+        session.commit()
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.warning(f"Could not store dashboard summary: {e}")
+        return summary
+
+    with _lock:
+        _synced_generation = generation
+    return summary
+
+
+def _is_fresh(row: DashboardSummary, max_age: int) -> bool:
+    if row.summary_date != date.today():
+        return False
+    refreshed_at = row.refreshed_at
+    if refreshed_at.tzinfo is None:
+        refreshed_at = refreshed_at.replace(tzinfo=UTC)
+    if (datetime.now(UTC) - refreshed_at).total_seconds() >= max_age:
+        return False
+    with _lock:
+        return _synced_generation == write_generation(Prospect.__tablename__)[0]
+
+
+def get_dashboard_summary(session=None) -> dict:
+    """Return the stored dashboard summary, refreshing it when stale."""
+    session = session or db.session
+    max_age = active_config.DASHBOARD_SUMMARY_MAX_AGE_SECONDS
+    if max_age <= 0:
+        return compute_dashboard_summary(session)
+
+    try:
+        row = session.get(DashboardSummary, SUMMARY_KEY)
+    except SQLAlchemyError as e:
+        # Databases not yet migrated to have the table
+        session.rollback()
+        logger.warning(f"Could not read dashboard summary: {e}")
+        return compute_dashboard_summary(session)
+
+    if row is not None and _is_fresh(row, max_age):
+        return row.data
+    return refresh_dashboard_summary(session)
@@ -1,6 +1,4 @@
-from datetime import timezone
-
-UTC = timezone.utc
+import math
 
 from sqlalchemy import (
     JSON,
@@ -13,11 +11,24 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    event,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.database import db
+from app.database.search import create_search_index, drop_search_index
+
+
+def clean_json_value(v):
+    """Replace NaN and infinite floats in JSON data with None."""
+    if isinstance(v, float) and (math.isnan(v) or math.isinf(v)):
+        return None
+    elif isinstance(v, dict):
+        return {k: clean_json_value(vv) for k, vv in v.items()}
+    elif isinstance(v, list):
+        return [clean_json_value(vv) for vv in v]
+    return v
 
 
 class Prospect(db.Model):
@@ -78,17 +89,6 @@ class Prospect(db.Model):
         return f"<Prospect(id='{self.id}', source_id='{self.source_id}', title='{self.title[:30] if self.title else ''}...')>"
 
     def to_dict(self):
-        import math
-
-        def clean_value(v):
-            if isinstance(v, float) and (math.isnan(v) or math.isinf(v)):
-                return None
-            elif isinstance(v, dict):
-                return {k: clean_value(vv) for k, vv in v.items()}
-            elif isinstance(v, list):
-                return [clean_value(vv) for vv in v]
-            return v
-
         return {
             "id": self.id,
             "native_id": self.native_id,
@@ -99,32 +99,14 @@ class Prospect(db.Model):
             "naics": self.naics,
             "naics_description": self.naics_description,
             "naics_source": self.naics_source,
-            "estimated_value": (
-                str(self.estimated_value) if self.estimated_value is not None else None
-            ),
+            "estimated_value": self.estimated_value,
             "est_value_unit": self.est_value_unit,
             "estimated_value_text": self.estimated_value_text,
-            "estimated_value_min": (
-                str(self.estimated_value_min)
-                if self.estimated_value_min is not None
-                else None
-            ),
-            "estimated_value_max": (
-                str(self.estimated_value_max)
-                if self.estimated_value_max is not None
-                else None
-            ),
-            "estimated_value_single": (
-                str(self.estimated_value_single)
-                if self.estimated_value_single is not None
-                else None
-            ),
-            "release_date": (
-                self.release_date.strftime("%Y-%m-%d") if self.release_date else None
-            ),
-            "award_date": (
-                self.award_date.strftime("%Y-%m-%d") if self.award_date else None
-            ),
+            "estimated_value_min": self.estimated_value_min,
+            "estimated_value_max": self.estimated_value_max,
+            "estimated_value_single": self.estimated_value_single,
+            "release_date": self.release_date,
+            "award_date": self.award_date,
             "award_fiscal_year": self.award_fiscal_year,
             "place_city": self.place_city,
             "place_state": self.place_state,
@@ -135,28 +117,53 @@ class Prospect(db.Model):
             "set_aside_standardized_label": self.set_aside_standardized_label,
             "primary_contact_email": self.primary_contact_email,
             "primary_contact_name": self.primary_contact_name,
-            "loaded_at": self.loaded_at.isoformat() + "Z" if self.loaded_at else None,
-            "ollama_processed_at": (
-                self.ollama_processed_at.replace(tzinfo=UTC)
-                .isoformat()
-                .replace("+00:00", "Z")
-                if self.ollama_processed_at
-                else None
-            ),
+            "loaded_at": self.loaded_at,
+            "ollama_processed_at": self.ollama_processed_at,
             "ollama_model_version": self.ollama_model_version,
             "enhancement_status": self.enhancement_status,
-            "enhancement_started_at": (
-                self.enhancement_started_at.isoformat() + "Z"
-                if self.enhancement_started_at
-                else None
-            ),
+            "enhancement_started_at": self.enhancement_started_at,
             "enhancement_user_id": self.enhancement_user_id,
-            "extra": clean_value(self.extra) if self.extra else None,
+            "extra": clean_json_value(self.extra) if self.extra else None,
             "source_id": self.source_id,
             "source_name": self.data_source.name if self.data_source else None,
         }
 
 
+# Keep the full-text search index alongside the prospects table
+event.listen(
+    Prospect.__table__,
+    "after_create",
+    lambda target, connection, **kw: create_search_index(connection),
+)
+event.listen(
+    Prospect.__table__,
+    "before_drop",
+    lambda target, connection, **kw: drop_search_index(connection),
+)
+
+
+class ProspectNaics(db.Model):
+    """One NAICS code of a prospect and where it came from.
+
+    Lets the NAICS filter match primary, extra-field and LLM-suggested codes
+    with an index range scan on code (exact codes and 2-6 digit prefixes).
+    """
+
+    __tablename__ = "prospect_naics"
+
+    prospect_id = Column(
+        String, ForeignKey("prospects.id", ondelete="CASCADE"), primary_key=True
+    )
+    code = Column(String(6), primary_key=True)
+    source = Column(String(20), primary_key=True)  # 'naics', 'extra', 'llm'
+    is_primary = Column(db.Boolean, nullable=False, default=False)
+
+    __table_args__ = (db.Index("ix_prospect_naics_code", "code", "prospect_id"),)
+
+    def __repr__(self):
+        return f"<ProspectNaics(prospect_id='{self.prospect_id}', code='{self.code}', source='{self.source}')>"
+
+
 class DataSource(db.Model):
     __tablename__ = "data_sources"
 
@@ -183,9 +190,7 @@ class DataSource(db.Model):
             "url": self.url,
             "description": self.description,
             "scraper_key": self.scraper_key,
-            "last_scraped": (
-                self.last_scraped.isoformat() + "Z" if self.last_scraped else None
-            ),
+            "last_scraped": self.last_scraped,
             "frequency": self.frequency,
         }
 
@@ -215,9 +220,7 @@ class ScraperStatus(db.Model):
             "id": self.id,
             "source_id": self.source_id,
             "status": self.status,
-            "last_checked": (
-                self.last_checked.isoformat() + "Z" if self.last_checked else None
-            ),
+            "last_checked": self.last_checked,
             "records_found": self.records_found,
             "error_message": self.error_message,
             "details": self.details,
@@ -244,7 +247,7 @@ class AIEnrichmentLog(db.Model):
     def to_dict(self):
         return {
             "id": self.id,
-            "timestamp": self.timestamp.isoformat() + "Z" if self.timestamp else None,
+            "timestamp": self.timestamp,
             "enhancement_type": self.enhancement_type,
             "status": self.status,
             "processed_count": self.processed_count,
@@ -278,7 +281,7 @@ class LLMOutput(db.Model):
     def to_dict(self):
         return {
             "id": self.id,
-            "timestamp": self.timestamp.isoformat() + "Z" if self.timestamp else None,
+            "timestamp": self.timestamp,
             "prospect_id": self.prospect_id,
             "prospect_title": (
                 self.prospect.title[:100]
@@ -299,6 +302,22 @@ class LLMOutput(db.Model):
         }
 
 
+class DashboardSummary(db.Model):
+    """Stored dashboard aggregates, see app.database.dashboard_summary."""
+
+    __tablename__ = "dashboard_summary"
+
+    key = Column(String(50), primary_key=True)
+    data = Column(JSON, nullable=False)
+    summary_date = Column(Date, nullable=False)  # Upcoming releases are from this day
+    refreshed_at = Column(TIMESTAMP(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<DashboardSummary(key='{self.key}', refreshed_at='{self.refreshed_at}')>"
+        )
+
+
 class Settings(db.Model):
     __tablename__ = "settings"
 
@@ -322,9 +341,7 @@ class Settings(db.Model):
             "key": self.key,
             "value": self.value,
             "description": self.description,
-            "updated_at": (
-                self.updated_at.isoformat() + "Z" if self.updated_at else None
-            ),
+            "updated_at": self.updated_at,
         }
 
 
@@ -360,12 +377,8 @@ class GoNoGoDecision(db.Model):
             "user_id": self.user_id,
             "decision": self.decision,
             "reason": self.reason,
-            "created_at": (
-                self.created_at.isoformat() + "Z" if self.created_at else None
-            ),
-            "updated_at": (
-                self.updated_at.isoformat() + "Z" if self.updated_at else None
-            ),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
         if include_user and user_data:
@@ -415,19 +428,9 @@ class FileProcessingLog(db.Model):
             "file_path": self.file_path,
             "file_name": self.file_name,
             "file_size": self.file_size,
-            "file_timestamp": (
-                self.file_timestamp.isoformat() + "Z" if self.file_timestamp else None
-            ),
-            "processing_started_at": (
-                self.processing_started_at.isoformat() + "Z"
-                if self.processing_started_at
-                else None
-            ),
-            "processing_completed_at": (
-                self.processing_completed_at.isoformat() + "Z"
-                if self.processing_completed_at
-                else None
-            ),
+            "file_timestamp": self.file_timestamp,
+            "processing_started_at": self.processing_started_at,
+            "processing_completed_at": self.processing_completed_at,
             "success": self.success,
             "records_extracted": self.records_extracted,
             "records_inserted": self.records_inserted,
@@ -439,6 +442,42 @@ class FileProcessingLog(db.Model):
         }
 
 
+class DuplicateScan(db.Model):
+    """Persisted state and results of a background duplicate scan."""
+
+    __tablename__ = "duplicate_scans"
+
+    id = Column(String(64), primary_key=True)
+    status = Column(
+        String(20), nullable=False, default="queued", index=True
+    )  # 'queued', 'processing', 'completed', 'error', 'interrupted'
+    source_id = Column(Integer, nullable=True)
+    min_confidence = Column(Float, nullable=False)
+    scan_limit = Column(Integer, nullable=False)
+    # 'matches' (per-prospect match lists) or 'clusters' (union-find groups)
+    mode = Column(String(20), nullable=False, default="matches")
+    total = Column(Integer, nullable=False, default=0)
+    current = Column(Integer, nullable=False, default=0)
+    message = Column(Text, nullable=True)
+    completed_sources = Column(JSON, nullable=True)  # Checkpoint for resuming
+    matches = Column(JSON, nullable=True)  # prospect_id -> matches found so far
+    results = Column(JSON, nullable=True)
+    created_at = Column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), index=True
+    )
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        index=True,
+    )
+    completed_at = Column(TIMESTAMP(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<DuplicateScan(id='{self.id}', status='{self.status}')>"
+
+
 class InferredProspectData(db.Model):
     __tablename__ = "inferred_prospect_data"
 
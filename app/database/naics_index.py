@@ -0,0 +1,217 @@
+"""NAICS side table used by the prospects NAICS filter.
+
+``prospect_naics`` holds one row per (prospect, code, source):
+
+- ``naics``: the prospect's own NAICS column (primary)
+- ``extra``: known codes found in the extra JSON, the one
+  extract_naics_from_extra picks plus any other codes stored under a key
+  mentioning NAICS
+- ``llm``: the codes suggested by LLM classification
+
+ORM writes are synced after each flush; the Core upsert path and the LLM
+classification call sync_prospect_naics / replace_llm_naics_codes directly.
+Bulk query deletes skip the flush hook, so they also delete the prospects'
+rows with delete_prospect_naics_where; SQLite does not enforce the ON DELETE
+CASCADE.
+"""
+
+import json
+import re
+
+from sqlalchemy import delete, event, inspect, insert, select
+from sqlalchemy.orm import Session
+
+from app.database.models import Prospect, ProspectNaics
+from app.utils.naics_lookup import extract_naics_from_extra, validate_naics_code
+
+_table = ProspectNaics.__table__
+
+SOURCE_NAICS = "naics"
+SOURCE_EXTRA = "extra"
+SOURCE_LLM = "llm"
+
+_CODE_RE = re.compile(r"\b[1-9]\d{5}\b")
+_PREFIX_RE = re.compile(r"\d{2,6}")
+_LEADING_CODE_RE = re.compile(r"\s*(\d{2,6})(?!\d)")
+
+# Prospect ids per delete statement
+_CHUNK_SIZE = 500
+
+
+def _leading_code(value) -> str | None:
+    if value is None:
+        return None
+    match = _LEADING_CODE_RE.match(str(value))
+    return match.group(1) if match else None
+
+
+def _extra_codes(extra) -> list[str]:
+    """NAICS codes found in a prospect's extra JSON, best match first."""
+    if isinstance(extra, str):
+        try:
+            extra = json.loads(extra)
+        except (json.JSONDecodeError, TypeError):
+            return []
+    if not isinstance(extra, dict):
+        return []
+
+    codes = []
+    found = extract_naics_from_extra(extra)
+    if found["code"]:
+        codes.append(found["code"])
+    for key, value in extra.items():
+        if "naics" not in str(key).lower() or isinstance(value, dict):
+            continue
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if isinstance(item, (str, int)):
+                codes.extend(_CODE_RE.findall(str(item)))
+    # Six-digit numbers in free text are only kept if they are real codes
+    return [code for code in dict.fromkeys(codes) if validate_naics_code(code)]
+
+
+def _prospect_rows(prospect) -> list[dict]:
+    rows = []
+    primary = _leading_code(prospect.naics)
+    if primary:
+        rows.append(
+            {
+                "prospect_id": prospect.id,
+                "code": primary,
+                "source": SOURCE_NAICS,
+                "is_primary": True,
+            }
+        )
+    rows.extend(
+        {
+            "prospect_id": prospect.id,
+            "code": code,
+            "source": SOURCE_EXTRA,
+            "is_primary": False,
+        }
+        for code in _extra_codes(prospect.extra)
+        if code != primary
+    )
+    return rows
+
+
+def delete_prospect_naics(bind, prospect_ids):
+    """Drop the rows of every source for prospect_ids."""
+    prospect_ids = list(prospect_ids)
+    for start in range(0, len(prospect_ids), _CHUNK_SIZE):
+        bind.execute(
+            delete(_table).where(
+                _table.c.prospect_id.in_(prospect_ids[start : start + _CHUNK_SIZE])
+            )
+        )
+
+
+def delete_prospect_naics_where(bind, condition=None):
+    """Drop the rows of prospects matching condition, or of every prospect.
+
+    For query deletes of prospects, which skip the flush hook.
+    """
+    stmt = delete(_table)
+    if condition is not None:
+        stmt = stmt.where(
+            _table.c.prospect_id.in_(select(Prospect.id).where(condition))
+        )
+    bind.execute(stmt)
+
+
+def sync_prospect_naics(bind, prospects, new_ids=()):
+    """Rebuild the NAICS column and extra field rows of prospects.
+
+    Args:
+        bind: A session or connection, rows are written in its transaction
+        prospects: Objects with id, naics and extra attributes
+        new_ids: Ids of prospects that were just inserted, their LLM rows are
+            dropped too as they can only be left over from a deleted prospect
+    """
+    new_ids = set(new_ids)
+    ids = []
+    rows = []
+    for prospect in prospects:
+        if prospect.id not in new_ids:
+            ids.append(prospect.id)
+        rows.extend(_prospect_rows(prospect))
+
+    delete_prospect_naics(bind, new_ids)
+    for start in range(0, len(ids), _CHUNK_SIZE):
+        bind.execute(
+            delete(_table).where(
+                _table.c.prospect_id.in_(ids[start : start + _CHUNK_SIZE]),
+                _table.c.source.in_((SOURCE_NAICS, SOURCE_EXTRA)),
+            )
+        )
+    if rows:
+        bind.execute(insert(_table), rows)
+
+
+def replace_llm_naics_codes(bind, prospect_id: str, codes: list[dict]):
+    """Store the codes of an LLM classification, the first being primary."""
+    bind.execute(
+        delete(_table).where(
+            _table.c.prospect_id == prospect_id,
+            _table.c.source == SOURCE_LLM,
+        )
+    )
+    rows = []
+    for code in dict.fromkeys(_leading_code(c.get("code")) for c in codes):
+        if code:
+            rows.append(
+                {
+                    "prospect_id": prospect_id,
+                    "code": code,
+                    "source": SOURCE_LLM,
+                    "is_primary": not rows,
+                }
+            )
+    if rows:
+        bind.execute(insert(_table), rows)
+
+
+def naics_filter_condition(term: str):
+    """Condition matching prospects with a NAICS code equal to or under term.
+
+    Terms of 2-6 digits use a range scan on the code index, anything else
+    falls back to a substring match on the prospect's NAICS column.
+    """
+    term = term.strip()
+    if not _PREFIX_RE.fullmatch(term):
+        return Prospect.naics.ilike(f"%{term}%")
+
+    # Codes starting with term sort between term and its successor
+    upper = term[:-1] + chr(ord(term[-1]) + 1)
+    return Prospect.id.in_(
+        select(ProspectNaics.prospect_id).where(
+            ProspectNaics.code >= term, ProspectNaics.code < upper
+        )
+    )
+
+
+def _naics_changed(prospect: Prospect) -> bool:
+    state = inspect(prospect)
+    return any(
+        state.attrs[name].history.has_changes() for name in ("id", "naics", "extra")
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_flushed_prospects(session, flush_context):
+    """Keep the side table in sync with prospects written through the ORM."""
+    prospects = [obj for obj in session.new if isinstance(obj, Prospect)]
+    stale_ids = [obj.id for obj in session.deleted if isinstance(obj, Prospect)]
+    for obj in session.dirty:
+        if isinstance(obj, Prospect) and _naics_changed(obj):
+            prospects.append(obj)
+            # Smart matching can move a prospect to a new id
+            stale_ids.extend(inspect(obj).attrs.id.history.deleted)
+
+    delete_prospect_naics(session, stale_ids)
+    if prospects:
+        sync_prospect_naics(
+            session,
+            prospects,
+            new_ids=[obj.id for obj in session.new if isinstance(obj, Prospect)],
+        )
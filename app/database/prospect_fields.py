@@ -0,0 +1,145 @@
+"""Column projections of prospects for list responses.
+
+List endpoints select only the requested columns, with the data source name
+joined in the same query, instead of loading full Prospect entities and
+lazy-loading each one's data source. Projected rows serialize to the same
+shape as Prospect.to_dict, restricted to the requested fields.
+"""
+
+from sqlalchemy import func
+
+from app.database.models import DataSource, Prospect, clean_json_value
+from app.exceptions import ValidationError
+
+# Response field -> selected expression, in Prospect.to_dict order
+FIELDS = {
+    "id": Prospect.id,
+    "native_id": Prospect.native_id,
+    "title": Prospect.title,
+    "ai_enhanced_title": Prospect.ai_enhanced_title,
+    "description": Prospect.description,
+    "agency": Prospect.agency,
+    "naics": Prospect.naics,
+    "naics_description": Prospect.naics_description,
+    "naics_source": Prospect.naics_source,
+    "estimated_value": Prospect.estimated_value,
+    "est_value_unit": Prospect.est_value_unit,
+    "estimated_value_text": Prospect.estimated_value_text,
+    "estimated_value_min": Prospect.estimated_value_min,
+    "estimated_value_max": Prospect.estimated_value_max,
+    "estimated_value_single": Prospect.estimated_value_single,
+    "release_date": Prospect.release_date,
+    "award_date": Prospect.award_date,
+    "award_fiscal_year": Prospect.award_fiscal_year,
+    "place_city": Prospect.place_city,
+    "place_state": Prospect.place_state,
+    "place_country": Prospect.place_country,
+    "contract_type": Prospect.contract_type,
+    "set_aside": Prospect.set_aside,
+    "set_aside_standardized": Prospect.set_aside_standardized,
+    "set_aside_standardized_label": Prospect.set_aside_standardized_label,
+    "primary_contact_email": Prospect.primary_contact_email,
+    "primary_contact_name": Prospect.primary_contact_name,
+    "loaded_at": Prospect.loaded_at,
+    "ollama_processed_at": Prospect.ollama_processed_at,
+    "ollama_model_version": Prospect.ollama_model_version,
+    "enhancement_status": Prospect.enhancement_status,
+    "enhancement_started_at": Prospect.enhancement_started_at,
+    "enhancement_user_id": Prospect.enhancement_user_id,
+    "extra": Prospect.extra,
+    "source_id": Prospect.source_id,
+    "source_name": DataSource.name,
+}
+
+# Fields shown by the prospects table, without descriptions and extra data
+TABLE_FIELDS = (
+    "id",
+    "native_id",
+    "title",
+    "ai_enhanced_title",
+    "agency",
+    "naics",
+    "naics_description",
+    "naics_source",
+    "estimated_value",
+    "estimated_value_text",
+    "estimated_value_min",
+    "estimated_value_max",
+    "estimated_value_single",
+    "release_date",
+    "award_date",
+    "set_aside",
+    "set_aside_standardized",
+    "set_aside_standardized_label",
+    "ollama_processed_at",
+    "enhancement_status",
+    "source_id",
+    "source_name",
+)
+
+FIELD_PRESETS = {"all": tuple(FIELDS), "table": TABLE_FIELDS}
+
+
+def parse_fields(value: str | None) -> tuple[str, ...]:
+    """Resolve a comma-separated fields parameter.
+
+    Entries are field names or presets ("all", "table") and may be mixed,
+    e.g. ``table,description``. Blank means all fields. The id is always
+    included.
+
+    Raises:
+        ValidationError: If an entry is neither a field nor a preset.
+    """
+    if not value or not value.strip():
+        return FIELD_PRESETS["all"]
+
+    requested = {"id"}
+    unknown = []
+    for entry in (part.strip() for part in value.split(",")):
+        if not entry:
+            continue
+        if entry in FIELD_PRESETS:
+            requested.update(FIELD_PRESETS[entry])
+        elif entry in FIELDS:
+            requested.add(entry)
+        else:
+            unknown.append(entry)
+    if unknown:
+        raise ValidationError(
+            f"Unknown fields: {', '.join(unknown)}. Use field names or one "
+            f"of the presets: {', '.join(FIELD_PRESETS)}."
+        )
+    return tuple(field for field in FIELDS if field in requested)
+
+
+def project_prospects(
+    query, fields: tuple[str, ...], description_length: int | None = None
+):
+    """Select only the columns of fields from a Prospect query.
+
+    Args:
+        query: Query of Prospect entities, filters and joins are kept.
+        fields: Response fields, as returned by parse_fields.
+        description_length: Truncate descriptions to this many characters
+            in the database, None returns them whole.
+    """
+    columns = []
+    for field in fields:
+        column = FIELDS[field]
+        if field == "description" and description_length is not None:
+            column = func.substr(column, 1, description_length)
+        columns.append(column.label(field))
+
+    query = query.with_entities(*columns)
+    if "source_name" in fields:
+        query = query.outerjoin(DataSource, DataSource.id == Prospect.source_id)
+    return query
+
+
+def serialize_prospect_row(row, fields: tuple[str, ...]) -> dict:
+    """Serialize a row of project_prospects like Prospect.to_dict."""
+    result = dict(zip(fields, row))
+    if "extra" in result:
+        extra = result["extra"]
+        result["extra"] = clean_json_value(extra) if extra else None
+    return result
@@ -0,0 +1,230 @@
+"""Full-text search over prospects.
+
+SQLite keeps an FTS5 table, ``prospects_fts``, in sync with ``prospects``
+through triggers. Its rows carry the prospect id, and their rowids come from
+``prospects_fts_keys`` rather than the implicit prospects rowid, which VACUUM
+may renumber. PostgreSQL gets a generated ``search_vector`` tsvector
+column with a GIN index. Both are created together with the prospects table
+(see models.py) and by migration for existing databases. Databases without
+either index fall back to ILIKE filters.
+
+Search terms are split into words and each word matches as a prefix, so
+"cloud host" finds "Cloud Hosting Services".
+"""
+
+import re
+
+from sqlalchemy import String, cast, func, literal_column, or_, select, text
+from sqlalchemy.sql import column, table
+
+# Indexed text, in FTS5 column order
+SEARCH_COLUMNS = ("title", "ai_enhanced_title", "description", "agency", "extras")
+
+# Columns matched by the keywords filter
+KEYWORD_COLUMNS = ("title", "ai_enhanced_title", "description")
+
+# BM25 weight of each column, titles count the most
+BM25_WEIGHTS = (10.0, 10.0, 4.0, 2.0, 1.0)
+
+# tsvector weight labels of each column
+TSVECTOR_WEIGHTS = {
+    "title": "A",
+    "ai_enhanced_title": "A",
+    "description": "B",
+    "agency": "C",
+    "extras": "D",
+}
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+_prospects_fts = table("prospects_fts", column("prospect_id"))
+_search_vector = literal_column("prospects.search_vector")
+
+
+def _flattened_extras(row: str) -> str:
+    """SQL expression joining every scalar value of a row's extra JSON."""
+    return (
+        f"CASE WHEN json_valid({row}.extra) THEN "
+        f"(SELECT group_concat(atom, ' ') FROM json_tree({row}.extra) "
+        f"WHERE atom IS NOT NULL) END"
+    )
+
+
+def _fts_values(row: str) -> str:
+    return (
+        f"(SELECT docid FROM prospects_fts_keys WHERE prospect_id = {row}.id), "
+        f"{row}.title, {row}.ai_enhanced_title, {row}.description, "
+        f"{row}.agency, {_flattened_extras(row)}, {row}.id"
+    )
+
+
+# prospect_id comes last, keeping BM25_WEIGHTS aligned with SEARCH_COLUMNS
+_FTS_COLUMN_LIST = "rowid, " + ", ".join(SEARCH_COLUMNS) + ", prospect_id"
+
+_FTS_DELETE = """
+        DELETE FROM prospects_fts WHERE rowid = (
+            SELECT docid FROM prospects_fts_keys WHERE prospect_id = old.id
+        );
+        DELETE FROM prospects_fts_keys WHERE prospect_id = old.id;"""
+
+_FTS_INSERT = f"""
+        INSERT INTO prospects_fts_keys (prospect_id) VALUES (new.id);
+        INSERT INTO prospects_fts ({_FTS_COLUMN_LIST}) VALUES ({_fts_values("new")});"""
+
+_SQLITE_DDL = (
+    # Stable FTS rowid of each prospect
+    "CREATE TABLE IF NOT EXISTS prospects_fts_keys ("
+    "docid INTEGER PRIMARY KEY, prospect_id TEXT NOT NULL UNIQUE)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS prospects_fts USING fts5("
+    + ", ".join(SEARCH_COLUMNS)
+    + ", prospect_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')",
+    f"""CREATE TRIGGER IF NOT EXISTS prospects_fts_insert AFTER INSERT ON prospects
+    BEGIN{_FTS_INSERT}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS prospects_fts_delete AFTER DELETE ON prospects
+    BEGIN{_FTS_DELETE}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS prospects_fts_update
+    AFTER UPDATE OF id, title, ai_enhanced_title, description, agency, extra
+    ON prospects
+    BEGIN{_FTS_DELETE}{_FTS_INSERT}
+    END""",
+)
+
+_POSTGRES_DDL = (
+    """ALTER TABLE prospects ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(ai_enhanced_title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+        || setweight(to_tsvector('simple', coalesce(agency, '')), 'C')
+        || setweight(
+            jsonb_to_tsvector(
+                'simple', coalesce(extra::jsonb, '{}'::jsonb), '["string", "numeric"]'
+            ),
+            'D'
+        )
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_prospects_search_vector "
+    "ON prospects USING gin (search_vector)",
+)
+
+
+def create_search_index(connection):
+    """Create the full-text index for the connection's dialect and fill it."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        exists = search_backend(connection) == "fts5"
+        for statement in _SQLITE_DDL:
+            connection.exec_driver_sql(statement)
+        if not exists:
+            connection.exec_driver_sql(
+                "INSERT INTO prospects_fts_keys (prospect_id) SELECT id FROM prospects"
+            )
+            connection.exec_driver_sql(
+                f"INSERT INTO prospects_fts ({_FTS_COLUMN_LIST}) "
+                f"SELECT {_fts_values('prospects')} FROM prospects"
+            )
+    elif dialect == "postgresql":
+        for statement in _POSTGRES_DDL:
+            connection.exec_driver_sql(statement)
+
+
+def drop_search_index(connection):
+    """Drop the full-text index for the connection's dialect."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        for trigger in ("insert", "delete", "update"):
+            connection.exec_driver_sql(
+                f"DROP TRIGGER IF EXISTS prospects_fts_{trigger}"
+            )
+        connection.exec_driver_sql("DROP TABLE IF EXISTS prospects_fts")
+        connection.exec_driver_sql("DROP TABLE IF EXISTS prospects_fts_keys")
+    elif dialect == "postgresql":
+        connection.exec_driver_sql("DROP INDEX IF EXISTS ix_prospects_search_vector")
+        connection.exec_driver_sql(
+            "ALTER TABLE prospects DROP COLUMN IF EXISTS search_vector"
+        )
+
+
+def search_backend(bind) -> str | None:
+    """Return 'fts5' or 'tsvector' if the search index exists, else None.
+
+    Args:
+        bind: A connection or session
+    """
+    dialect = getattr(bind, "dialect", None) or bind.get_bind().dialect
+    dialect = dialect.name
+    if dialect == "sqlite":
+        found = bind.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": "prospects_fts"},
+        ).first()
+        return "fts5" if found else None
+    if dialect == "postgresql":
+        found = bind.execute(
+            text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'prospects' AND column_name = 'search_vector'"
+            )
+        ).first()
+        return "tsvector" if found else None
+    return None
+
+
+def _fts5_query(words: list[str], columns) -> str:
+    phrases = " AND ".join(f'"{word}"*' for word in words)
+    return f"{{{' '.join(columns)}}} : ({phrases})"
+
+
+def _tsquery(words: list[str], columns) -> str:
+    weights = "".join(sorted({TSVECTOR_WEIGHTS[c] for c in columns}))
+    return " & ".join(f"{word}:*{weights}" for word in words)
+
+
+def _ilike_condition(model, term: str, columns):
+    conditions = []
+    for name in columns:
+        field = cast(model.extra, String) if name == "extras" else getattr(model, name)
+        conditions.append(field.ilike(f"%{term}%"))
+    return or_(*conditions)
+
+
+def apply_text_search(query, model, backend: str | None, criteria):
+    """Filter query to prospects matching every (term, columns) criterion.
+
+    Returns:
+        The filtered query and a relevance expression (higher is better) to
+        sort on, or None when the search index is unavailable.
+    """
+    criteria = [
+        (_WORD_RE.findall(term.lower()), term, columns) for term, columns in criteria
+    ]
+    if backend is None or not all(words for words, _, _ in criteria):
+        for _, term, columns in criteria:
+            query = query.filter(_ilike_condition(model, term, columns))
+        return query, None
+
+    if backend == "fts5":
+        match = " AND ".join(
+            _fts5_query(words, columns) for words, _, columns in criteria
+        )
+        matched = (
+            select(
+                _prospects_fts.c.prospect_id.label("prospect_id"),
+                (-func.bm25(literal_column("prospects_fts"), *BM25_WEIGHTS)).label(
+                    "relevance"
+                ),
+            )
+            .where(literal_column("prospects_fts").op("MATCH")(match))
+            .subquery("prospect_search")
+        )
+        query = query.join(matched, matched.c.prospect_id == model.id)
+        return query, matched.c.relevance
+
+    tsquery = func.to_tsquery(
+        "simple",
+        " & ".join(f"({_tsquery(words, columns)})" for words, _, columns in criteria),
+    )
+    query = query.filter(_search_vector.op("@@")(tsquery))
+    return query, func.ts_rank(_search_vector, tsquery)
@@ -0,0 +1,81 @@
+"""Per-table write generations.
+
+Each table has a counter that is bumped when a transaction that wrote to the
+table commits. Anything derived from a table (cached counts, response ETags)
+can record the generation it was computed in and compare it later instead of
+re-reading the table.
+
+ORM flushes and ``session.execute`` DML are detected automatically. Writes
+that bypass both (``bulk_insert_mappings``, raw connections) call
+mark_written. Generations only see writes made by this process.
+"""
+
+import threading
+from collections import defaultdict
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_lock = threading.Lock()
+_generations: defaultdict[str, int] = defaultdict(int)
+
+# Session.info set of tables written by the transaction, consumed on commit
+_WRITTEN_TABLES = "written_tables"
+
+
+def write_generation(*tables: str) -> tuple[int, ...]:
+    """Current generation of each table."""
+    with _lock:
+        return tuple(_generations[table] for table in tables)
+
+
+def bump_write_generation(*tables: str):
+    """Mark tables as changed, as if a write to them had committed."""
+    with _lock:
+        for table in tables:
+            _generations[table] += 1
+
+
+def mark_written(session: Session, *tables: str):
+    """Bump the tables' generations when the session's transaction commits."""
+    session.info.setdefault(_WRITTEN_TABLES, set()).update(tables)
+
+
+def has_unsaved_writes(session: Session) -> bool:
+    """Whether the session's transaction has written and not yet committed."""
+    return bool(session.info.get(_WRITTEN_TABLES))
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed_tables(session, flush_context):
+    for objects in (session.new, session.dirty, session.deleted):
+        for obj in objects:
+            table = getattr(obj, "__table__", None)
+            if table is not None:
+                mark_written(session, table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_tables(orm_execute_state):
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    name = getattr(table, "name", None)
+    if name:
+        mark_written(orm_execute_state.session, name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session):
+    tables = session.info.pop(_WRITTEN_TABLES, None)
+    if tables:
+        bump_write_generation(*tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop(_WRITTEN_TABLES, None)
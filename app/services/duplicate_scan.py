@@ -0,0 +1,722 @@
+"""Background duplicate detection scans.
+
+Scans run in a bounded thread pool so ``/api/duplicates/detect`` can return a
+scan_id immediately. Matches are checkpointed per source in the
+``duplicate_scans`` table, which lets an interrupted scan resume where it
+stopped. Large scans fan their sources out to worker processes.
+
+A scan runs in one of two modes. "matches" lists every prospect with its own
+matches, so a pair shows up in both directions and groups overlap.
+"clusters" scores each blocked candidate pair once and merges the matches
+into non-overlapping groups with union-find, ready for /duplicates/merge.
+"""
+
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+from datetime import timedelta, timezone
+
+UTC = timezone.utc
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+from app.config import active_config
+from app.database import db
+from app.database.models import DuplicateScan, Prospect
+from app.services.event_bus import publish_event
+from app.utils.duplicate_prevention import DuplicateDetector, MatchCandidate
+from app.utils.logger import logger
+
+# Prospect columns read by the matching strategies
+MATCH_COLUMNS = (
+    "id",
+    "native_id",
+    "title",
+    "description",
+    "agency",
+    "naics",
+    "place_city",
+    "place_state",
+)
+
+SCAN_MODES = ("matches", "clusters")
+
+ACTIVE_STATUSES = ("queued", "processing")
+RESUMABLE_STATUSES = ("interrupted", "error")
+
+# Limits at or above this scan every prospect
+SCAN_ALL_LIMIT = 10000
+
+# Progress is reported every this many prospects within a source
+PROGRESS_INTERVAL = 25
+
+
+def scan_source(
+    source_id: int,
+    target_rows: list[tuple],
+    candidate_rows: list[tuple],
+    min_confidence: float,
+    progress=None,
+    mode: str = "matches",
+) -> dict[str, list[dict]]:
+    """Find high-confidence matches for target_rows among a source's prospects.
+
+    Runs in worker processes for large scans, so it only takes and returns
+    plain data. Rows are tuples ordered as MATCH_COLUMNS.
+    """
+    detector = DuplicateDetector()
+    index = detector.preload_source_prospects(
+        None,
+        source_id,
+        [SimpleNamespace(**dict(zip(MATCH_COLUMNS, row))) for row in candidate_rows],
+    )
+
+    if mode == "clusters":
+        found = _score_candidate_pairs(
+            detector, index, source_id, target_rows, min_confidence
+        )
+        if progress:
+            progress(len(target_rows))
+        return found
+
+    found = {}
+    for position, row in enumerate(target_rows, 1):
+        record = dict(zip(MATCH_COLUMNS, row))
+        prospect_id = record.pop("id")
+        record["source_id"] = source_id
+
+        matches = [
+            asdict(match)
+            for match in detector.find_potential_matches(None, record, source_id)
+            if match.confidence_score >= min_confidence
+            and match.prospect_id != prospect_id
+        ]
+        if matches:
+            found[prospect_id] = matches
+
+        if progress and position % PROGRESS_INTERVAL == 0:
+            progress(PROGRESS_INTERVAL)
+
+    if progress:
+        progress(len(target_rows) % PROGRESS_INTERVAL)
+    return found
+
+
+def _score_candidate_pairs(
+    detector: DuplicateDetector,
+    index,
+    source_id: int,
+    target_rows: list[tuple],
+    min_confidence: float,
+) -> dict[str, list[dict]]:
+    """Score every blocked pair involving a target once.
+
+    Each pair is scored from its member that comes first in scan order, so
+    the stored matches hold one edge per pair rather than one per direction.
+    """
+    records = {}
+    for row in target_rows:
+        record = dict(zip(MATCH_COLUMNS, row))
+        records[record.pop("id")] = {**record, "source_id": source_id}
+    order = {prospect_id: position for position, prospect_id in enumerate(records)}
+
+    found = {}
+    for first_id, second_id in index.candidate_pairs(list(records)):
+        # Prospects outside the targets sort last and are only matched against
+        if order.get(second_id, len(order)) < order.get(first_id, len(order)):
+            first_id, second_id = second_id, first_id
+
+        match = detector.score_pair(
+            records[first_id], index.by_id[second_id], source_id
+        )
+        if match and match.confidence_score >= min_confidence:
+            found.setdefault(first_id, []).append(asdict(match))
+    return found
+
+
+def _format_prospect_for_api(prospect):
+    """Format a single prospect for API response."""
+    return {
+        "id": prospect.id,
+        "native_id": prospect.native_id,
+        "title": (
+            prospect.title[:100] + "..."
+            if prospect.title and len(prospect.title) > 100
+            else prospect.title
+        ),
+        "description": (
+            prospect.description[:150] + "..."
+            if prospect.description and len(prospect.description) > 150
+            else prospect.description
+        ),
+        "agency": prospect.agency,
+        "naics": prospect.naics,
+        "place_city": prospect.place_city,
+        "place_state": prospect.place_state,
+        "ai_processed": prospect.ollama_processed_at is not None,
+        "loaded_at": (
+            prospect.loaded_at.isoformat().replace("+00:00", "Z")
+            if prospect.loaded_at
+            else None
+        ),
+    }
+
+
+def _create_duplicate_group(prospect, high_confidence_matches, matched_prospects):
+    """Create a duplicate group from a prospect and its matches."""
+    duplicate_group = {"original": _format_prospect_for_api(prospect), "matches": []}
+
+    for match in high_confidence_matches:
+        matched_prospect = matched_prospects.get(match.prospect_id)
+        if matched_prospect:
+            match_data = _format_prospect_for_api(matched_prospect)
+            match_data.update(
+                {
+                    "confidence_score": match.confidence_score,
+                    "match_type": match.match_type,
+                    "matched_fields": match.matched_fields,
+                }
+            )
+            duplicate_group["matches"].append(match_data)
+
+    return duplicate_group
+
+
+class DuplicateScanService:
+    """Runs duplicate scans in the background and tracks their progress."""
+
+    def __init__(self):
+        self._app = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        # Live progress of scans running in this process
+        self._progress: dict[str, dict[str, Any]] = {}
+
+    def set_app(self, app):
+        """Set the Flask app reference for use in background threads"""
+        self._app = app
+
+    def start_scan(
+        self,
+        source_id: int | None,
+        min_confidence: float,
+        limit: int,
+        mode: str = "matches",
+    ):
+        """Queue a new scan and return its scan_id."""
+        if mode not in SCAN_MODES:
+            raise ValueError(
+                f"Unknown scan mode '{mode}', expected one of {SCAN_MODES}"
+            )
+
+        self.evict_expired()
+
+        scan_id = f"scan_{uuid.uuid4().hex[:16]}"
+        db.session.add(
+            DuplicateScan(
+                id=scan_id,
+                status="queued",
+                source_id=source_id,
+                min_confidence=min_confidence,
+                scan_limit=limit,
+                mode=mode,
+                message="Initializing scan...",
+                completed_sources=[],
+                matches={},
+            )
+        )
+        db.session.commit()
+
+        self._submit(scan_id)
+        logger.info(f"Queued duplicate scan {scan_id}")
+        return scan_id
+
+    def resume_scan(self, scan_id: str) -> bool:
+        """Re-queue an interrupted or failed scan from its last checkpoint."""
+        scan = db.session.get(DuplicateScan, scan_id)
+        if scan is None or scan.status not in RESUMABLE_STATUSES:
+            return False
+
+        scan.status = "queued"
+        scan.message = "Resuming scan..."
+        db.session.commit()
+
+        self._submit(scan_id)
+        logger.info(f"Resuming duplicate scan {scan_id}")
+        return True
+
+    def get_progress(self, scan_id: str) -> dict[str, Any] | None:
+        """Return live progress, falling back to the persisted scan."""
+        with self._lock:
+            progress = self._progress.get(scan_id)
+            if progress is not None:
+                return dict(progress)
+
+        scan = db.session.get(DuplicateScan, scan_id)
+        if scan is None:
+            return None
+        return {
+            "status": scan.status,
+            "current": scan.current,
+            "total": scan.total,
+            "message": scan.message,
+            "start_time": _timestamp(scan.created_at),
+            "end_time": _timestamp(scan.completed_at),
+            "results": scan.results,
+        }
+
+    def evict_expired(self) -> int:
+        """Delete finished scans older than DUPLICATE_SCAN_TTL_HOURS."""
+        cutoff = datetime.now(UTC) - timedelta(
+            hours=active_config.DUPLICATE_SCAN_TTL_HOURS
+        )
+        evicted = (
+            db.session.query(DuplicateScan)
+            .filter(
+                DuplicateScan.status.notin_(ACTIVE_STATUSES),
+                DuplicateScan.updated_at < cutoff,
+            )
+            .delete(synchronize_session=False)
+        )
+        db.session.commit()
+        if evicted:
+            logger.info(f"Evicted {evicted} expired duplicate scans")
+        return evicted
+
+    def recover_interrupted_scans(self) -> int:
+        """Mark scans left running by a previous server process as resumable."""
+        count = (
+            db.session.query(DuplicateScan)
+            .filter(DuplicateScan.status.in_(ACTIVE_STATUSES))
+            .update(
+                {
+                    "status": "interrupted",
+                    "message": "Scan interrupted by a server restart",
+                },
+                synchronize_session=False,
+            )
+        )
+        db.session.commit()
+        return count
+
+    def _submit(self, scan_id: str):
+        with self._lock:
+            self._progress[scan_id] = {
+                "status": "queued",
+                "current": 0,
+                "total": 0,
+                "message": "Waiting for a free scan worker...",
+                "start_time": time.time(),
+            }
+            _publish_progress(scan_id, self._progress[scan_id])
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=active_config.DUPLICATE_SCAN_MAX_CONCURRENT,
+                    thread_name_prefix="duplicate-scan",
+                )
+            self._executor.submit(self._run_in_app_context, scan_id)
+
+    def _update_progress(self, scan_id: str, **updates):
+        with self._lock:
+            progress = self._progress[scan_id]
+            progress.update(updates)
+            _publish_progress(scan_id, progress)
+
+    def _advance_progress(self, scan_id: str, count: int):
+        with self._lock:
+            progress = self._progress[scan_id]
+            progress["current"] += count
+            progress[
+                "message"
+            ] = f"Processing prospect {progress['current']} of {progress['total']}..."
+            _publish_progress(scan_id, progress)
+
+    def _run_in_app_context(self, scan_id: str):
+        if not self._app:
+            logger.error("Flask app not set in duplicate scan service")
+            return
+
+        with self._app.app_context():
+            try:
+                self._run(scan_id)
+            except Exception as e:
+                logger.error(f"Duplicate scan {scan_id} failed: {e}", exc_info=True)
+                db.session.rollback()
+                scan = db.session.get(DuplicateScan, scan_id)
+                if scan is not None:
+                    scan.status = "error"
+                    scan.message = f"Scan failed: {str(e)}"
+                    db.session.commit()
+            finally:
+                with self._lock:
+                    self._progress.pop(scan_id, None)
+                # Final status, clients read the results from the progress endpoint
+                scan = db.session.get(DuplicateScan, scan_id)
+                if scan is not None:
+                    _publish_progress(
+                        scan_id,
+                        {
+                            "status": scan.status,
+                            "current": scan.current,
+                            "total": scan.total,
+                            "message": scan.message,
+                        },
+                    )
+                db.session.remove()
+
+    def _run(self, scan_id: str):
+        scan = db.session.get(DuplicateScan, scan_id)
+        start_time = self._progress[scan_id]["start_time"]
+
+        targets = _load_targets(scan.source_id, scan.scan_limit)
+        targets_by_source: dict[int, list[tuple]] = {}
+        for source_id, row in targets:
+            # Prospects without a source have no candidates to match
+            if source_id:
+                targets_by_source.setdefault(source_id, []).append(row)
+
+        completed = set(scan.completed_sources or [])
+        matches = dict(scan.matches or {})
+        pending = [s for s in targets_by_source if s not in completed]
+        current = len(targets) - sum(len(targets_by_source[s]) for s in pending)
+
+        scan.status = "processing"
+        scan.total = len(targets)
+        scan.current = current
+        scan.message = f"Scanning {len(targets)} prospects for duplicates..."
+        db.session.commit()
+        self._update_progress(
+            scan_id,
+            status="processing",
+            total=len(targets),
+            current=current,
+            message=scan.message,
+        )
+
+        scan_all = scan.scan_limit >= SCAN_ALL_LIMIT
+        for source_id, found in self._scan_sources(
+            scan_id,
+            pending,
+            targets_by_source,
+            scan.min_confidence,
+            scan_all,
+            scan.mode,
+        ):
+            matches.update(found)
+            completed.add(source_id)
+            current += len(targets_by_source[source_id])
+
+            # Checkpoint so the scan can resume after this source
+            scan.completed_sources = sorted(completed)
+            scan.matches = dict(matches)
+            scan.current = current
+            scan.message = f"Processing prospect {current} of {len(targets)}..."
+            db.session.commit()
+            self._update_progress(scan_id, current=current, message=scan.message)
+
+        build_groups = (
+            _build_duplicate_clusters
+            if scan.mode == "clusters"
+            else _build_duplicate_groups
+        )
+        potential_duplicates = build_groups([row[0] for _, row in targets], matches)
+        processing_time = time.time() - start_time
+
+        scan.status = "completed"
+        scan.current = len(targets)
+        scan.message = (
+            f"Scan completed! Found {len(potential_duplicates)} duplicate groups."
+        )
+        scan.completed_at = datetime.now(UTC)
+        scan.matches = None
+        scan.results = {
+            "potential_duplicates": potential_duplicates,
+            "total_found": len(potential_duplicates),
+            "scan_parameters": {
+                "source_id": scan.source_id,
+                "min_confidence": scan.min_confidence,
+                "limit": scan.scan_limit,
+                "mode": scan.mode,
+            },
+            "processing_time": processing_time,
+        }
+        db.session.commit()
+
+        logger.info(
+            f"Scan {scan_id} completed in {processing_time:.2f}s. Found {len(potential_duplicates)} duplicate groups."
+        )
+
+    def _scan_sources(
+        self,
+        scan_id: str,
+        source_ids: list[int],
+        targets_by_source: dict[int, list[tuple]],
+        min_confidence: float,
+        scan_all: bool,
+        mode: str,
+    ):
+        """Yield (source_id, matches) as each source finishes."""
+        if not source_ids:
+            return
+
+        candidates_by_source = {
+            source_id: (
+                targets_by_source[source_id]
+                if scan_all
+                else _load_source_rows(source_id)
+            )
+            for source_id in source_ids
+        }
+        row_count = sum(len(targets_by_source[s]) for s in source_ids)
+        processes = min(active_config.DUPLICATE_SCAN_PROCESSES, len(source_ids))
+
+        if (
+            processes > 1
+            and row_count >= active_config.DUPLICATE_SCAN_PARALLEL_MIN_PROSPECTS
+        ):
+            logger.info(
+                f"Scan {scan_id}: scanning {len(source_ids)} sources in {processes} processes"
+            )
+            with ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        scan_source,
+                        source_id,
+                        targets_by_source[source_id],
+                        candidates_by_source[source_id],
+                        min_confidence,
+                        mode=mode,
+                    ): source_id
+                    for source_id in source_ids
+                }
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            return
+
+        for source_id in source_ids:
+            # Within-source progress is only reported in this thread
+            base = self._progress[scan_id]["current"]
+            yield (
+                source_id,
+                scan_source(
+                    source_id,
+                    targets_by_source[source_id],
+                    candidates_by_source[source_id],
+                    min_confidence,
+                    progress=lambda count: self._advance_progress(scan_id, count),
+                    mode=mode,
+                ),
+            )
+            self._update_progress(
+                scan_id, current=base + len(targets_by_source[source_id])
+            )
+
+
+def _publish_progress(scan_id: str, progress: dict[str, Any]):
+    publish_event(
+        "duplicate_scan",
+        "progress",
+        {
+            "scan_id": scan_id,
+            "status": progress["status"],
+            "current": progress["current"],
+            "total": progress["total"],
+            "message": progress["message"],
+        },
+    )
+
+
+def _load_targets(source_id: int | None, limit: int) -> list[tuple[int, tuple]]:
+    """Load (source_id, row) pairs for the prospects to scan, newest first."""
+    query = db.session.query(
+        Prospect.source_id, *(getattr(Prospect, c) for c in MATCH_COLUMNS)
+    )
+    if source_id:
+        query = query.filter(Prospect.source_id == source_id)
+    query = query.order_by(Prospect.loaded_at.desc())
+    if limit < SCAN_ALL_LIMIT:
+        query = query.limit(limit)
+    return [(row[0], tuple(row[1:])) for row in query]
+
+
+def _load_source_rows(source_id: int) -> list[tuple]:
+    """Load the match columns of every prospect in a source."""
+    query = db.session.query(*(getattr(Prospect, c) for c in MATCH_COLUMNS)).filter(
+        Prospect.source_id == source_id
+    )
+    return [tuple(row) for row in query]
+
+
+def _load_matched_prospects(matches: dict[str, list[dict]]) -> dict[str, Prospect]:
+    """Load every prospect referenced by the stored matches."""
+    needed = set(matches)
+    for found in matches.values():
+        needed.update(match["prospect_id"] for match in found)
+
+    prospects = {}
+    needed = list(needed)
+    for start in range(0, len(needed), 500):
+        chunk = needed[start : start + 500]
+        prospects.update(
+            (p.id, p)
+            for p in db.session.query(Prospect).filter(Prospect.id.in_(chunk)).all()
+        )
+    return prospects
+
+
+def _build_duplicate_groups(
+    target_ids: list[str], matches: dict[str, list[dict]]
+) -> list[dict]:
+    """Format duplicate groups in scan order from the stored matches."""
+    prospects = _load_matched_prospects(matches)
+
+    groups = []
+    for prospect_id in target_ids:
+        if prospect_id in matches and prospect_id in prospects:
+            groups.append(
+                _create_duplicate_group(
+                    prospects[prospect_id],
+                    [MatchCandidate(**match) for match in matches[prospect_id]],
+                    prospects,
+                )
+            )
+    return groups
+
+
+class _UnionFind:
+    """Disjoint sets of prospect ids, merged by size with path halving."""
+
+    def __init__(self):
+        self.parent: dict[str, str] = {}
+        self.size: dict[str, int] = {}
+
+    def find(self, item: str) -> str:
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, first: str, second: str):
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
+
+
+def _build_duplicate_clusters(
+    target_ids: list[str], matches: dict[str, list[dict]]
+) -> list[dict]:
+    """Merge the stored pairwise matches into connected duplicate clusters."""
+    prospects = _load_matched_prospects(matches)
+
+    sets = _UnionFind()
+    edges = []
+    for prospect_id, found in matches.items():
+        for match in found:
+            if prospect_id in prospects and match["prospect_id"] in prospects:
+                sets.union(prospect_id, match["prospect_id"])
+                edges.append((prospect_id, MatchCandidate(**match)))
+
+    clusters: dict[str, list[tuple[str, MatchCandidate]]] = {}
+    for prospect_id, match in edges:
+        clusters.setdefault(sets.find(prospect_id), []).append((prospect_id, match))
+
+    # Clusters are listed in scan order of their earliest member
+    order = {prospect_id: position for position, prospect_id in enumerate(target_ids)}
+    return [
+        _create_duplicate_cluster(cluster_edges, prospects, order)
+        for cluster_edges in sorted(
+            clusters.values(),
+            key=lambda cluster_edges: min(
+                order.get(prospect_id, len(order)) for prospect_id, _ in cluster_edges
+            ),
+        )
+    ]
+
+
+def _create_duplicate_cluster(edges, prospects, order):
+    """Create a duplicate group from the pairwise matches of one cluster.
+
+    The representative is the member with the highest total confidence to the
+    rest of the cluster, preferring AI-processed and then newer prospects.
+    Every other member is listed once with its strongest match, preferring a
+    direct match to the representative.
+    """
+    weights: dict[str, float] = {}
+    for prospect_id, match in edges:
+        for member_id in (prospect_id, match.prospect_id):
+            weights[member_id] = weights.get(member_id, 0.0) + match.confidence_score
+
+    representative_id = max(
+        weights,
+        key=lambda member_id: (
+            weights[member_id],
+            prospects[member_id].ollama_processed_at is not None,
+            -order.get(member_id, len(order)),
+        ),
+    )
+
+    best = {}
+    for prospect_id, match in edges:
+        for member_id, other_id in (
+            (prospect_id, match.prospect_id),
+            (match.prospect_id, prospect_id),
+        ):
+            if member_id == representative_id:
+                continue
+            rank = (other_id == representative_id, match.confidence_score)
+            if member_id not in best or rank > best[member_id][0]:
+                best[member_id] = (rank, match)
+
+    cluster = {
+        "original": _format_prospect_for_api(prospects[representative_id]),
+        "matches": [],
+        "pairs": [
+            {
+                "prospect_ids": [prospect_id, match.prospect_id],
+                "confidence_score": match.confidence_score,
+                "match_type": match.match_type,
+                "matched_fields": match.matched_fields,
+            }
+            for prospect_id, match in edges
+        ],
+    }
+    for member_id, (_, match) in sorted(
+        best.items(), key=lambda item: item[1][0], reverse=True
+    ):
+        match_data = _format_prospect_for_api(prospects[member_id])
+        match_data.update(
+            {
+                "confidence_score": match.confidence_score,
+                "match_type": match.match_type,
+                "matched_fields": match.matched_fields,
+            }
+        )
+        cluster["matches"].append(match_data)
+
+    return cluster
+
+
+def _timestamp(value: datetime | None) -> float | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+# Global instance
+duplicate_scan_service = DuplicateScanService()
@@ -14,7 +14,10 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from app.database.dashboard_summary import refresh_dashboard_summary
 from app.database.models import Prospect, db
+from app.services.enhancement_workers import EnhancementWorkerPool
+from app.services.event_bus import publish_event
 from app.services.llm_service import EnhancementType, llm_service
 from app.utils.logger import logger
 
@@ -39,6 +42,7 @@ class EnhancementProgress:
     started_at: datetime | None = None
     completed_at: datetime | None = None
     errors: list[str] = field(default_factory=list)
+    throughput_per_minute: float = 0.0
 
 
 class MockQueueItem:
@@ -143,6 +147,15 @@ class SimpleEnhancementQueue:
                 time.sleep(1)
                 continue
 
+            # Queue positions of the waiting items moved up as well
+            with self._lock:
+                waiting = [
+                    item
+                    for item in self._individual_queue
+                    if item["status"] == "queued"
+                ]
+            self._publish_items([item_to_process, *waiting])
+
             # Process the item outside the lock, but within app context
             with self._app.app_context():
                 try:
@@ -174,6 +187,7 @@ class SimpleEnhancementQueue:
                             )
                         item_to_process["completed_at"] = time.time()
                         item_to_process["result"] = result
+                    self._publish_items([item_to_process])
 
                 except Exception as e:
                     logger.error(
@@ -183,6 +197,7 @@ class SimpleEnhancementQueue:
                         item_to_process["status"] = "failed"
                         item_to_process["error"] = str(e)
                         item_to_process["completed_at"] = time.time()
+                    self._publish_items([item_to_process])
 
             # Clean up old completed/failed items (older than 5 minutes)
             with self._lock:
@@ -228,18 +243,17 @@ class SimpleEnhancementQueue:
         """Add an enhancement to the queue and return immediately"""
         queue_item_id = f"individual_{prospect_id[:8]}_{int(time.time())}"
 
+        queue_item = {
+            "queue_item_id": queue_item_id,
+            "prospect_id": prospect_id,
+            "enhancement_type": enhancement_type,
+            "user_id": user_id,
+            "force_redo": force_redo,
+            "status": "queued",
+            "created_at": time.time(),
+        }
         with self._lock:
-            self._individual_queue.append(
-                {
-                    "queue_item_id": queue_item_id,
-                    "prospect_id": prospect_id,
-                    "enhancement_type": enhancement_type,
-                    "user_id": user_id,
-                    "force_redo": force_redo,
-                    "status": "queued",
-                    "created_at": time.time(),
-                }
-            )
+            self._individual_queue.append(queue_item)
 
             # Calculate actual queue position (only count queued items)
             queue_position = sum(
@@ -252,6 +266,8 @@ class SimpleEnhancementQueue:
             # Initialize completed steps
             self._completed_steps[prospect_id] = []
 
+        self._publish_items([queue_item])
+
         # Start worker if not running
         self.start_queue_worker()
 
@@ -301,6 +317,7 @@ class SimpleEnhancementQueue:
                     else None
                 ),
                 "errors": self._progress.errors[-10:],  # Keep only last 10 errors
+                "throughput_per_minute": self._progress.throughput_per_minute,
                 "is_processing": self._processing,
                 "pending_items": pending_items,
                 # Reflect actual queue length (queued + processing)
@@ -349,6 +366,15 @@ class SimpleEnhancementQueue:
                         if normalized_field not in self._completed_steps[prospect_id]:
                             self._completed_steps[prospect_id].append(normalized_field)
 
+                with self._lock:
+                    processing = [
+                        item
+                        for item in self._individual_queue
+                        if item["prospect_id"] == prospect_id
+                        and item["status"] == "processing"
+                    ]
+                self._publish_items(processing)
+
                 if status == "processing":
                     message = f"Processing {field}..."
                 else:
@@ -667,6 +693,7 @@ class SimpleEnhancementQueue:
         logger.info(
             f"Started bulk enhancement: {len(prospects)} prospects for {enhancement_type}"
         )
+        self._publish_queue_status()
 
         return {
             "status": "started",
@@ -691,6 +718,7 @@ class SimpleEnhancementQueue:
             self._progress.completed_at = datetime.now(UTC)
 
         self._processing = False
+        self._publish_queue_status()
 
         return {"status": "stopped", "message": "Enhancement processing stopped"}
 
@@ -699,82 +727,104 @@ class SimpleEnhancementQueue:
         """Alias for get_status for backward compatibility"""
         return self.get_status()
 
+    def _queue_item_status(self, queue_item: dict[str, Any]) -> dict[str, Any] | None:
+        """Status of an individual queue item, call with the lock held"""
+        prospect_id = queue_item["prospect_id"]
+
+        if queue_item["status"] == "queued":
+            # Calculate queue position
+            position = 1
+            for idx, item in enumerate(self._individual_queue):
+                if item["status"] == "queued":
+                    if item is queue_item:
+                        break
+                    position += 1
+
+            return {
+                "item_id": queue_item["queue_item_id"],
+                "status": "queued",
+                "position": position,
+                "current_step": None,
+                "completed_steps": [],
+                "error": None,
+            }
+        elif queue_item["status"] == "processing":
+            # Item is currently being processed
+            current_step = None
+            if self._current_enhancement_type:
+                if self._current_enhancement_type == "titles":
+                    current_step = "Enhancing title..."
+                elif self._current_enhancement_type == "values":
+                    current_step = "Parsing contract values..."
+                elif self._current_enhancement_type == "naics":
+                    current_step = "Classifying NAICS code..."
+                elif self._current_enhancement_type == "naics_code":
+                    current_step = "Classifying NAICS code only..."
+                elif self._current_enhancement_type == "naics_description":
+                    current_step = "Adding NAICS descriptions..."
+                elif self._current_enhancement_type == "set_asides":
+                    current_step = "Processing set asides..."
+                else:
+                    current_step = "Processing..."
+
+            return {
+                "item_id": queue_item["queue_item_id"],
+                "status": "processing",
+                "position": None,
+                "current_step": current_step,
+                "completed_steps": self._completed_steps.get(prospect_id, []),
+                "error": None,
+            }
+        elif queue_item["status"] == "completed":
+            return {
+                "item_id": queue_item["queue_item_id"],
+                "status": "completed",
+                "position": None,
+                "current_step": None,
+                "completed_steps": self._completed_steps.get(
+                    prospect_id, ["titles", "values", "naics", "set_asides"]
+                ),
+                "error": None,
+            }
+        elif queue_item["status"] == "failed":
+            return {
+                "item_id": queue_item["queue_item_id"],
+                "status": "failed",
+                "position": None,
+                "current_step": None,
+                "completed_steps": self._completed_steps.get(prospect_id, []),
+                "error": queue_item.get("error", "Unknown error"),
+            }
+        return None
+
+    def _publish_items(self, queue_items: list[dict[str, Any]]):
+        """Publish the status of individual queue items to the event bus"""
+        with self._lock:
+            events = [
+                (queue_item, self._queue_item_status(queue_item))
+                for queue_item in queue_items
+            ]
+        for queue_item, status in events:
+            if status is not None:
+                publish_event(
+                    "enhancement",
+                    "item",
+                    {**status, "prospect_id": queue_item["prospect_id"]},
+                )
+
+    def _publish_queue_status(self):
+        """Publish the overall queue status to the event bus"""
+        publish_event("enhancement", "queue", self.get_status())
+
     def get_item_status(self, item_id: str) -> dict[str, Any]:
         """Get status of a specific item"""
         with self._lock:
             # First check if item is in the queue
             for queue_item in self._individual_queue:
                 if queue_item.get("queue_item_id") == item_id:
-                    prospect_id = queue_item["prospect_id"]
-
-                    if queue_item["status"] == "queued":
-                        # Calculate queue position
-                        position = 1
-                        for idx, item in enumerate(self._individual_queue):
-                            if item["status"] == "queued":
-                                if item["queue_item_id"] == item_id:
-                                    break
-                                position += 1
-
-                        return {
-                            "item_id": item_id,
-                            "status": "queued",
-                            "position": position,
-                            "current_step": None,
-                            "completed_steps": [],
-                            "error": None,
-                        }
-                    elif queue_item["status"] == "processing":
-                        # Item is currently being processed
-                        current_step = None
-                        if self._current_enhancement_type:
-                            if self._current_enhancement_type == "titles":
-                                current_step = "Enhancing title..."
-                            elif self._current_enhancement_type == "values":
-                                current_step = "Parsing contract values..."
-                            elif self._current_enhancement_type == "naics":
-                                current_step = "Classifying NAICS code..."
-                            elif self._current_enhancement_type == "naics_code":
-                                current_step = "Classifying NAICS code only..."
-                            elif self._current_enhancement_type == "naics_description":
-                                current_step = "Adding NAICS descriptions..."
-                            elif self._current_enhancement_type == "set_asides":
-                                current_step = "Processing set asides..."
-                            else:
-                                current_step = "Processing..."
-
-                        return {
-                            "item_id": item_id,
-                            "status": "processing",
-                            "position": None,
-                            "current_step": current_step,
-                            "completed_steps": self._completed_steps.get(
-                                prospect_id, []
-                            ),
-                            "error": None,
-                        }
-                    elif queue_item["status"] == "completed":
-                        return {
-                            "item_id": item_id,
-                            "status": "completed",
-                            "position": None,
-                            "current_step": None,
-                            "completed_steps": self._completed_steps.get(
-                                prospect_id, ["titles", "values", "naics", "set_asides"]
-                            ),
-                            "error": None,
-                        }
-                    elif queue_item["status"] == "failed":
-                        return {
-                            "item_id": item_id,
-                            "status": "failed",
-                            "position": None,
-                            "current_step": None,
-                            "completed_steps": self._completed_steps.get(
-                                prospect_id, []
-                            ),
-                            "error": queue_item.get("error", "Unknown error"),
-                        }
+                    status = self._queue_item_status(queue_item)
+                    if status is not None:
+                        return status
 
             # Extract prospect_id from item_id for backward compatibility
             parts = item_id.split("_")
@@ -964,48 +1014,34 @@ class SimpleEnhancementQueue:
     def _bulk_processing_worker(
         self, prospects: list[Prospect], enhancement_type: EnhancementType
     ):
-        """Worker thread for bulk processing"""
+        """Worker thread for bulk processing, runs the enhancement worker pool"""
         logger.info(f"Bulk processing worker started: {len(prospects)} prospects")
 
-        try:
-            for i, prospect in enumerate(prospects):
-                if self._stop_event.is_set():
-                    logger.info("Bulk processing stopped by user request")
-                    break
-
-                # Update progress
-                with self._lock:
-                    self._progress.current_prospect_id = prospect.id
+        def enhance(prospect):
+            with self._lock:
+                self._progress.current_prospect_id = prospect.id
+            return llm_service.enhance_single_prospect(prospect, enhancement_type)
 
-                try:
-                    results = llm_service.enhance_single_prospect(
-                        prospect, enhancement_type
+        def on_processed(prospect_id, results, error):
+            with self._lock:
+                self._progress.processed = pool.stats.processed
+                self._progress.throughput_per_minute = pool.stats.per_minute
+                if error is not None:
+                    self._progress.errors.append(
+                        f"Prospect {prospect_id[:8]}...: {str(error)}"
                     )
+            self._publish_queue_status()
 
-                    if any(results.values()):
-                        db.session.commit()
-                        logger.debug(
-                            f"Enhanced prospect {prospect.id[:8]}... - {results}"
-                        )
-
-                    with self._lock:
-                        self._progress.processed = i + 1
-
-                except Exception as e:
-                    logger.error(f"Error processing prospect {prospect.id}: {e}")
-                    with self._lock:
-                        self._progress.errors.append(
-                            f"Prospect {prospect.id[:8]}...: {str(e)}"
-                        )
-                        self._progress.processed = i + 1  # Still count as processed
-
-                # Brief pause to prevent overwhelming the system
-                if not self._stop_event.wait(
-                    0.1
-                ):  # 100ms delay, but can be interrupted
-                    continue
-                else:
-                    break
+        try:
+            if self._app is None:
+                raise RuntimeError("No Flask app available for bulk processing")
+            pool = EnhancementWorkerPool(
+                self._app,
+                enhance,
+                stop_event=self._stop_event,
+                on_processed=on_processed,
+            )
+            pool.run([prospect.id for prospect in prospects])
 
             # Mark as completed
             with self._lock:
@@ -1022,6 +1058,13 @@ class SimpleEnhancementQueue:
 
                 self._progress.completed_at = datetime.now(UTC)
 
+            # Rebuild the dashboard summary once for the whole run
+            try:
+                with self._app.app_context():
+                    refresh_dashboard_summary()
+            except Exception as e:
+                logger.warning(f"Could not refresh dashboard summary: {e}")
+
         except Exception as e:
             logger.error(f"Error in bulk processing worker: {e}")
             with self._lock:
@@ -1030,6 +1073,7 @@ class SimpleEnhancementQueue:
                 self._progress.completed_at = datetime.now(UTC)
         finally:
             self._processing = False
+            self._publish_queue_status()
 
 
 # Global instance
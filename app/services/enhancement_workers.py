@@ -0,0 +1,203 @@
+"""Worker pool for bulk LLM enhancement.
+
+Prospects are enhanced by LLM_ENHANCEMENT_WORKERS threads pulling prospect
+ids from a shared queue, so several prompts can be in flight on Ollama at
+once (see OLLAMA_NUM_PARALLEL). Each worker runs in its own app context, and
+so with its own database session, and commits every LLM_COMMIT_BATCH_SIZE
+prospects or as soon as it has written to the database, so SQLite's write
+lock is never held while waiting on the LLM.
+
+Instead of pausing after every prospect, workers back off when Ollama calls
+fail or an enhancement raises, and speed back up as prospects succeed.
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from app.config import active_config
+from app.database import db
+from app.database.models import Prospect
+from app.database.write_generation import has_unsaved_writes
+from app.utils.llm_utils import get_ollama_client
+from app.utils.logger import logger
+
+# Called with a prospect id, its results and the error raised, if any
+ProcessedCallback = Callable[[str, dict[str, bool] | None, Exception | None], None]
+
+
+@dataclass
+class PoolStats:
+    """Counts of a pool run"""
+
+    processed: int = 0
+    enhanced: int = 0
+    errors: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def per_minute(self) -> float:
+        """Prospects processed per minute so far"""
+        elapsed = time.monotonic() - self.started_at
+        return round(self.processed * 60 / elapsed, 1) if elapsed > 0 else 0.0
+
+
+class AdaptiveBackoff:
+    """Delay shared by the workers, doubled on failure and halved on success."""
+
+    def __init__(self, base_seconds: float, max_seconds: float):
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+        self.delay = 0.0
+        self._lock = threading.Lock()
+
+    def failed(self):
+        with self._lock:
+            self.delay = min(max(self.delay * 2, self.base_seconds), self.max_seconds)
+
+    def succeeded(self):
+        with self._lock:
+            self.delay = self.delay / 2 if self.delay / 2 >= self.base_seconds else 0.0
+
+    def wait(self, stop_event: threading.Event) -> bool:
+        """Sleep out the current delay, returns True if stopped meanwhile."""
+        delay = self.delay
+        if delay:
+            return stop_event.wait(delay)
+        return stop_event.is_set()
+
+
+class EnhancementWorkerPool:
+    """Enhance prospects on a pool of worker threads.
+
+    Args:
+        app: Flask app the workers run in
+        enhance: Enhances a prospect, returning the results per field
+        workers: Number of worker threads, defaults to LLM_ENHANCEMENT_WORKERS
+        commit_batch_size: Prospects per commit, defaults to LLM_COMMIT_BATCH_SIZE
+        stop_event: Stops the workers after their current prospect when set
+        on_processed: Called from the worker with the prospect id, its results
+            and the error raised, if any, after each prospect
+    """
+
+    def __init__(
+        self,
+        app,
+        enhance: Callable[[Prospect], dict[str, bool]],
+        workers: int | None = None,
+        commit_batch_size: int | None = None,
+        stop_event: threading.Event | None = None,
+        on_processed: ProcessedCallback | None = None,
+    ):
+        config = active_config
+        self._app = app
+        self._enhance = enhance
+        self.workers = max(1, workers or config.LLM_ENHANCEMENT_WORKERS)
+        self.commit_batch_size = max(
+            1, commit_batch_size or config.LLM_COMMIT_BATCH_SIZE
+        )
+        self._stop_event = stop_event or threading.Event()
+        self._on_processed = on_processed
+        self._backoff = AdaptiveBackoff(
+            config.LLM_BACKOFF_BASE_SECONDS, config.LLM_BACKOFF_MAX_SECONDS
+        )
+        self._queue: queue.Queue[str] = queue.Queue()
+        self._lock = threading.Lock()
+        self.stats = PoolStats()
+
+    def run(self, prospect_ids: list[str]) -> PoolStats:
+        """Enhance the prospects, returning once all are done or stopped."""
+        for prospect_id in prospect_ids:
+            self._queue.put(prospect_id)
+        self.stats = PoolStats()
+
+        threads = [
+            threading.Thread(target=self._worker, name=f"llm-enhance-{i}", daemon=True)
+            for i in range(min(self.workers, len(prospect_ids)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        logger.info(
+            f"Enhancement pool processed {self.stats.processed} prospects "
+            f"({self.stats.enhanced} enhanced, {self.stats.errors} errors) "
+            f"at {self.stats.per_minute} prospects/min with {len(threads)} workers"
+        )
+        return self.stats
+
+    def _worker(self):
+        with self._app.app_context():
+            pending = 0
+            while not self._backoff.wait(self._stop_event):
+                try:
+                    prospect_id = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if self._process(prospect_id):
+                    pending += 1
+                elif not db.session.is_active:
+                    # A failed flush, anything not yet committed is lost
+                    if pending:
+                        logger.warning(f"Discarding {pending} uncommitted enhancements")
+                    db.session.rollback()
+                    pending = 0
+
+                if pending >= self.commit_batch_size or has_unsaved_writes(db.session):
+                    self._commit()
+                    pending = 0
+
+            if pending or has_unsaved_writes(db.session):
+                self._commit()
+
+    def _process(self, prospect_id: str) -> bool:
+        """Enhance one prospect, returns whether anything changed."""
+        client = get_ollama_client()
+        failed_calls = client.failed_calls
+        results, error = None, None
+        prospect = None
+        try:
+            # Changes are flushed on commit, not while waiting on the LLM
+            with db.session.no_autoflush:
+                prospect = db.session.get(Prospect, prospect_id)
+                if prospect is None:
+                    logger.warning(f"Prospect {prospect_id} not found in database")
+                    results = {}
+                else:
+                    results = self._enhance(prospect)
+        except Exception as e:
+            error = e
+            logger.error(f"Error processing prospect {prospect_id}: {e}")
+            if prospect is not None and db.session.is_active:
+                # Drop the failed prospect's changes, keep the rest of the batch
+                db.session.expire(prospect)
+
+        enhanced = bool(results) and any(results.values())
+        if error is not None or client.failed_calls > failed_calls:
+            self._backoff.failed()
+        else:
+            self._backoff.succeeded()
+
+        with self._lock:
+            self.stats.processed += 1
+            self.stats.enhanced += enhanced
+            self.stats.errors += error is not None
+
+        if self._on_processed:
+            try:
+                self._on_processed(prospect_id, results, error)
+            except Exception as e:
+                logger.error(f"Error in enhancement progress callback: {e}")
+        return enhanced
+
+    def _commit(self):
+        try:
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Error committing enhancement batch: {e}")
+            db.session.rollback()
+            self._backoff.failed()
@@ -0,0 +1,166 @@
+"""In-process event bus behind the ``/api/events/stream`` SSE endpoint.
+
+Background work publishes progress here instead of clients polling the
+database for it. Each connected client holds a Subscription to some topics:
+
+- ``enhancement``: queue item transitions and steps, bulk queue progress
+- ``field_update``: prospect fields written by LLM enhancement
+- ``scraper``: scraper status transitions, published once committed
+- ``duplicate_scan``: duplicate scan progress
+
+Events carry increasing ids and the last EVENT_HISTORY_SIZE are kept, so a
+reconnecting EventSource (which sends Last-Event-ID) gets what it missed.
+A client that falls more than SUBSCRIBER_QUEUE_SIZE events behind is sent a
+resync event and should re-read the REST endpoints.
+"""
+
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import event as sa_event
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from app.database.models import ScraperStatus
+from app.utils.json_provider import dumps
+from app.utils.logger import logger
+
+UTC = timezone.utc
+
+TOPICS = ("enhancement", "field_update", "scraper", "duplicate_scan")
+
+EVENT_HISTORY_SIZE = 512
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    topic: str
+    type: str
+    data: dict[str, Any]
+
+    def to_sse(self) -> str:
+        payload = dumps({"type": self.type, **self.data})
+        return f"id: {self.id}\nevent: {self.topic}\ndata: {payload}\n\n"
+
+
+@dataclass(eq=False)
+class Subscription:
+    topics: frozenset[str]
+    events: queue.Queue = field(
+        default_factory=lambda: queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    )
+    # Set when events were dropped because the client fell behind
+    overflowed: bool = False
+
+    def get(self, timeout: float) -> Event | None:
+        """Next event, or None if none arrived within timeout seconds."""
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class EventBus:
+    """Fans published events out to every subscription of their topic."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._history: deque[Event] = deque(maxlen=EVENT_HISTORY_SIZE)
+        self._subscriptions: set[Subscription] = set()
+
+    def publish(self, topic: str, event_type: str, data: dict[str, Any]) -> Event:
+        """Publish an event to the subscribers of topic."""
+        if topic not in TOPICS:
+            raise ValueError(f"Unknown event topic '{topic}'")
+
+        with self._lock:
+            published = Event(self._next_id, topic, event_type, data)
+            self._next_id += 1
+            self._history.append(published)
+            for subscription in self._subscriptions:
+                if topic in subscription.topics:
+                    self._deliver(subscription, published)
+        return published
+
+    def subscribe(
+        self, topics: list[str] | tuple[str, ...], last_event_id: int | None = None
+    ) -> Subscription:
+        """Subscribe to topics, replaying retained events after last_event_id."""
+        subscription = Subscription(frozenset(topics))
+        with self._lock:
+            if last_event_id is not None:
+                for past in self._history:
+                    if past.id > last_event_id and past.topic in subscription.topics:
+                        self._deliver(subscription, past)
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    @staticmethod
+    def _deliver(subscription: Subscription, published: Event):
+        try:
+            subscription.events.put_nowait(published)
+        except queue.Full:
+            subscription.overflowed = True
+
+
+event_bus = EventBus()
+
+
+def publish_event(topic: str, event_type: str, data: dict[str, Any]):
+    """Publish an event, logging instead of raising so callers never fail on it."""
+    try:
+        event_bus.publish(topic, event_type, data)
+    except Exception as e:
+        logger.error(f"Failed to publish {topic} event: {e}")
+
+
+# Scraper status rows are written from several modules, so their transitions
+# are collected on flush and published once the transaction commits.
+_SCRAPER_EVENTS = "scraper_status_events"
+
+
+@sa_event.listens_for(Session, "after_flush")
+def _collect_scraper_transitions(session, flush_context):
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, ScraperStatus):
+            continue
+        if (
+            obj not in session.new
+            and not inspect(obj).attrs.status.history.has_changes()
+        ):
+            continue
+        last_checked = obj.last_checked or datetime.now(UTC)
+        session.info.setdefault(_SCRAPER_EVENTS, []).append(
+            {
+                "source_id": obj.source_id,
+                "status": obj.status,
+                "details": obj.details,
+                "last_checked": last_checked,
+            }
+        )
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _publish_scraper_transitions(session):
+    for data in session.info.pop(_SCRAPER_EVENTS, []):
+        publish_event("scraper", "status", data)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_scraper_transitions(session):
+    session.info.pop(_SCRAPER_EVENTS, None)
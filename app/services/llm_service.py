@@ -10,6 +10,7 @@ import re
 import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import timezone
 
 UTC = timezone.utc
@@ -17,9 +18,13 @@ from datetime import datetime
 from typing import Any, Literal, Optional
 
 import requests
-from flask import has_app_context
+from flask import current_app, has_app_context
+from app.config import active_config
 from app.database import db
 from app.database.models import LLMOutput, Prospect
+from app.database.naics_index import replace_llm_naics_codes
+from app.services.enhancement_workers import EnhancementWorkerPool
+from app.services.event_bus import publish_event
 from app.services.optimized_prompts import (
     get_naics_prompt,
     get_title_prompt,
@@ -29,14 +34,32 @@ from app.services.set_aside_standardization import (
     SetAsideStandardizer,
     StandardSetAside,
 )
-from app.utils.llm_utils import OLLAMA_BASE, call_ollama
+from app.utils.llm_utils import OLLAMA_BASE, cache_llm_response, call_ollama
 from app.utils.logger import logger
-from app.utils.naics_lookup import get_naics_description, validate_naics_code
+from app.utils.naics_lookup import (
+    extract_naics_from_extra,
+    get_naics_description,
+    parse_naics_value,
+    validate_naics_code,
+)
+from app.utils.value_and_date_parsing import parse_value_bounds
 
 EnhancementType = Literal[
     "all", "values", "titles", "naics", "naics_code", "naics_description", "set_asides"
 ]
 
+# Order in which enhance_single_prospect processes fields and reports progress
+FIELD_ORDER = (
+    "titles",
+    "values",
+    "naics",
+    "naics_code",
+    "naics_description",
+    "set_asides",
+)
+# Fields processed for enhancement type "all"
+ALL_FIELDS = ("titles", "values", "naics", "set_asides")
+
 
 class LLMService:
     """Unified LLM service for all contract data enhancement needs.
@@ -56,6 +79,7 @@ class LLMService:
         self.batch_size = batch_size
         self.set_aside_standardizer = SetAsideStandardizer()
         self._app = None  # Flask app reference for context
+        self._emit_callback: Callable | None = None
 
         # For iterative processing
         self._processing = False
@@ -69,9 +93,16 @@ class LLMService:
             "current_prospect": None,
             "started_at": None,
             "errors": [],
+            "throughput_per_minute": 0.0,
         }
         self._lock = threading.Lock()
 
+        # Ollama availability, refreshed by a background heartbeat
+        self._ollama_status: tuple[float, dict[str, Any]] | None = None
+        self._ollama_status_lock = threading.Lock()
+        self._heartbeat_thread: threading.Thread | None = None
+        self._heartbeat_stop = threading.Event()
+
     def set_app(self, app):
         """Set Flask app reference for database context in threads"""
         self._app = app
@@ -106,18 +137,59 @@ class LLMService:
                 "installed_models": installed_models,
             }
         except requests.exceptions.RequestException as exc:
-            logger.warning("Ollama health check failed: %s", exc, exc_info=False)
+            logger.warning(f"Ollama health check failed: {exc}")
             return {
                 "available": False,
                 "error": str(exc),
             }
         except Exception as exc:  # pragma: no cover - defensive catch
-            logger.error("Unexpected error checking Ollama status: %s", exc)
+            logger.error(f"Unexpected error checking Ollama status: {exc}")
             return {
                 "available": False,
                 "error": str(exc),
             }
 
+    def get_ollama_status(self) -> dict[str, Any]:
+        """Last Ollama availability seen by the background heartbeat.
+
+        The first call checks inline and starts the heartbeat, which then
+        re-checks every OLLAMA_HEARTBEAT_SECONDS so status polls never wait on
+        the network. A result older than two intervals (heartbeat stalled) is
+        refreshed inline.
+        """
+        interval = active_config.OLLAMA_HEARTBEAT_SECONDS
+        with self._ollama_status_lock:
+            status = self._ollama_status
+            if status and time.monotonic() - status[0] < 2 * interval:
+                return dict(status[1])
+
+        result = self._record_ollama_status()
+        self._start_ollama_heartbeat()
+        return dict(result)
+
+    def _record_ollama_status(self) -> dict[str, Any]:
+        result = self.check_ollama_status()
+        result["checked_at"] = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        with self._ollama_status_lock:
+            self._ollama_status = (time.monotonic(), result)
+        return result
+
+    def _start_ollama_heartbeat(self):
+        with self._ollama_status_lock:
+            if self._heartbeat_thread and self._heartbeat_thread.is_alive():
+                return
+            self._heartbeat_thread = threading.Thread(
+                target=self._ollama_heartbeat, name="ollama-heartbeat", daemon=True
+            )
+            self._heartbeat_thread.start()
+
+    def _ollama_heartbeat(self):
+        while not self._heartbeat_stop.wait(active_config.OLLAMA_HEARTBEAT_SECONDS):
+            try:
+                self._record_ollama_status()
+            except Exception as exc:  # pragma: no cover - keep the heartbeat alive
+                logger.error(f"Ollama heartbeat failed: {exc}")
+
     # =============================================================================
     # UTILITY FUNCTIONS (from llm_service_utils.py)
     # =============================================================================
@@ -152,20 +224,23 @@ class LLMService:
     def emit_field_update(
         self, prospect_id: str, field_type: str, field_data: dict[str, Any]
     ) -> None:
-        """Emit a real-time field update event for a prospect."""
+        """Emit a real-time field update event for a prospect.
+
+        The update is published on the event bus and passed to the emit
+        callback, if one is set.
+        """
+        update = {
+            "prospect_id": prospect_id,
+            "field_type": field_type,
+            "fields": field_data,
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
+        publish_event("field_update", "field_update", update)
         if not self._emit_callback:
             return
 
         try:
-            self._emit_callback(
-                "field_update",
-                {
-                    "prospect_id": prospect_id,
-                    "field_type": field_type,
-                    "fields": field_data,
-                    "timestamp": datetime.now(UTC).isoformat(),
-                },
-            )
+            self._emit_callback("field_update", update)
         except Exception as e:
             logger.error(f"Failed to emit field update: {e}")
 
@@ -175,150 +250,11 @@ class LLMService:
 
     def parse_existing_naics(self, naics_str: str | None) -> dict[str, str | None]:
         """Parse existing NAICS codes from source data formats and standardize them."""
-        if not naics_str:
-            return {"code": None, "description": None, "standardized_format": None}
-
-        naics_str = str(naics_str).strip()
-
-        # Handle TBD placeholder values from data sources
-        if naics_str.upper() in ["TBD", "TO BE DETERMINED", "N/A", "NA"]:
-            return {"code": None, "description": None, "standardized_format": None}
-
-        # Handle numeric NAICS codes with decimal points (e.g., "336510.0" -> "336510")
-        if re.match(r"^[1-9]\d{5}\.0+$", naics_str):
-            naics_str = naics_str.split(".")[0]
-
-        # Handle different NAICS formats from source data
-        patterns = [
-            (r"(\d{6})\s*\|\s*(.*)", "pipe"),
-            (r"(\d{6})\s*:\s*(.*)", "colon"),
-            (r"(\d{6})\s*-\s*(.*)", "hyphen"),
-            (r"(\d{6})\s+([^0-9].*)", "space"),
-            (r"(\d{6})$", "code_only"),
-        ]
-
-        for pattern, format_type in patterns:
-            match = re.match(pattern, naics_str)
-            if match:
-                code = match.group(1)
-                description = (
-                    match.group(2).strip()
-                    if len(match.groups()) > 1 and match.group(2)
-                    else None
-                )
-
-                if not description:
-                    description = get_naics_description(code)
-
-                standardized_format = f"{code} | {description}" if description else code
-
-                return {
-                    "code": code,
-                    "description": description,
-                    "standardized_format": standardized_format,
-                    "original_format": format_type,
-                }
-
-        # Fallback for unexpected formats
-        description = None
-        if validate_naics_code(naics_str):
-            description = get_naics_description(naics_str)
-
-        standardized_format = (
-            f"{naics_str} | {description}" if description else naics_str
-        )
-
-        return {
-            "code": naics_str,
-            "description": description,
-            "standardized_format": standardized_format,
-            "original_format": "unknown",
-        }
+        return parse_naics_value(naics_str)
 
     def extract_naics_from_extra_field(self, extra_data: Any) -> dict[str, str | None]:
         """Extract NAICS information from the extra field JSON data."""
-        if not extra_data:
-            return {"code": None, "description": None, "found_in_extra": False}
-
-        if isinstance(extra_data, str):
-            try:
-                extra_data = json.loads(extra_data)
-            except (json.JSONDecodeError, TypeError):
-                return {"code": None, "description": None, "found_in_extra": False}
-
-        if not isinstance(extra_data, dict):
-            return {"code": None, "description": None, "found_in_extra": False}
-
-        code = None
-        description = None
-
-        # Check for various NAICS field patterns
-        if "naics_code" in extra_data and extra_data["naics_code"]:
-            potential_code = str(extra_data["naics_code"]).strip()
-            if re.match(r"^\d{6}$", potential_code):
-                code = potential_code
-                description = None
-        elif "primary_naics" in extra_data and extra_data["primary_naics"]:
-            primary_naics = str(extra_data["primary_naics"]).strip()
-            if primary_naics.upper() != "TBD":
-                parsed = self.parse_existing_naics(primary_naics)
-                code = parsed["code"]
-                description = parsed["description"]
-
-        # Fallback: Search for other common NAICS field names
-        if not code:
-            naics_keys = [
-                "naics",
-                "industry_code",
-                "classification",
-                "sector",
-                "naics_primary",
-            ]
-            for key in naics_keys:
-                if key in extra_data and extra_data[key]:
-                    potential_value = str(extra_data[key]).strip()
-
-                    if potential_value.upper() in [
-                        "TBD",
-                        "TO BE DETERMINED",
-                        "N/A",
-                        "NULL",
-                        "",
-                    ]:
-                        continue
-
-                    parsed = self.parse_existing_naics(potential_value)
-                    if parsed["code"]:
-                        code = parsed["code"]
-                        description = parsed["description"]
-                        break
-
-        # Last resort: Search all values for 6-digit numbers
-        if not code:
-            for key, value in extra_data.items():
-                if isinstance(value, (str, int)):
-                    value_str = str(value)
-                    matches = re.findall(r"\b(\d{6})\b", value_str)
-                    for potential_code in matches:
-                        if potential_code[0] in "123456789":
-                            parsed = self.parse_existing_naics(value_str)
-                            if parsed["code"] == potential_code:
-                                code = parsed["code"]
-                                description = parsed["description"]
-                                break
-                            else:
-                                code = potential_code
-                                break
-
-                if code:
-                    break
-
-        found_in_extra = code is not None
-        return {
-            "code": code,
-            "description": description,
-            "found_in_extra": found_in_extra,
-        }
+        return extract_naics_from_extra(extra_data)
 
     def _log_llm_output(
         self,
@@ -445,6 +381,8 @@ class LLMService:
                 "all_codes": processed_codes,
             }
 
+            cache_llm_response(prompt, self.model_name, response)
+
             if prospect_id:
                 self._log_llm_output(
                     prospect_id=prospect_id,
@@ -489,6 +427,22 @@ class LLMService:
                 "all_codes": [],
             }
 
+    def parse_contract_value_with_rules(
+        self, value_text: str
+    ) -> dict[str, float | None] | None:
+        """Parse contract value text without the LLM, None if it is ambiguous.
+
+        Plain amounts and ranges are parsed by parse_value_bounds, in the
+        shape parse_contract_value_with_llm returns.
+        """
+        bounds = parse_value_bounds(value_text)
+        if bounds is None:
+            return None
+        low, high = bounds
+        if low is not None and low == high:
+            return {"single": low, "min": None, "max": None, "confidence": 1.0}
+        return {"single": None, "min": low, "max": high, "confidence": 1.0}
+
     def parse_contract_value_with_llm(
         self, value_text: str, prospect_id: str = None
     ) -> dict[str, float | None]:
@@ -541,6 +495,8 @@ class LLMService:
                 if result[key] is not None and result[key] < 0:
                     result[key] = None
 
+            cache_llm_response(prompt, self.model_name, response)
+
             if prospect_id:
                 self._log_llm_output(
                     prospect_id=prospect_id,
@@ -614,6 +570,8 @@ class LLMService:
                 result["enhanced_title"] = None
                 result["confidence"] = 0.0
 
+            cache_llm_response(prompt, self.model_name, response)
+
             if prospect_id:
                 self._log_llm_output(
                     prospect_id=prospect_id,
@@ -644,6 +602,12 @@ class LLMService:
 
             return {"enhanced_title": None, "confidence": 0.0, "reasoning": ""}
 
+    def standardize_set_aside_with_rules(
+        self, set_aside_text: str
+    ) -> StandardSetAside | None:
+        """Standardize set-aside text naming a standard type exactly, else None."""
+        return self.set_aside_standardizer.match_exact(set_aside_text)
+
     def standardize_set_aside_with_llm(
         self, set_aside_text: str, prospect_id: str = None, prospect: "Prospect" = None
     ) -> StandardSetAside | None:
@@ -759,6 +723,7 @@ class LLMService:
                 logger.info(
                     f"LLM classified set-aside '{set_aside_text}' as {result.code}"
                 )
+                cache_llm_response(prompt, self.model_name, response)
 
                 if prospect_id:
                     self._log_llm_output(
@@ -877,20 +842,191 @@ class LLMService:
     # SINGLE PROSPECT ENHANCEMENT
     # =============================================================================
 
+    def _value_to_parse(self, prospect: Prospect, force_redo: bool) -> str | None:
+        """The contract value text to parse for a prospect, if any."""
+        if prospect.estimated_value_text and (
+            not prospect.estimated_value_single or force_redo
+        ):
+            return prospect.estimated_value_text
+        if prospect.estimated_value and (
+            not prospect.estimated_value_single or force_redo
+        ):
+            return str(prospect.estimated_value)
+        return None
+
+    def _plan_llm_calls(
+        self, prospect: Prospect, fields: list[str], force_redo: bool
+    ) -> dict[str, tuple[tuple, Callable[[], Any]]]:
+        """The LLM calls enhance_single_prospect will make for fields.
+
+        Mirrors the checks of enhance_single_prospect against the prospect as
+        it is before any field is applied. Each call is keyed by the method
+        and arguments enhance_single_prospect will pass, with a callable doing
+        the same work without touching the prospect.
+        """
+        calls = {}
+
+        def plan(field, method, *args, **kwargs):
+            call = (method, args, kwargs)
+            calls[field] = (call, lambda: method(*args, **kwargs))
+
+        if "titles" in fields and prospect.title:
+            if not prospect.ai_enhanced_title or force_redo:
+                plan(
+                    "titles",
+                    self.enhance_title_with_llm,
+                    prospect.title,
+                    prospect.description or "",
+                    prospect.agency or "",
+                    prospect_id=prospect.id,
+                )
+
+        value_to_parse = self._value_to_parse(prospect, force_redo)
+        if (
+            "values" in fields
+            and value_to_parse
+            and self.parse_contract_value_with_rules(value_to_parse) is None
+        ):
+            plan(
+                "values",
+                self.parse_contract_value_with_llm,
+                value_to_parse,
+                prospect_id=prospect.id,
+            )
+
+        if "naics" in fields:
+            naics_field = "naics"
+            pending = not prospect.naics or prospect.naics_source != "llm_inferred"
+        else:
+            naics_field = "naics_code"
+            pending = not prospect.naics
+        if naics_field in fields and prospect.description and (pending or force_redo):
+            # The original NAICS stored before the lookup can be found in it
+            extra = dict(prospect.extra)
+            if prospect.naics and "original_naics" not in extra:
+                extra["original_naics"] = prospect.naics
+            if not self.extract_naics_from_extra_field(extra)["found_in_extra"]:
+                plan(
+                    naics_field,
+                    self.classify_naics_with_llm,
+                    prospect.title,
+                    prospect.description,
+                    prospect_id=prospect.id,
+                    agency=prospect.agency,
+                    contract_type=prospect.contract_type,
+                    set_aside=prospect.set_aside,
+                    estimated_value=prospect.estimated_value_text,
+                )
+
+        if "set_asides" in fields and (
+            not prospect.set_aside_standardized or force_redo
+        ):
+            comprehensive_data = self._get_comprehensive_set_aside_data(
+                prospect.set_aside, prospect
+            )
+            if (
+                comprehensive_data
+                and self.standardize_set_aside_with_rules(comprehensive_data) is None
+            ):
+                call = (
+                    self.standardize_set_aside_with_llm,
+                    (comprehensive_data,),
+                    {"prospect_id": prospect.id, "prospect": prospect},
+                )
+                # Resolve the prospect's set-aside data here rather than in a worker
+                set_aside_text = self._get_comprehensive_set_aside_data(
+                    comprehensive_data, prospect
+                )
+                calls["set_asides"] = (
+                    call,
+                    lambda: self.standardize_set_aside_with_llm(
+                        set_aside_text, prospect_id=prospect.id
+                    ),
+                )
+
+        return calls
+
+    def _start_llm_calls(
+        self, calls: dict[str, tuple[tuple, Callable[[], Any]]]
+    ) -> dict[str, tuple[tuple, Future]]:
+        """Run planned LLM calls concurrently and wait for all of them.
+
+        Workers run in their own app context, so LLM outputs are logged in
+        their own sessions.
+        """
+        app = current_app._get_current_object() if has_app_context() else self._app
+
+        def run(work):
+            if app is None:
+                return work()
+            with app.app_context():
+                return work()
+
+        workers = max(1, min(active_config.LLM_FIELD_WORKERS, len(calls)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="llm-field"
+        ) as executor:
+            started = {
+                field: (call, executor.submit(run, work))
+                for field, (call, work) in calls.items()
+            }
+            wait([future for _, future in started.values()])
+        return started
+
+    @staticmethod
+    def _call_llm(
+        started: dict[str, tuple[tuple, Future]],
+        field: str,
+        method: Callable,
+        *args,
+        **kwargs,
+    ) -> Any:
+        """The result of a started call for field, else of calling method.
+
+        A started call is only used when made with the same arguments.
+        """
+        entry = started.pop(field, None)
+        if entry is not None and entry[0] == (method, args, kwargs):
+            return entry[1].result()
+        return method(*args, **kwargs)
+
+    @staticmethod
+    def _announce_once(progress_callback: Callable) -> Callable:
+        """Wrap progress_callback to pass on one "processing" update per field."""
+        announced = set()
+
+        def callback(update):
+            if update.get("status") == "processing":
+                if update.get("field") in announced:
+                    return
+                announced.add(update.get("field"))
+            progress_callback(update)
+
+        return callback
+
     def enhance_single_prospect(
         self,
         prospect: Prospect,
         enhancement_type: EnhancementType = "all",
         progress_callback: Callable | None = None,
         force_redo: bool = False,
+        concurrent: bool | None = None,
     ) -> dict[str, bool]:
         """Process all enhancements for a single prospect.
 
+        In concurrent mode the title, value, NAICS and set-aside prompts are
+        sent to the LLM at once and their results applied to the prospect in
+        field order once all have returned, so an enhancement takes about as
+        long as its slowest prompt. Every field is reported as processing
+        up front, and completed in field order.
+
         Args:
             prospect: The prospect to enhance
             enhancement_type: Type of enhancement to perform
             progress_callback: Optional callback for progress updates
             force_redo: If True, re-process even if fields already exist
+            concurrent: Send the prompts concurrently, defaults to
+                LLM_CONCURRENT_FIELDS
 
         Returns:
             Dict with enhancement results for each type
@@ -923,6 +1059,30 @@ class LLMService:
         else:
             enhancement_types = [enhancement_type]
 
+        started = {}
+        if concurrent is None:
+            concurrent = active_config.LLM_CONCURRENT_FIELDS
+        if concurrent:
+            fields = [
+                field
+                for field in FIELD_ORDER
+                if field in enhancement_types
+                or ("all" in enhancement_types and field in ALL_FIELDS)
+            ]
+            calls = self._plan_llm_calls(prospect, fields, force_redo)
+            if len(calls) > 1:
+                if progress_callback:
+                    progress_callback = self._announce_once(progress_callback)
+                    for field in fields:
+                        progress_callback(
+                            {
+                                "status": "processing",
+                                "field": field,
+                                "prospect_id": prospect.id,
+                            }
+                        )
+                started = self._start_llm_calls(calls)
+
         # Process title enhancement FIRST (to match frontend order)
         if "titles" in enhancement_types or "all" in enhancement_types:
             logger.info(f"LLM Service: Processing titles for {prospect.id[:8]}...")
@@ -936,7 +1096,10 @@ class LLMService:
                 )
 
             if prospect.title and (not prospect.ai_enhanced_title or force_redo):
-                enhanced_title = self.enhance_title_with_llm(
+                enhanced_title = self._call_llm(
+                    started,
+                    "titles",
+                    self.enhance_title_with_llm,
                     prospect.title,
                     prospect.description or "",
                     prospect.agency or "",
@@ -981,29 +1144,30 @@ class LLMService:
                     }
                 )
 
-            value_to_parse = None
-            if prospect.estimated_value_text and (
-                not prospect.estimated_value_single or force_redo
-            ):
-                value_to_parse = prospect.estimated_value_text
-            elif prospect.estimated_value and (
-                not prospect.estimated_value_single or force_redo
-            ):
-                value_to_parse = str(prospect.estimated_value)
+            value_to_parse = self._value_to_parse(prospect, force_redo)
 
             logger.debug(
                 f"LLM Service: Value to parse for {prospect.id[:8]}: {value_to_parse}"
             )
 
             if value_to_parse:
+                # Plain amounts and ranges are parsed without the LLM
+                parsed_value = self.parse_contract_value_with_rules(value_to_parse)
+                value_source = "rule"
+                if parsed_value is None:
+                    logger.info(
+                        f"LLM Service: Calling parse_contract_value_with_llm for {prospect.id[:8]}..."
+                    )
+                    parsed_value = self._call_llm(
+                        started,
+                        "values",
+                        self.parse_contract_value_with_llm,
+                        value_to_parse,
+                        prospect_id=prospect.id,
+                    )
+                    value_source = "llm"
                 logger.info(
-                    f"LLM Service: Calling parse_contract_value_with_llm for {prospect.id[:8]}..."
-                )
-                parsed_value = self.parse_contract_value_with_llm(
-                    value_to_parse, prospect_id=prospect.id
-                )
-                logger.info(
-                    f"LLM Service: Received parsed value for {prospect.id[:8]}: {parsed_value}"
+                    f"LLM Service: Received parsed value for {prospect.id[:8]} ({value_source}): {parsed_value}"
                 )
                 # Handle both single values and ranges
                 if parsed_value["single"] is not None or (
@@ -1038,6 +1202,12 @@ class LLMService:
 
                     if not prospect.estimated_value_text:
                         prospect.estimated_value_text = value_to_parse
+
+                    prospect.extra["value_parsing"] = {
+                        "source": value_source,
+                        "parsed_text": value_to_parse,
+                        "parsed_at": datetime.now(UTC).isoformat(),
+                    }
                     results["values"] = True
             else:
                 logger.debug(f"LLM Service: No value to parse for {prospect.id[:8]}")
@@ -1098,7 +1268,10 @@ class LLMService:
                     results["naics"] = True
                 else:
                     # Use LLM classification
-                    classification = self.classify_naics_with_llm(
+                    classification = self._call_llm(
+                        started,
+                        "naics",
+                        self.classify_naics_with_llm,
                         prospect.title,
                         prospect.description,
                         prospect_id=prospect.id,
@@ -1112,6 +1285,9 @@ class LLMService:
                         prospect.naics = classification["code"]
                         prospect.naics_description = classification["description"]
                         prospect.naics_source = "llm_inferred"
+                        replace_llm_naics_codes(
+                            db.session, prospect.id, classification["all_codes"]
+                        )
 
                         prospect.extra["llm_classification"] = {
                             "naics_confidence": classification["confidence"],
@@ -1162,7 +1338,10 @@ class LLMService:
                     results["naics"] = True
                 else:
                     # Use LLM classification for code
-                    classification = self.classify_naics_with_llm(
+                    classification = self._call_llm(
+                        started,
+                        "naics_code",
+                        self.classify_naics_with_llm,
                         prospect.title,
                         prospect.description,
                         prospect_id=prospect.id,
@@ -1176,6 +1355,9 @@ class LLMService:
                         prospect.naics = classification["code"]
                         # For code-only mode, we do NOT set the description
                         prospect.naics_source = "llm_inferred"
+                        replace_llm_naics_codes(
+                            db.session, prospect.id, classification["all_codes"]
+                        )
                         results["naics"] = True
 
             # Emit completion callback
@@ -1276,9 +1458,21 @@ class LLMService:
                     prospect.set_aside, prospect
                 )
                 if comprehensive_data:
-                    standardized = self.standardize_set_aside_with_llm(
-                        comprehensive_data, prospect_id=prospect.id, prospect=prospect
+                    # Texts naming a standard type exactly skip the LLM
+                    standardized = self.standardize_set_aside_with_rules(
+                        comprehensive_data
                     )
+                    set_aside_source = "rule"
+                    if standardized is None:
+                        standardized = self._call_llm(
+                            started,
+                            "set_asides",
+                            self.standardize_set_aside_with_llm,
+                            comprehensive_data,
+                            prospect_id=prospect.id,
+                            prospect=prospect,
+                        )
+                        set_aside_source = "llm"
                     if standardized:
                         prospect.set_aside_standardized = standardized.code
                         prospect.set_aside_standardized_label = standardized.label
@@ -1286,6 +1480,7 @@ class LLMService:
                         prospect.extra["set_aside_standardization"] = {
                             "original_set_aside": prospect.set_aside,
                             "comprehensive_data_used": comprehensive_data,
+                            "source": set_aside_source,
                             "standardized_at": datetime.now(UTC).isoformat(),
                         }
                         results["set_asides"] = True
@@ -1454,6 +1649,8 @@ class LLMService:
                     "current_prospect": None,
                     "started_at": datetime.now(UTC).isoformat(),
                     "errors": [],
+                    "error_count": 0,
+                    "throughput_per_minute": 0.0,
                 }
             )
 
@@ -1542,63 +1739,48 @@ class LLMService:
     def _process_with_context(
         self, prospects: list[Prospect], enhancement_type: EnhancementType
     ):
-        """Process prospects within Flask app context"""
-        # Import db for thread use
-        from app.database import db as thread_db
-
-        try:
-            error_count = 0
-            MAX_STORED_ERRORS = 10  # Only keep last 10 errors to prevent memory issues
-
-            for i, prospect in enumerate(prospects):
-                if self._stop_event.is_set():
-                    break
-
-                with self._lock:
-                    self._progress["current_prospect"] = prospect.id
-
-                try:
-                    # Re-query the prospect in this thread's session
-                    prospect = thread_db.session.get(Prospect, prospect.id)
-                    if not prospect:
-                        logger.error(f"Prospect {prospect.id} not found in database")
-                        continue
-
-                    results = self.enhance_single_prospect(prospect, enhancement_type)
+        """Process prospects within Flask app context, on the enhancement worker pool"""
+        MAX_STORED_ERRORS = 10  # Only keep last 10 errors to prevent memory issues
 
-                    if any(results.values()):
-                        thread_db.session.commit()
-                        self.emit_field_update(prospect.id, enhancement_type, results)
+        def enhance(prospect):
+            with self._lock:
+                self._progress["current_prospect"] = prospect.id
+            return self.enhance_single_prospect(prospect, enhancement_type)
 
-                    with self._lock:
-                        self._progress["processed"] = i + 1
+        def on_processed(prospect_id, results, error):
+            if results and any(results.values()):
+                self.emit_field_update(prospect_id, enhancement_type, results)
 
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"Error processing prospect {prospect.id}: {e}")
-                    with self._lock:
-                        # Keep only the last MAX_STORED_ERRORS errors
-                        if len(self._progress["errors"]) >= MAX_STORED_ERRORS:
-                            self._progress["errors"].pop(0)
-                        self._progress["errors"].append(
-                            {
-                                "prospect_id": prospect.id,
-                                "error": str(e),
-                                "timestamp": datetime.now(UTC).isoformat(),
-                            }
-                        )
-                        # Add error count to progress
-                        self._progress["error_count"] = error_count
+            with self._lock:
+                self._progress["processed"] = pool.stats.processed
+                self._progress["throughput_per_minute"] = pool.stats.per_minute
+                if error is not None:
+                    # Keep only the last MAX_STORED_ERRORS errors
+                    if len(self._progress["errors"]) >= MAX_STORED_ERRORS:
+                        self._progress["errors"].pop(0)
+                    self._progress["errors"].append(
+                        {
+                            "prospect_id": prospect_id,
+                            "error": str(error),
+                            "timestamp": datetime.now(UTC).isoformat(),
+                        }
+                    )
+                    # Add error count to progress
+                    self._progress["error_count"] = pool.stats.errors
+
+        pool = EnhancementWorkerPool(
+            current_app._get_current_object(),
+            enhance,
+            stop_event=self._stop_event,
+            on_processed=on_processed,
+        )
 
-                # Adjust delay based on enhancement type
-                # Description-only is very fast (just lookups), so minimal delay
-                if enhancement_type == "naics_description":
-                    time.sleep(0.01)  # 10ms delay for description lookups
-                else:
-                    time.sleep(0.1)  # 100ms delay for LLM operations
+        try:
+            stats = pool.run([prospect.id for prospect in prospects])
 
             # Mark as completed
             with self._lock:
+                self._progress["throughput_per_minute"] = stats.per_minute
                 if not self._stop_event.is_set():
                     self._progress["status"] = "completed"
                 else:
@@ -1615,11 +1797,6 @@ class LLMService:
                     }
                 )
         finally:
-            # Clean up the database session
-            try:
-                thread_db.session.remove()
-            except:
-                pass  # Session might not exist
             self._processing = False
 
 
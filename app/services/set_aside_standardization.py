@@ -2,6 +2,7 @@
 This service provides mapping and LLM-based classification of set-aside types.
 """
 
+import re
 from enum import Enum
 
 
@@ -28,12 +29,112 @@ class StandardSetAside(Enum):
         return self.value
 
 
+# Set-aside texts that name exactly one standard type, after normalization.
+# Anything not listed, including combinations, is left to the LLM.
+_EXACT_SET_ASIDES = {
+    StandardSetAside.SMALL_BUSINESS: [
+        "small business",
+        "small business set aside",
+        "small business set aside total",
+        "total small business",
+        "total small business set aside",
+        "sb",
+        "sba",
+        "sdb",
+        "small disadvantaged business",
+    ],
+    StandardSetAside.EIGHT_A: [
+        "8a",
+        "8a set aside",
+        "8a competitive",
+        "8a sole source",
+        "8a program",
+    ],
+    StandardSetAside.HUBZONE: [
+        "hubzone",
+        "hub zone",
+        "hubzone set aside",
+        "hubzone small business",
+    ],
+    StandardSetAside.WOMEN_OWNED: [
+        "wosb",
+        "edwosb",
+        "women owned",
+        "women owned small business",
+        "wosb set aside",
+        "wosb sole source",
+        "edwosb sole source",
+        "economically disadvantaged women owned small business",
+    ],
+    StandardSetAside.VETERAN_OWNED: [
+        "sdvosb",
+        "vosb",
+        "veteran owned",
+        "veteran owned small business",
+        "service disabled veteran owned",
+        "service disabled veteran owned small business",
+        "sdvosb set aside",
+        "sdvosb sole source",
+    ],
+    StandardSetAside.FULL_AND_OPEN: [
+        "full and open",
+        "full and open competition",
+        "unrestricted",
+        "open competition",
+    ],
+    StandardSetAside.SOLE_SOURCE: ["sole source"],
+    StandardSetAside.NOT_AVAILABLE: [
+        "n a",
+        "na",
+        "none",
+        "tbd",
+        "to be determined",
+        "unknown",
+        "not available",
+        "currently not available",
+    ],
+}
+_NORMALIZE_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _normalize(text: str) -> str:
+    """Lowercase text, with punctuation and spacing collapsed to single spaces.
+
+    Parentheses are dropped rather than spaced, so "8(a)" reads as "8a".
+    """
+    text = re.sub(r"[()']", "", text.lower())
+    return _NORMALIZE_RE.sub(" ", text).strip()
+
+
+_EXACT_LOOKUP = {
+    _normalize(alias): set_aside
+    for set_aside, aliases in _EXACT_SET_ASIDES.items()
+    for alias in [set_aside.value, *aliases]
+}
+# Field labels _get_comprehensive_set_aside_data puts before each value
+_FIELD_LABEL_RE = re.compile(r"^(?:set-aside|small business program):\s*", re.I)
+
+
 class SetAsideStandardizer:
-    """Simplified service for LLM-based set-aside classification"""
+    """Set-aside classification, by exact match or by LLM"""
 
     def __init__(self):
         """Initialize the standardizer - no complex rules needed for LLM approach"""
 
+    def match_exact(self, set_aside_text: str) -> StandardSetAside | None:
+        """The standard type a set-aside text names exactly, if any.
+
+        Texts combining several fields ("Set-aside: X; Small Business
+        Program: Y") match when every field names the same type.
+        """
+        matches = {
+            _EXACT_LOOKUP.get(_normalize(_FIELD_LABEL_RE.sub("", part.strip())))
+            for part in (set_aside_text or "").split(";")
+        }
+        if len(matches) == 1:
+            return matches.pop()
+        return None
+
     def get_llm_prompt(self) -> str:
         """Get the enhanced LLM prompt for set-aside classification"""
         standard_types = [e.value for e in StandardSetAside]
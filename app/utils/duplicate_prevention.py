@@ -4,19 +4,32 @@ This module provides sophisticated matching strategies to prevent duplicates
 when source data changes titles, descriptions, or other identifying fields.
 """
 
-import difflib
 import hashlib
+import re
+from collections import Counter
 from dataclasses import dataclass
-from functools import lru_cache
 
+import pandas as pd
+from sqlalchemy import case, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from app.config import active_config
+from app.database.count_cache import mark_prospects_changed
 from app.database.models import Prospect
+from app.database.naics_index import sync_prospect_naics
 from app.utils.logger import get_logger
+from app.utils.text_similarity import text_similarity
 
 logger = get_logger("utils.duplicate_prevention")
 
+# Dialects with a native INSERT ... ON CONFLICT upsert
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# Bound parameters per upsert statement, kept below the limits of SQLite
+# (32766) and PostgreSQL (65535)
+UPSERT_MAX_PARAMS = 30000
+
 
 @dataclass
 class MatchCandidate:
@@ -41,6 +54,170 @@ class MatchingStrategy:
     optional_fields: list[str]
 
 
+# Title tokens too common to narrow fuzzy candidates on their own
+_TITLE_STOPWORDS = frozenset({"and", "for", "the", "with", "from", "into"})
+_TITLE_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _title_tokens(title) -> set[str]:
+    """Normalized title tokens used as fuzzy matching blocking keys."""
+    if not title:
+        return set()
+    return {
+        token
+        for token in _TITLE_TOKEN_RE.findall(str(title).lower())
+        if len(token) >= 3 and token not in _TITLE_STOPWORDS
+    }
+
+
+def _location_key(prefix, city, state) -> str | None:
+    """Blocking key for a value + case-insensitive city/state location."""
+    if not (prefix and city and state):
+        return None
+    return f"{prefix}|{city.lower()}|{state.lower()}"
+
+
+class CandidateIndex:
+    """In-memory blocking index over the prospects of a single source.
+
+    Each matching strategy only scores the prospects sharing its blocking key
+    (native_id, NAICS + location, agency + location or a title token) instead
+    of querying the database per record.
+    """
+
+    # Mirrors the row limit of the unindexed fuzzy content query
+    FUZZY_BLOCK_LIMIT = 1000
+
+    def __init__(self, prospects=()):
+        self.by_id: dict[str, Prospect] = {}
+        self.by_native_id: dict[str, dict[str, Prospect]] = {}
+        self.by_naics_location: dict[str, dict[str, Prospect]] = {}
+        self.by_agency_location: dict[str, dict[str, Prospect]] = {}
+        self.by_title_token: dict[str, dict[str, Prospect]] = {}
+        self._keys: dict[str, list[tuple[dict, str]]] = {}
+        for prospect in prospects:
+            self.add(prospect)
+
+    @classmethod
+    def from_cache(cls, cache: dict) -> "CandidateIndex":
+        """Build an index from the older dict-of-blocks cache layout."""
+        prospects = {}
+        for blocks in cache.values():
+            groups = blocks.values() if isinstance(blocks, dict) else [blocks]
+            for group in groups:
+                prospects.update((p.id, p) for p in group)
+        return cls(prospects.values())
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def add(self, prospect: Prospect):
+        """Index a prospect, replacing the keys of an earlier version."""
+        self.remove(prospect.id)
+        keys = [
+            (self.by_native_id, prospect.native_id),
+            (
+                self.by_naics_location,
+                _location_key(
+                    prospect.naics, prospect.place_city, prospect.place_state
+                ),
+            ),
+            (
+                self.by_agency_location,
+                _location_key(
+                    prospect.agency, prospect.place_city, prospect.place_state
+                ),
+            ),
+        ]
+        keys.extend(
+            (self.by_title_token, token) for token in _title_tokens(prospect.title)
+        )
+        keys = [(block, key) for block, key in keys if key]
+        for block, key in keys:
+            block.setdefault(key, {})[prospect.id] = prospect
+        self._keys[prospect.id] = keys
+        self.by_id[prospect.id] = prospect
+
+    def remove(self, prospect_id: str):
+        """Drop a prospect from every block it was indexed under."""
+        for block, key in self._keys.pop(prospect_id, ()):
+            members = block.get(key)
+            if members is not None:
+                members.pop(prospect_id, None)
+                if not members:
+                    del block[key]
+        self.by_id.pop(prospect_id, None)
+
+    def native_id_candidates(self, native_id) -> list[Prospect]:
+        return list(self.by_native_id.get(native_id, {}).values())
+
+    def naics_location_candidates(self, naics, city, state) -> list[Prospect]:
+        key = _location_key(naics, city, state)
+        return list(self.by_naics_location.get(key, {}).values())
+
+    def agency_location_candidates(self, agency, city, state) -> list[Prospect]:
+        key = _location_key(agency, city, state)
+        return list(self.by_agency_location.get(key, {}).values())
+
+    def title_candidates(self, title) -> list[Prospect]:
+        """Prospects sharing a title token, skipping overly common tokens.
+
+        At most FUZZY_BLOCK_LIMIT prospects are returned, keeping those that
+        share the most tokens with title.
+        """
+        tokens = _title_tokens(title)
+        if not tokens:
+            # Nothing to block on, fall back to a bounded scan
+            return list(self.by_id.values())[: self.FUZZY_BLOCK_LIMIT]
+
+        blocks = [
+            self.by_title_token[token]
+            for token in tokens
+            if token in self.by_title_token
+        ]
+        if not blocks:
+            return []
+        selective = [block for block in blocks if len(block) <= self.FUZZY_BLOCK_LIMIT]
+        if not selective:
+            smallest = min(blocks, key=len)
+            return list(smallest.values())[: self.FUZZY_BLOCK_LIMIT]
+
+        # Keep the prospects sharing the most tokens when the blocks add up
+        # to more than the limit
+        shared = Counter()
+        for block in selective:
+            shared.update(block.keys())
+        if len(shared) > self.FUZZY_BLOCK_LIMIT:
+            ids = [pid for pid, _ in shared.most_common(self.FUZZY_BLOCK_LIMIT)]
+        else:
+            ids = shared
+        return [self.by_id[prospect_id] for prospect_id in ids]
+
+    def candidate_pairs(self, prospect_ids=None):
+        """Yield each pair of prospects sharing a blocking key exactly once.
+
+        Pairs are (lower id, higher id). With prospect_ids, only pairs
+        involving one of those prospects are generated. Title tokens too
+        common for title_candidates are skipped here as well.
+        """
+        seen = set()
+        for prospect_id in self.by_id if prospect_ids is None else prospect_ids:
+            for block, key in self._keys.get(prospect_id, ()):
+                members = block[key]
+                if (
+                    block is self.by_title_token
+                    and len(members) > self.FUZZY_BLOCK_LIMIT
+                ):
+                    continue
+                for other_id in members:
+                    if other_id == prospect_id:
+                        continue
+                    pair = tuple(sorted((prospect_id, other_id)))
+                    if pair not in seen:
+                        seen.add(pair)
+                        yield pair
+
+
 class DuplicateDetector:
     """Advanced duplicate detection with multiple fallback strategies."""
 
@@ -90,47 +267,36 @@ class DuplicateDetector:
             ),
         ]
 
-    def preload_source_prospects(self, session: Session, source_id: int):
-        """Pre-load all prospects for a source to optimize batch processing."""
-        if self._cache_source_id != source_id:
-            # Load all prospects for this source into memory
-            self._prospects_cache = {}
-            prospects = (
-                session.query(Prospect).filter(Prospect.source_id == source_id).all()
-            )
-
-            # Create indexes for fast lookup
-            self._prospects_cache["by_native_id"] = {}
-            self._prospects_cache["by_naics_location"] = {}
-            self._prospects_cache["by_agency_location"] = {}
-            self._prospects_cache["all"] = []
-
-            for p in prospects:
-                # Index by native_id
-                if p.native_id:
-                    if p.native_id not in self._prospects_cache["by_native_id"]:
-                        self._prospects_cache["by_native_id"][p.native_id] = []
-                    self._prospects_cache["by_native_id"][p.native_id].append(p)
-
-                # Index by NAICS + location
-                if p.naics and p.place_city and p.place_state:
-                    key = f"{p.naics}|{p.place_city.lower()}|{p.place_state.lower()}"
-                    if key not in self._prospects_cache["by_naics_location"]:
-                        self._prospects_cache["by_naics_location"][key] = []
-                    self._prospects_cache["by_naics_location"][key].append(p)
-
-                # Index by agency + location
-                if p.agency and p.place_city and p.place_state:
-                    key = f"{p.agency}|{p.place_city.lower()}|{p.place_state.lower()}"
-                    if key not in self._prospects_cache["by_agency_location"]:
-                        self._prospects_cache["by_agency_location"][key] = []
-                    self._prospects_cache["by_agency_location"][key].append(p)
-
-                # Store all prospects for fuzzy matching
-                self._prospects_cache["all"].append(p)
+    def preload_source_prospects(
+        self, session: Session, source_id: int, prospects: list | None = None
+    ):
+        """Pre-load all prospects for a source to optimize batch processing.
 
+        Prospects already loaded by the caller (any objects with the Prospect
+        matching attributes) can be passed in to skip the query.
+        """
+        if (
+            self._cache_source_id != source_id
+            or self._prospects_cache is None
+            or prospects is not None
+        ):
+            # Load all prospects for this source into a blocking index
+            if prospects is None:
+                prospects = (
+                    session.query(Prospect)
+                    .filter(Prospect.source_id == source_id)
+                    .all()
+                )
+            self._prospects_cache = CandidateIndex(prospects)
             self._cache_source_id = source_id
             logger.info(f"Pre-loaded {len(prospects)} prospects for source {source_id}")
+        return self._prospects_cache
+
+    def _candidate_index(self) -> CandidateIndex | None:
+        """Return the preloaded index, adopting a plain dict of blocks."""
+        if isinstance(self._prospects_cache, dict):
+            self._prospects_cache = CandidateIndex.from_cache(self._prospects_cache)
+        return self._prospects_cache
 
     def find_potential_matches(
         self, session: Session, new_record: dict, source_id: int
@@ -155,6 +321,22 @@ class DuplicateDetector:
         unique_candidates = self._deduplicate_candidates(all_candidates)
         return sorted(unique_candidates, key=lambda x: x.confidence_score, reverse=True)
 
+    def score_pair(
+        self, new_record: dict, candidate, source_id: int
+    ) -> MatchCandidate | None:
+        """Score a record against one prospect with every strategy.
+
+        Used by all-pairs clustering, which generates its own candidate pairs
+        from the blocking index and scores each of them once.
+        """
+        cached = self._prospects_cache
+        self._prospects_cache = CandidateIndex([candidate])
+        try:
+            matches = self.find_potential_matches(None, new_record, source_id)
+        finally:
+            self._prospects_cache = cached
+        return matches[0] if matches else None
+
     def _apply_strategy(
         self,
         session: Session,
@@ -166,8 +348,10 @@ class DuplicateDetector:
         candidates = []
 
         try:
-            # Build base query
-            query = session.query(Prospect).filter(Prospect.source_id == source_id)
+            # Build base query, not needed when an index is preloaded
+            query = None
+            if self._candidate_index() is None:
+                query = session.query(Prospect).filter(Prospect.source_id == source_id)
 
             # Validate required fields exist in new_record
             for field in strategy.required_fields:
@@ -213,9 +397,10 @@ class DuplicateDetector:
         if not native_id:
             return []
 
-        # Use cache if available
-        if self._prospects_cache and "by_native_id" in self._prospects_cache:
-            matches = self._prospects_cache["by_native_id"].get(native_id, [])
+        # Use index if available
+        index = self._candidate_index()
+        if index is not None:
+            matches = index.native_id_candidates(native_id)
         else:
             matches = query.filter(Prospect.native_id == native_id).all()
         candidates = []
@@ -359,9 +544,10 @@ class DuplicateDetector:
         if not native_id or not new_title:
             return []
 
-        # Use cache if available
-        if self._prospects_cache and "by_native_id" in self._prospects_cache:
-            matches = self._prospects_cache["by_native_id"].get(native_id, [])
+        # Use index if available
+        index = self._candidate_index()
+        if index is not None:
+            matches = index.native_id_candidates(native_id)
         else:
             matches = query.filter(Prospect.native_id == native_id).all()
         candidates = []
@@ -370,7 +556,11 @@ class DuplicateDetector:
             if not match.title:
                 continue
 
-            title_similarity = self._calculate_text_similarity(new_title, match.title)
+            title_similarity = self._calculate_text_similarity(
+                new_title,
+                match.title,
+                active_config.DUPLICATE_TITLE_SIMILARITY_THRESHOLD,
+            )
             if title_similarity >= active_config.DUPLICATE_TITLE_SIMILARITY_THRESHOLD:
                 # Base confidence from native_id match (40%) + title similarity contribution
                 confidence = 0.4 + (title_similarity * 0.6 * strategy.weight)
@@ -402,10 +592,10 @@ class DuplicateDetector:
         if not all([naics, city, state, new_title]):
             return []
 
-        # Use cache if available
-        if self._prospects_cache and "by_naics_location" in self._prospects_cache:
-            key = f"{naics}|{city.lower()}|{state.lower()}"
-            matches = self._prospects_cache["by_naics_location"].get(key, [])
+        # Use index if available
+        index = self._candidate_index()
+        if index is not None:
+            matches = index.naics_location_candidates(naics, city, state)
         else:
             # Use case-insensitive matching for location
             matches = query.filter(
@@ -419,7 +609,9 @@ class DuplicateDetector:
             if not match.title:
                 continue
 
-            title_similarity = self._calculate_text_similarity(new_title, match.title)
+            title_similarity = self._calculate_text_similarity(
+                new_title, match.title, 0.6
+            )
             if title_similarity >= 0.6:  # 60% title similarity for this strategy
                 # Base confidence for NAICS+location match (60%) + title similarity contribution
                 confidence = 0.6 * strategy.weight + (
@@ -454,10 +646,10 @@ class DuplicateDetector:
         if not all([agency, city, state]) or not (new_title or new_desc):
             return []
 
-        # Use cache if available
-        if self._prospects_cache and "by_agency_location" in self._prospects_cache:
-            key = f"{agency}|{city.lower()}|{state.lower()}"
-            matches = self._prospects_cache["by_agency_location"].get(key, [])
+        # Use index if available
+        index = self._candidate_index()
+        if index is not None:
+            matches = index.agency_location_candidates(agency, city, state)
         else:
             # Use case-insensitive matching for location
             matches = query.filter(
@@ -472,10 +664,12 @@ class DuplicateDetector:
             desc_sim = 0
 
             if match.title and new_title:
-                title_sim = self._calculate_text_similarity(new_title, match.title)
+                title_sim = self._calculate_text_similarity(new_title, match.title, 0.8)
 
             if match.description and new_desc:
-                desc_sim = self._calculate_text_similarity(new_desc, match.description)
+                desc_sim = self._calculate_text_similarity(
+                    new_desc, match.description, 0.8
+                )
 
             # Require high similarity in at least one content field
             max_content_sim = max(title_sim, desc_sim)
@@ -513,10 +707,10 @@ class DuplicateDetector:
         if not new_title:
             return []
 
-        # Use cache if available, otherwise limit query
-        if self._prospects_cache and "all" in self._prospects_cache:
-            # Use first 1000 cached prospects to avoid O(n^2) complexity
-            matches = self._prospects_cache["all"][:1000]
+        # Use the title token blocks if indexed, otherwise limit query
+        index = self._candidate_index()
+        if index is not None:
+            matches = index.title_candidates(new_title)
         else:
             # Limit to recent records to avoid false positives
             matches = query.filter(Prospect.title.isnot(None)).limit(1000).all()
@@ -526,7 +720,9 @@ class DuplicateDetector:
             if not match.title:
                 continue
 
-            title_sim = self._calculate_text_similarity(new_title, match.title)
+            title_sim = self._calculate_text_similarity(
+                new_title, match.title, active_config.DUPLICATE_FUZZY_CONTENT_THRESHOLD
+            )
 
             # Very high title similarity required for content-only matching
             if title_sim >= active_config.DUPLICATE_FUZZY_CONTENT_THRESHOLD:
@@ -557,43 +753,11 @@ class DuplicateDetector:
 
         return candidates
 
-    @lru_cache(maxsize=10000)
-    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
+    def _calculate_text_similarity(
+        self, text1: str, text2: str, threshold: float = 0.0
+    ) -> float:
         """Calculate similarity between two text strings with caching."""
-        # Handle None values explicitly
-        if text1 is None or text2 is None:
-            return 0.0
-
-        # Convert to strings and check if empty
-        text1_str = str(text1).strip()
-        text2_str = str(text2).strip()
-
-        if not text1_str or not text2_str:
-            return 0.0
-
-        # Normalize texts
-        text1_norm = text1_str.lower()
-        text2_norm = text2_str.lower()
-
-        if text1_norm == text2_norm:
-            return 1.0
-
-        # Handle very short strings (less than 3 characters)
-        if len(text1_norm) < 3 or len(text2_norm) < 3:
-            # For very short strings, check if one is contained in the other
-            # This helps with cases like "IT" vs "I.T." or "AI" vs "A.I."
-            if text1_norm in text2_norm or text2_norm in text1_norm:
-                return 0.9  # High similarity for contained short strings
-            # Check without punctuation
-            text1_alpha = "".join(c for c in text1_norm if c.isalnum())
-            text2_alpha = "".join(c for c in text2_norm if c.isalnum())
-            if text1_alpha == text2_alpha and text1_alpha:
-                return 0.95  # Very high similarity for same alphanumeric content
-            return 1.0 if text1_norm == text2_norm else 0.0
-
-        # Use difflib for sequence matching
-        similarity = difflib.SequenceMatcher(None, text1_norm, text2_norm).ratio()
-        return similarity
+        return text_similarity(text1, text2, threshold)
 
     def _deduplicate_candidates(
         self, candidates: list[MatchCandidate]
@@ -619,7 +783,7 @@ def enhanced_bulk_upsert_prospects(
     """Enhanced bulk upsert with advanced duplicate detection.
 
     Args:
-        df_in: DataFrame containing prospect data
+        df_in: DataFrame or list of record dicts containing prospect data
         session: SQLAlchemy session
         source_id: ID of the data source (optional, will extract from data if not provided)
         preserve_ai_data: Whether to preserve AI-enhanced fields
@@ -628,8 +792,14 @@ def enhanced_bulk_upsert_prospects(
     Returns:
         Dictionary with processing statistics
     """
-    if df_in.empty:
-        logger.info("DataFrame is empty, skipping database insertion.")
+    # Records prepared by crud.dataframe_to_records are used as-is
+    if isinstance(df_in, pd.DataFrame):
+        records = df_in.to_dict(orient="records")
+    else:
+        records = df_in
+
+    if not records:
+        logger.info("No records to upsert, skipping database insertion.")
         return {
             "processed": 0,
             "matched": 0,
@@ -639,14 +809,11 @@ def enhanced_bulk_upsert_prospects(
         }
 
     # Extract source_id from data if not provided
-    if source_id is None and not df_in.empty:
-        source_id = df_in.iloc[0].get("source_id")
+    if source_id is None:
+        source_id = records[0].get("source_id")
         if source_id is None:
             logger.warning("No source_id found in data, smart matching will be limited")
 
-    # Convert DataFrame to list of dicts
-    records = df_in.to_dict(orient="records")
-
     # Remove duplicates within the batch
     records = _remove_batch_duplicates(records)
 
@@ -665,18 +832,29 @@ def enhanced_bulk_upsert_prospects(
             session, records, source_id, preserve_ai_data, stats
         )
 
-    # Smart matching enabled - use row-by-row processing
+    # Smart matching enabled - match records against a per-source index
     detector = DuplicateDetector()
+    index = detector.preload_source_prospects(session, source_id)
 
     for record_data in records:
-        stats["processed"] += 1
+        record_data["id"] = _generate_primary_hash(record_data, source_id)
+
+    # Primary IDs stored under another source are not in the index
+    unindexed_ids = [r["id"] for r in records if r["id"] not in index.by_id]
+    existing_by_id = dict(index.by_id)
+    for start in range(0, len(unindexed_ids), 500):
+        chunk = unindexed_ids[start : start + 500]
+        existing_by_id.update(
+            (p.id, p)
+            for p in session.query(Prospect).filter(Prospect.id.in_(chunk)).all()
+        )
 
-        # Generate primary hash ID
-        primary_id = _generate_primary_hash(record_data, source_id)
-        record_data["id"] = primary_id
+    for record_data in records:
+        stats["processed"] += 1
+        primary_id = record_data["id"]
 
         # Check for exact primary match first
-        existing_prospect = session.query(Prospect).filter_by(id=primary_id).first()
+        existing_prospect = existing_by_id.get(primary_id)
 
         if existing_prospect:
             # Direct match found
@@ -687,13 +865,16 @@ def enhanced_bulk_upsert_prospects(
                 _update_all_fields(existing_prospect, record_data)
             stats["matched"] += 1
             stats["updated"] += 1  # Backward compatibility
+            if existing_prospect.source_id == source_id:
+                index.add(existing_prospect)
 
-        elif enable_smart_matching:
+        else:
             # No exact match, try advanced matching
             potential_matches = detector.find_potential_matches(
                 session, record_data, source_id
             )
 
+            existing_prospect = None
             if (
                 potential_matches
                 and potential_matches[0].confidence_score
@@ -701,36 +882,32 @@ def enhanced_bulk_upsert_prospects(
             ):
                 # High-confidence match found
                 best_match = potential_matches[0]
-                existing_prospect = (
-                    session.query(Prospect).filter_by(id=best_match.prospect_id).first()
-                )
-
-                if existing_prospect:
-                    logger.info(
-                        f"Smart match found: {best_match.match_type} confidence={best_match.confidence_score:.2f}"
-                    )
+                existing_prospect = index.by_id.get(best_match.prospect_id)
 
-                    if preserve_ai_data and existing_prospect.ollama_processed_at:
-                        _update_preserving_ai_fields(existing_prospect, record_data)
-                        stats["ai_preserved"] += 1
-                    else:
-                        _update_all_fields(existing_prospect, record_data)
+            if existing_prospect:
+                logger.info(
+                    f"Smart match found: {best_match.match_type} confidence={best_match.confidence_score:.2f}"
+                )
 
-                    stats["duplicates_prevented"] += 1
-                    stats["matched"] += 1
-                    stats["updated"] += 1  # Backward compatibility
+                # The update moves the prospect to the record's primary ID
+                index.remove(existing_prospect.id)
+                if preserve_ai_data and existing_prospect.ollama_processed_at:
+                    _update_preserving_ai_fields(existing_prospect, record_data)
+                    stats["ai_preserved"] += 1
                 else:
-                    # Insert as new
-                    _insert_new_prospect(session, record_data)
-                    stats["inserted"] += 1
+                    _update_all_fields(existing_prospect, record_data)
+
+                stats["duplicates_prevented"] += 1
+                stats["matched"] += 1
+                stats["updated"] += 1  # Backward compatibility
+                existing_by_id[existing_prospect.id] = existing_prospect
+                index.add(existing_prospect)
             else:
                 # No good match, insert as new
-                _insert_new_prospect(session, record_data)
+                existing_prospect = _insert_new_prospect(session, record_data)
                 stats["inserted"] += 1
-        else:
-            # Smart matching disabled, insert as new
-            _insert_new_prospect(session, record_data)
-            stats["inserted"] += 1
+                existing_by_id[primary_id] = existing_prospect
+                index.add(existing_prospect)
 
     try:
         session.commit()
@@ -776,7 +953,11 @@ def _batch_upsert_without_smart_matching(
     preserve_ai_data: bool,
     stats: dict,
 ) -> dict:
-    """Optimized batch upsert when smart matching is disabled."""
+    """Optimized batch upsert when smart matching is disabled.
+
+    Emits chunked ``INSERT ... ON CONFLICT(id) DO UPDATE`` statements on SQLite
+    and PostgreSQL. Dialects without a native upsert use the ORM path.
+    """
     logger.info(f"Performing batch upsert for {len(records)} records")
 
     # Generate IDs for all records
@@ -784,6 +965,124 @@ def _batch_upsert_without_smart_matching(
         if "id" not in record or not record["id"]:
             record["id"] = _generate_primary_hash(record, source_id or 0)
 
+    insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if insert is None:
+        return _batch_upsert_with_orm(
+            session, records, source_id, preserve_ai_data, stats
+        )
+
+    # Generated IDs can collide within a batch; keep the first like
+    # _remove_batch_duplicates does
+    unique_records = {}
+    for record in records:
+        if record.get("id"):
+            unique_records.setdefault(record["id"], record)
+
+    if not unique_records:
+        logger.warning("No valid IDs found in records")
+        return stats
+
+    # One multi-row statement needs the same columns on every row
+    table = Prospect.__table__
+    groups = {}
+    for record in unique_records.values():
+        columns = tuple(key for key in record if key in table.c)
+        groups.setdefault(columns, []).append(
+            {column: record[column] for column in columns}
+        )
+
+    statements = 0
+    try:
+        for columns, rows in groups.items():
+            chunk_size = max(1, UPSERT_MAX_PARAMS // len(columns))
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                existing_ids, ai_processed = _existing_prospects(
+                    session, [row["id"] for row in chunk]
+                )
+                existing = len(existing_ids)
+                session.execute(
+                    _build_upsert_statement(insert, chunk, columns, preserve_ai_data)
+                )
+                statements += 1
+
+                # Index NAICS codes from the stored rows, which may keep AI data
+                sync_prospect_naics(
+                    session,
+                    session.execute(
+                        select(Prospect.id, Prospect.naics, Prospect.extra).where(
+                            Prospect.id.in_([row["id"] for row in chunk])
+                        )
+                    ).all(),
+                    new_ids=[
+                        row["id"] for row in chunk if row["id"] not in existing_ids
+                    ],
+                )
+
+                stats["matched"] += existing
+                stats["updated"] += existing  # Backward compatibility
+                stats["inserted"] += len(chunk) - existing
+                if preserve_ai_data:
+                    stats["ai_preserved"] += ai_processed
+
+        stats["processed"] = len(records)
+        session.commit()
+        logger.info(f"Batch upsert completed in {statements} statements: {stats}")
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Error during batch upsert: {e}")
+        raise
+
+    return stats
+
+
+def _existing_prospects(session: Session, ids: list[str]) -> tuple[set[str], int]:
+    """Stored prospects among ids, and how many have AI enhancements."""
+    table = Prospect.__table__
+    rows = session.execute(
+        select(table.c.id, table.c.ollama_processed_at.isnot(None)).where(
+            table.c.id.in_(ids)
+        )
+    ).all()
+    return {row[0] for row in rows}, sum(1 for row in rows if row[1])
+
+
+def _build_upsert_statement(
+    insert, rows: list[dict], columns: tuple[str, ...], preserve_ai_data: bool
+):
+    """Build an INSERT ... ON CONFLICT(id) statement for rows.
+
+    When preserving AI data, AI_PRESERVED_FIELDS keep their stored values on
+    rows that have already been processed by the LLM.
+    """
+    table = Prospect.__table__
+    stmt = insert(table).values(rows)
+    ai_processed = table.c.ollama_processed_at.isnot(None)
+
+    set_ = {}
+    for column in columns:
+        if column == "id":
+            continue
+        if preserve_ai_data and column in active_config.AI_PRESERVED_FIELDS:
+            set_[column] = case(
+                (ai_processed, table.c[column]), else_=stmt.excluded[column]
+            )
+        else:
+            set_[column] = stmt.excluded[column]
+
+    if not set_:
+        return stmt.on_conflict_do_nothing(index_elements=[table.c.id])
+    return stmt.on_conflict_do_update(index_elements=[table.c.id], set_=set_)
+
+
+def _batch_upsert_with_orm(
+    session: Session,
+    records: list[dict],
+    source_id: int,
+    preserve_ai_data: bool,
+    stats: dict,
+) -> dict:
+    """Batch upsert through the ORM for dialects without ON CONFLICT."""
     # Extract all IDs
     ids_to_upsert = [r["id"] for r in records if r.get("id")]
 
@@ -821,6 +1120,8 @@ def _batch_upsert_without_smart_matching(
     if records_to_insert:
         # Use bulk_insert_mappings for better performance
         session.bulk_insert_mappings(Prospect, records_to_insert)
+        # Bulk inserts skip the flush events that invalidate cached counts
+        mark_prospects_changed(session)
         logger.info(f"Bulk inserted {len(records_to_insert)} new records")
 
     stats["processed"] = len(records)
@@ -878,3 +1179,4 @@ def _insert_new_prospect(session: Session, record_data: dict):
     """Insert a new prospect record."""
     new_prospect = Prospect(**record_data)
     session.add(new_prospect)
+    return new_prospect
@@ -0,0 +1,99 @@
+"""JSON provider for API responses.
+
+Responses are serialized with orjson when it is installed and with the
+standard library otherwise, producing the same output either way:
+
+- Decimals become strings, keeping their precision
+- Dates become ISO dates (``2025-01-31``)
+- Datetimes become ISO timestamps, naive ones are taken as UTC and UTC is
+  written as ``Z``
+
+Models can therefore return these values as they are from to_dict.
+"""
+
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+UTC = timezone.utc
+
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NAIVE_UTC
+        | orjson.OPT_UTC_Z
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_SORT_KEYS
+    )
+
+
+def _isoformat(value: date) -> str:
+    if not isinstance(value, datetime):
+        return value.isoformat()
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _default(value: Any) -> Any:
+    """Encode the types neither encoder handles natively."""
+    if isinstance(value, date):
+        return _isoformat(value)
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    if hasattr(value, "item"):
+        # numpy and pandas scalars
+        return value.item()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> str:
+    """Serialize value to compact JSON with sorted keys."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(
+        value,
+        default=_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider serializing through dumps.
+
+    Calls with encoder options (such as ``indent``) and the pretty-printed
+    responses of debug mode use the standard library, with the same handling
+    of Decimals, dates and datetimes.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            kwargs.setdefault("default", _default)
+            kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+            kwargs.setdefault("sort_keys", self.sort_keys)
+            return json.dumps(obj, **kwargs)
+        return dumps(obj)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(obj)
+        return self._app.response_class(f"{dumps(obj)}\n", mimetype=self.mimetype)
@@ -0,0 +1,215 @@
+"""Persistent cache of LLM responses.
+
+Responses are stored in their own SQLite file (LLM_CACHE_PATH), keyed by a
+hash of the model, the prompt and its options, so a prompt built from the same
+template and inputs is answered without another inference. The prompt
+includes the template, so editing a template misses the cache by itself;
+bump CACHE_VERSION to drop every entry when responses are handled
+differently. Only responses their caller could parse are stored, see
+app.utils.llm_utils.cache_llm_response.
+
+Entries expire after LLM_CACHE_TTL_DAYS, and the least recently used ones are
+evicted beyond LLM_CACHE_MAX_ENTRIES. Storage errors are logged and treated as
+misses, the cache never fails a call.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from app.config import active_config
+from app.utils.logger import logger
+
+CACHE_VERSION = 1
+
+# Expired and surplus entries are pruned once every this many stores
+_PRUNE_EVERY = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_llm_responses_used_at ON llm_responses (used_at);
+"""
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def cache_key(
+    model_name: str, prompt: str, options: dict[str, Any] | None = None
+) -> str:
+    """Key of a prompt, ignoring differences in whitespace."""
+    normalized = _WHITESPACE_RE.sub(" ", prompt).strip()
+    parts = [
+        str(CACHE_VERSION),
+        model_name,
+        json.dumps(options or {}, sort_keys=True),
+        normalized,
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed cache of LLM responses, safe to share between threads."""
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+    ):
+        config = active_config
+        self.path = path or config.LLM_CACHE_PATH
+        self.ttl_seconds = (
+            config.LLM_CACHE_TTL_DAYS * 86400 if ttl_seconds is None else ttl_seconds
+        )
+        self.max_entries = max_entries or config.LLM_CACHE_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+        self._stores = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """The cache's connection, call with the lock held."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(
+        self, model_name: str, prompt: str, options: dict[str, Any] | None = None
+    ) -> str | None:
+        """The cached response to a prompt, or None."""
+        key = cache_key(model_name, prompt, options)
+        now = time.time()
+        response = None
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT response FROM llm_responses "
+                    "WHERE key = ? AND created_at > ?",
+                    (key, now - self.ttl_seconds),
+                ).fetchone()
+                if row:
+                    response = row[0]
+                    with conn:
+                        conn.execute(
+                            "UPDATE llm_responses SET used_at = ? WHERE key = ?",
+                            (now, key),
+                        )
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache read failed: {e}")
+
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def put(
+        self,
+        model_name: str,
+        prompt: str,
+        response: str,
+        options: dict[str, Any] | None = None,
+    ):
+        """Store the response to a prompt."""
+        key = cache_key(model_name, prompt, options)
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                with conn:
+                    # Storing a cached response again keeps its age
+                    conn.execute(
+                        "INSERT INTO llm_responses "
+                        "(key, model, response, created_at, used_at) "
+                        "VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT (key) DO UPDATE SET "
+                        "created_at = CASE WHEN response = excluded.response "
+                        "THEN created_at ELSE excluded.created_at END, "
+                        "response = excluded.response, used_at = excluded.used_at",
+                        (key, model_name, response, now, now),
+                    )
+                self._stores += 1
+                if self._stores % _PRUNE_EVERY == 0:
+                    self._prune(conn, now)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed: {e}")
+
+    def _prune(self, conn: sqlite3.Connection, now: float):
+        """Drop expired entries and the least recently used beyond the limit."""
+        with conn:
+            conn.execute(
+                "DELETE FROM llm_responses WHERE created_at <= ?",
+                (now - self.ttl_seconds,),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM llm_responses WHERE key IN ("
+                    "SELECT key FROM llm_responses ORDER BY used_at LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            try:
+                with self._connection() as conn:
+                    conn.execute("DELETE FROM llm_responses")
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache clear failed: {e}")
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Hits and misses since startup, and the number of stored entries."""
+        with self._lock:
+            try:
+                (entries,) = (
+                    self._connection()
+                    .execute("SELECT COUNT(*) FROM llm_responses")
+                    .fetchone()
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache count failed: {e}")
+                entries = None
+            lookups = self.hits + self.misses
+            return {
+                "enabled": active_config.LLM_CACHE_ENABLED,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": entries,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache: LLMResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """The process-wide LLM response cache, created on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache()
+        return _cache
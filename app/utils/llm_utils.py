@@ -1,9 +1,15 @@
 import json
 import os
+import random
+import threading
+import time
 from typing import Any
 
 import requests  # Or potentially use 'import ollama' if using the official client
+from requests.adapters import HTTPAdapter
 
+from app.config import active_config
+from app.utils.llm_cache import get_llm_cache
 from app.utils.logger import logger
 
 # --- Configuration ---
@@ -16,101 +22,233 @@ OLLAMA_BASE_URL = (
     if not OLLAMA_BASE.endswith("/api/generate")
     else OLLAMA_BASE
 )
-# Default timeout for the API request in seconds
-DEFAULT_TIMEOUT = 240  # Adjust as needed, inference can be slow (Increased from 120)
 
-# --- Main Ollama Interaction Function ---
 
+class _RetryableError(Exception):
+    """A timed out or 5xx call, worth another attempt."""
 
-def call_ollama(
-    prompt: str, model_name: str, options: dict[str, Any] | None = None
-) -> str | None:
-    """Calls the Ollama /api/generate endpoint to get a completion for the given prompt.
 
-    Args:
-        prompt: The input prompt for the LLM.
-        model_name: The name of the Ollama model to use (e.g., 'llama3:8b').
-        options: Optional dictionary of Ollama parameters (e.g., temperature, top_p).
+class OllamaClient:
+    """HTTP client for the Ollama /api/generate endpoint.
 
-    Returns:
-        The generated text content as a string, or None if an error occurs.
+    Calls share one requests.Session, so they reuse kept-alive connections
+    from a pool of OLLAMA_POOL_SIZE instead of opening one per prompt.
+    Timed out calls and 5xx responses are retried up to OLLAMA_MAX_RETRIES
+    times with jittered exponential backoff. Unreachable servers and other
+    errors are not retried.
+
+    Settings default to the active config and can be overridden per client.
     """
-    logger.debug(
-        f"Attempting to call Ollama model '{model_name}' at {OLLAMA_BASE_URL}..."
-    )
-
-    # 1. Construct the request payload
-    # Ensure 'stream' is set to False to get the full response at once.
-    payload = {
-        "model": model_name,
-        "prompt": prompt,
-        "stream": False,
-        "options": options if options else {},  # Add any custom options if provided
-    }
-
-    # 2. Make the HTTP POST request
-    try:
-        # --- Replace with actual API call ---
-        # Example using 'requests' library:
-        response = requests.post(
-            OLLAMA_BASE_URL,
-            headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=DEFAULT_TIMEOUT,
+
+    def __init__(
+        self,
+        generate_url: str = OLLAMA_BASE_URL,
+        pool_size: int | None = None,
+        connect_timeout: float | None = None,
+        timeout: float | None = None,
+        max_retries: int | None = None,
+        backoff_seconds: float | None = None,
+        keep_alive: str | None = None,
+    ):
+        config = active_config
+        self.generate_url = generate_url
+        self.pool_size = pool_size or config.OLLAMA_POOL_SIZE
+        self.connect_timeout = connect_timeout or config.OLLAMA_CONNECT_TIMEOUT_SECONDS
+        self.timeout = timeout or config.OLLAMA_TIMEOUT_SECONDS
+        self.max_retries = (
+            config.OLLAMA_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self.backoff_seconds = (
+            config.OLLAMA_RETRY_BACKOFF_SECONDS
+            if backoff_seconds is None
+            else backoff_seconds
+        )
+        self.keep_alive = keep_alive or config.OLLAMA_KEEP_ALIVE
+        self.failed_calls = 0  # Calls that returned None, after any retries
+        self._lock = threading.Lock()
+
+        self._session = requests.Session()
+        self._session.headers["Content-Type"] = "application/json"
+        # Threads block for a free connection instead of opening extra ones
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_size, pool_block=True
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self):
+        """Close the pooled connections."""
+        self._session.close()
+
+    def generate(
+        self,
+        prompt: str,
+        model_name: str,
+        options: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> str | None:
+        """Get a completion for prompt from model_name.
+
+        Args:
+            prompt: The input prompt for the LLM.
+            model_name: The name of the Ollama model to use (e.g., 'llama3:8b').
+            options: Optional dictionary of Ollama parameters (e.g., temperature, top_p).
+            timeout: Read timeout of each attempt, defaults to the client's.
+
+        Returns:
+            The generated text content as a string, or None if an error occurs.
+        """
+        logger.debug(
+            f"Attempting to call Ollama model '{model_name}' at {self.generate_url}..."
         )
 
-        # Example using 'ollama' library:
-        # client = ollama.Client() # Consider initializing the client outside if calling repeatedly
-        # response_data = client.generate(model=model_name, prompt=prompt, stream=False, options=options)
-        # --- End API call example ---
+        # Ensure 'stream' is set to False to get the full response at once.
+        payload = {
+            "model": model_name,
+            "prompt": prompt,
+            "stream": False,
+            "options": options if options else {},
+        }
+        if self.keep_alive:
+            payload["keep_alive"] = self.keep_alive
+
+        timeouts = (self.connect_timeout, timeout or self.timeout)
+        text = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                text = self._post(payload, model_name, timeouts)
+                break
+            except _RetryableError as e:
+                if attempt == self.max_retries:
+                    logger.warning(
+                        f"Ollama call failed after {attempt + 1} attempts. "
+                        f"Skipping LLM enhancement. Error: {e}"
+                    )
+                    break
+                delay = self.backoff_seconds * 2**attempt
+                delay = random.uniform(delay / 2, delay)
+                logger.debug(f"Retrying Ollama call in {delay:.2f}s: {e}")
+                time.sleep(delay)
+
+        if text is None:
+            with self._lock:
+                self.failed_calls += 1
+        return text
+
+    def _post(
+        self, payload: dict, model_name: str, timeouts: tuple[float, float]
+    ) -> str | None:
+        """Make one attempt, raising _RetryableError for timeouts and 5xx."""
+        try:
+            response = self._session.post(
+                self.generate_url, json=payload, timeout=timeouts
+            )
+        except requests.exceptions.ConnectionError as e:
+            # Raised for connect timeouts too, checked first as they subclass it
+            if isinstance(e, requests.exceptions.ConnectTimeout):
+                raise _RetryableError(f"connect timed out: {e}") from e
+            logger.warning(
+                f"Ollama service unavailable at {self.generate_url}. LLM enhancement disabled. Error: {e}"
+            )
+            # Return None to indicate service unavailable - calling code should handle gracefully
+            return None
+        except requests.exceptions.Timeout as e:
+            raise _RetryableError(f"timed out after {timeouts[1]} seconds: {e}") from e
+        except requests.exceptions.RequestException as e:
+            logger.warning(
+                f"Ollama API request failed. LLM enhancement skipped. Error: {e}"
+            )
+            return None
 
-        # 3. Check HTTP status code (if using requests)
-        response.raise_for_status()  # Raises HTTPError for bad responses (4xx or 5xx)
+        if response.status_code >= 500:
+            raise _RetryableError(f"status {response.status_code}: {response.text}")
 
-        # 4. Parse the JSON response
-        response_data = response.json()
+        try:
+            response.raise_for_status()  # 4xx, not worth retrying
+            response_data = response.json()
+        except requests.exceptions.HTTPError as e:
+            logger.warning(
+                f"Ollama API request failed. Status: {response.status_code}. LLM enhancement skipped. Error: {e}"
+            )
+            return None
+        except json.JSONDecodeError as e:
+            logger.error(
+                f"JSON Decode Error: Failed to parse Ollama response. Response text: {response.text}. Error: {e}"
+            )
+            return None
 
-        # 5. Extract the generated text
-        # The actual generated text is usually in the 'response' key for stream=False
+        # The generated text is in the 'response' key for stream=False
         generated_text = response_data.get("response")
-
         if generated_text:
             logger.debug(
                 f"Ollama response received successfully for model '{model_name}'."
             )
             return generated_text.strip()
-        else:
-            logger.warning(
-                f"Ollama response for model '{model_name}' did not contain expected 'response' field. Full response: {response_data}"
-            )
-            return None
 
-    # 6. Handle Potential Errors
-    except requests.exceptions.ConnectionError as e:
-        logger.warning(
-            f"Ollama service unavailable at {OLLAMA_BASE_URL}. LLM enhancement disabled. Error: {e}"
-        )
-        # Return None to indicate service unavailable - calling code should handle gracefully
-        return None
-    except requests.exceptions.Timeout as e:
-        logger.warning(
-            f"Ollama request timed out after {DEFAULT_TIMEOUT} seconds. Skipping LLM enhancement. Error: {e}"
-        )
-        return None
-    except (
-        requests.exceptions.RequestException
-    ) as e:  # Catch other requests errors (like HTTPError)
         logger.warning(
-            f"Ollama API request failed. Status: {e.response.status_code if e.response else 'N/A'}. LLM enhancement skipped. Error: {e}"
+            f"Ollama response for model '{model_name}' did not contain expected 'response' field. Full response: {response_data}"
         )
         return None
-    except json.JSONDecodeError as e:
-        logger.error(
-            f"JSON Decode Error: Failed to parse Ollama response. Response text: {response.text}. Error: {e}"
-        )
-        return None
-    # Add error handling specific to the 'ollama' library if using that
-    # except ollama.ResponseError as e: ...
+
+
+_client: OllamaClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_ollama_client() -> OllamaClient:
+    """The process-wide Ollama client, created on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OllamaClient()
+        return _client
+
+
+# --- Main Ollama Interaction Function ---
+
+
+def call_ollama(
+    prompt: str,
+    model_name: str,
+    options: dict[str, Any] | None = None,
+    use_cache: bool = True,
+) -> str | None:
+    """Calls the Ollama /api/generate endpoint to get a completion for the given prompt.
+
+    Goes through the shared OllamaClient, see get_ollama_client. Responses
+    are served from the LLM response cache when it is enabled, see
+    app.utils.llm_cache; callers store the ones they could parse with
+    cache_llm_response, so a malformed reply is not replayed.
+
+    Args:
+        prompt: The input prompt for the LLM.
+        model_name: The name of the Ollama model to use (e.g., 'llama3:8b').
+        options: Optional dictionary of Ollama parameters (e.g., temperature, top_p).
+        use_cache: Set to False to always ask the model.
+
+    Returns:
+        The generated text content as a string, or None if an error occurs.
+    """
+    cache = get_llm_cache() if use_cache and active_config.LLM_CACHE_ENABLED else None
+    if cache is not None:
+        cached = cache.get(model_name, prompt, options)
+        if cached is not None:
+            logger.debug(f"LLM cache hit for model '{model_name}'")
+            return cached
+
+    try:
+        return get_ollama_client().generate(prompt, model_name, options)
     except Exception as e:
         logger.error(f"Unexpected Error during Ollama call: {e}", exc_info=True)
         return None
+
+
+def cache_llm_response(
+    prompt: str,
+    model_name: str,
+    response: str | None,
+    options: dict[str, Any] | None = None,
+):
+    """Store a response from call_ollama once its caller has parsed it."""
+    if response and active_config.LLM_CACHE_ENABLED:
+        get_llm_cache().put(model_name, prompt, response, options)
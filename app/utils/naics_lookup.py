@@ -2,6 +2,12 @@
 Provides standardized NAICS descriptions based on official NAICS 2022 codes
 """
 
+import json
+import re
+from typing import Any
+
+import pandas as pd
+
 from app.utils.logger import logger
 
 # NAICS 2022 Complete Lookup Table
@@ -785,3 +791,212 @@ def get_naics_info(naics_code: str) -> dict[str, str | None]:
         "description": description,
         "valid": description is not None,
     }
+
+
+def parse_naics_value(naics_str: str | None) -> dict[str, str | None]:
+    """Parse a NAICS code from source data formats and standardize it."""
+    if not naics_str:
+        return {"code": None, "description": None, "standardized_format": None}
+
+    naics_str = str(naics_str).strip()
+
+    # Handle TBD placeholder values from data sources
+    if naics_str.upper() in ["TBD", "TO BE DETERMINED", "N/A", "NA"]:
+        return {"code": None, "description": None, "standardized_format": None}
+
+    # Handle numeric NAICS codes with decimal points (e.g., "336510.0" -> "336510")
+    if re.match(r"^[1-9]\d{5}\.0+$", naics_str):
+        naics_str = naics_str.split(".")[0]
+
+    # Handle different NAICS formats from source data
+    patterns = [
+        (r"(\d{6})\s*\|\s*(.*)", "pipe"),
+        (r"(\d{6})\s*:\s*(.*)", "colon"),
+        (r"(\d{6})\s*-\s*(.*)", "hyphen"),
+        (r"(\d{6})\s+([^0-9].*)", "space"),
+        (r"(\d{6})$", "code_only"),
+    ]
+
+    for pattern, format_type in patterns:
+        match = re.match(pattern, naics_str)
+        if match:
+            code = match.group(1)
+            description = (
+                match.group(2).strip()
+                if len(match.groups()) > 1 and match.group(2)
+                else None
+            )
+
+            if not description:
+                description = get_naics_description(code)
+
+            standardized_format = f"{code} | {description}" if description else code
+
+            return {
+                "code": code,
+                "description": description,
+                "standardized_format": standardized_format,
+                "original_format": format_type,
+            }
+
+    # Fallback for unexpected formats
+    description = None
+    if validate_naics_code(naics_str):
+        description = get_naics_description(naics_str)
+
+    standardized_format = f"{naics_str} | {description}" if description else naics_str
+
+    return {
+        "code": naics_str,
+        "description": description,
+        "standardized_format": standardized_format,
+        "original_format": "unknown",
+    }
+
+
+def extract_naics_from_extra(extra_data: Any) -> dict[str, str | None]:
+    """Extract NAICS information from a prospect's extra field JSON data."""
+    if not extra_data:
+        return {"code": None, "description": None, "found_in_extra": False}
+
+    if isinstance(extra_data, str):
+        try:
+            extra_data = json.loads(extra_data)
+        except (json.JSONDecodeError, TypeError):
+            return {"code": None, "description": None, "found_in_extra": False}
+
+    if not isinstance(extra_data, dict):
+        return {"code": None, "description": None, "found_in_extra": False}
+
+    code = None
+    description = None
+
+    # Check for various NAICS field patterns
+    if "naics_code" in extra_data and extra_data["naics_code"]:
+        potential_code = str(extra_data["naics_code"]).strip()
+        if re.match(r"^\d{6}$", potential_code):
+            code = potential_code
+            description = None
+    elif "primary_naics" in extra_data and extra_data["primary_naics"]:
+        primary_naics = str(extra_data["primary_naics"]).strip()
+        if primary_naics.upper() != "TBD":
+            parsed = parse_naics_value(primary_naics)
+            code = parsed["code"]
+            description = parsed["description"]
+
+    # Fallback: Search for other common NAICS field names
+    if not code:
+        naics_keys = [
+            "naics",
+            "industry_code",
+            "classification",
+            "sector",
+            "naics_primary",
+        ]
+        for key in naics_keys:
+            if key in extra_data and extra_data[key]:
+                potential_value = str(extra_data[key]).strip()
+
+                if potential_value.upper() in [
+                    "TBD",
+                    "TO BE DETERMINED",
+                    "N/A",
+                    "NULL",
+                    "",
+                ]:
+                    continue
+
+                parsed = parse_naics_value(potential_value)
+                if parsed["code"]:
+                    code = parsed["code"]
+                    description = parsed["description"]
+                    break
+
+    # Last resort: Search all values for 6-digit numbers
+    if not code:
+        for key, value in extra_data.items():
+            if isinstance(value, (str, int)):
+                value_str = str(value)
+                matches = re.findall(r"\b(\d{6})\b", value_str)
+                for potential_code in matches:
+                    if potential_code[0] in "123456789":
+                        parsed = parse_naics_value(value_str)
+                        if parsed["code"] == potential_code:
+                            code = parsed["code"]
+                            description = parsed["description"]
+                            break
+                        else:
+                            code = potential_code
+                            break
+
+            if code:
+                break
+
+    found_in_extra = code is not None
+    return {
+        "code": code,
+        "description": description,
+        "found_in_extra": found_in_extra,
+    }
+
+
+# Placeholder values used by data sources instead of a real code
+NAICS_PLACEHOLDERS = {"TBD", "TO BE DETERMINED", "N/A", "NA"}
+
+# Numeric codes exported with a decimal point (e.g., "336510.0")
+_NAICS_DECIMAL_RE = re.compile(r"^([1-9]\d{5})\.0+$")
+
+# A 6-digit code followed by "| desc", ": desc", "- desc", " desc" or nothing
+# (the formats parse_naics_value recognizes, in the same order)
+_NAICS_EXTRACT_RE = re.compile(
+    r"^(?P<code>\d{6})(?:\s*[|:\-]\s*|\s+(?=[^0-9])|$)(?P<description>.*)"
+)
+
+
+def normalize_naics_series(values: pd.Series) -> pd.DataFrame:
+    """Split a column of raw NAICS values into standardized codes and descriptions.
+
+    Vectorized equivalent of parse_naics_value: each distinct value
+    is run through a single extraction regex, and descriptions missing from the
+    source are filled from NAICS_DESCRIPTIONS.
+
+    Args:
+        values: Raw NAICS values (e.g., "541511 | Custom Programming", 541511.0)
+
+    Returns:
+        DataFrame aligned to ``values.index`` with 'code' and 'description'
+        columns. Blank and placeholder values get NaN in both columns.
+    """
+    text = values.astype(str).str.strip()
+    text[values.isna()] = ""
+
+    uniques = pd.Series(text.unique(), dtype=object)
+    uniques = uniques[(uniques != "") & ~uniques.str.upper().isin(NAICS_PLACEHOLDERS)]
+    if uniques.empty:
+        return pd.DataFrame(
+            {"code": pd.NA, "description": pd.NA}, index=values.index, dtype=object
+        )
+
+    cleaned = uniques.str.replace(_NAICS_DECIMAL_RE, r"\1", regex=True)
+    parts = cleaned.str.extract(_NAICS_EXTRACT_RE)
+    matched = parts["code"].notna()
+
+    # Description given in the source, else the official one for the code
+    source_desc = parts["description"].astype(object).str.strip()
+    source_desc = source_desc.where(source_desc != "")
+    description = source_desc.fillna(parts["code"].map(NAICS_DESCRIPTIONS))
+
+    # Unrecognized formats keep the cleaned string as the code, with a
+    # description only when its digits form a known 6-digit code
+    fallback_digits = cleaned[~matched].str.replace(r"\D", "", regex=True)
+    description[~matched] = fallback_digits.map(NAICS_DESCRIPTIONS)
+    code = parts["code"].where(matched, cleaned)
+
+    lookup = pd.DataFrame(
+        {"code": code.to_numpy(), "description": description.to_numpy()},
+        index=uniques.to_numpy(),
+        dtype=object,
+    )
+    result = lookup.reindex(text.to_numpy())
+    result.index = values.index
+    return result
@@ -0,0 +1,151 @@
+"""Text similarity scoring for duplicate detection.
+
+Scores are on the ``difflib.SequenceMatcher.ratio()`` scale the DUPLICATE_*
+thresholds are calibrated against. Callers that only need to know whether a
+pair reaches a threshold pass it in, so the backend can reject pairs with
+cheap prefilters before running the exact (worst-case quadratic) ratio.
+"""
+
+import difflib
+from collections import Counter
+from functools import lru_cache
+
+from app.config import active_config
+
+
+class SimilarityBackend:
+    """Exact ratio with early exits on provable upper bounds.
+
+    The length ratio and the shared character counts bound the
+    SequenceMatcher ratio from above, so rejecting on them never changes
+    whether a pair reaches its threshold.
+    """
+
+    name = "difflib"
+
+    def ratio(self, text1: str, text2: str) -> float:
+        return difflib.SequenceMatcher(None, text1, text2).ratio()
+
+    def may_reach(self, text1: str, text2: str, threshold: float) -> bool:
+        if not _length_bound(text1, text2) >= threshold:
+            return False
+        return _character_bound(text1, text2) >= threshold
+
+
+class TrigramSimilarityBackend(SimilarityBackend):
+    """Adds a character trigram Jaccard prefilter.
+
+    Approximate: pairs whose trigram sets overlap less than
+    DUPLICATE_TRIGRAM_MIN_JACCARD are rejected without computing the ratio,
+    which skips most of the work on long, unrelated descriptions.
+    """
+
+    name = "trigram"
+
+    def may_reach(self, text1: str, text2: str, threshold: float) -> bool:
+        if not _length_bound(text1, text2) >= threshold:
+            return False
+        grams1 = _trigrams(text1)
+        grams2 = _trigrams(text2)
+        jaccard = len(grams1 & grams2) / len(grams1 | grams2)
+        if jaccard < active_config.DUPLICATE_TRIGRAM_MIN_JACCARD:
+            return False
+        return super().may_reach(text1, text2, threshold)
+
+
+SIMILARITY_BACKENDS = {
+    backend.name: backend for backend in (SimilarityBackend, TrigramSimilarityBackend)
+}
+
+_backend = None
+
+
+def get_similarity_backend() -> SimilarityBackend:
+    """Return the backend selected by DUPLICATE_SIMILARITY_BACKEND."""
+    global _backend
+    name = active_config.DUPLICATE_SIMILARITY_BACKEND
+    if _backend is None or _backend.name != name:
+        if name not in SIMILARITY_BACKENDS:
+            raise ValueError(
+                f"Unknown similarity backend '{name}', "
+                f"expected one of {sorted(SIMILARITY_BACKENDS)}"
+            )
+        _backend = SIMILARITY_BACKENDS[name]()
+    return _backend
+
+
+def _length_bound(text1: str, text2: str) -> float:
+    """Upper bound on the ratio from lengths alone (real_quick_ratio)."""
+    return 2.0 * min(len(text1), len(text2)) / (len(text1) + len(text2))
+
+
+def _character_bound(text1: str, text2: str) -> float:
+    """Upper bound on the ratio from shared characters (quick_ratio)."""
+    shared = _character_counts(text1) & _character_counts(text2)
+    return 2.0 * sum(shared.values()) / (len(text1) + len(text2))
+
+
+@lru_cache(maxsize=4096)
+def _character_counts(text: str) -> Counter:
+    return Counter(text)
+
+
+@lru_cache(maxsize=4096)
+def _trigrams(text: str) -> frozenset[str]:
+    return frozenset(text[i : i + 3] for i in range(len(text) - 2))
+
+
+@lru_cache(maxsize=active_config.DUPLICATE_SIMILARITY_CACHE_SIZE)
+def _cached_ratio(text1: str, text2: str) -> float:
+    return get_similarity_backend().ratio(text1, text2)
+
+
+def text_similarity(text1, text2, threshold: float = 0.0) -> float:
+    """Calculate similarity between two text strings.
+
+    Args:
+        text1: First text, compared case-insensitively
+        text2: Second text
+        threshold: When set, pairs that cannot reach it may return 0.0
+            without computing the exact ratio
+
+    Returns:
+        Similarity between 0.0 and 1.0
+    """
+    # Handle None values explicitly
+    if text1 is None or text2 is None:
+        return 0.0
+
+    # Convert to strings and check if empty
+    text1_str = str(text1).strip()
+    text2_str = str(text2).strip()
+
+    if not text1_str or not text2_str:
+        return 0.0
+
+    # Normalize texts
+    text1_norm = text1_str.lower()
+    text2_norm = text2_str.lower()
+
+    if text1_norm == text2_norm:
+        return 1.0
+
+    # Handle very short strings (less than 3 characters)
+    if len(text1_norm) < 3 or len(text2_norm) < 3:
+        # For very short strings, check if one is contained in the other
+        # This helps with cases like "IT" vs "I.T." or "AI" vs "A.I."
+        if text1_norm in text2_norm or text2_norm in text1_norm:
+            return 0.9  # High similarity for contained short strings
+        # Check without punctuation
+        text1_alpha = "".join(c for c in text1_norm if c.isalnum())
+        text2_alpha = "".join(c for c in text2_norm if c.isalnum())
+        if text1_alpha == text2_alpha and text1_alpha:
+            return 0.95  # Very high similarity for same alphanumeric content
+        return 0.0
+
+    if threshold > 0.0 and not get_similarity_backend().may_reach(
+        text1_norm, text2_norm, threshold
+    ):
+        return 0.0
+
+    return _cached_ratio(text1_norm, text2_norm)
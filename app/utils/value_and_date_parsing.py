@@ -1,10 +1,98 @@
 import re
+from collections.abc import Callable, Iterable
 from datetime import datetime
+from operator import itemgetter
+from typing import Any
 
 import pandas as pd
 
 from app.utils.logger import logger
 
+# Value parsing
+_VALUE_MULTIPLIERS = {"K": 1000, "THOUSAND": 1000, "M": 1000000, "MILLION": 1000000}
+_VALUE_UNIT_PATTERN = r"(K|THOUSAND|M|MILLION)?"
+# 1. Range pattern
+_VALUE_RANGE_RE = re.compile(
+    rf"(?:BETWEEN\s*\$?|\$?)(?P<low>[\d.]+)\s*{_VALUE_UNIT_PATTERN}\s*(?:-|TO|AND)\s*\$?\s*(?P<high>[\d.]+)\s*{_VALUE_UNIT_PATTERN}"
+)
+# 2. Threshold pattern (includes >=, <=, < OR =, > OR =)
+_VALUE_THRESHOLD_RE = re.compile(
+    rf"(?:OVER|UNDER|LESS THAN|>=|<=|>|<|< OR =|> OR =)\s*\$?(?P<thresh>[\d.]+)\s*{_VALUE_UNIT_PATTERN}"
+)
+# 3. Simple Number + Unit pattern
+_VALUE_SIMPLE_UNIT_RE = re.compile(rf"\$?([\d.]+)\s*{_VALUE_UNIT_PATTERN}")
+
+# Values parsed without the LLM: a whole string that is one amount or a range
+# of two, with the same kind of unit on both ends
+_BOUND_MULTIPLIERS = {
+    **_VALUE_MULTIPLIERS,
+    "MM": 1000000,
+    "B": 1000000000,
+    "BILLION": 1000000000,
+}
+_BOUND_AMOUNT = (
+    r"\$?\s*(?P<{0}>\d+(?:\.\d+)?)\s*(?P<{0}_unit>K|THOUSAND|MM|M|MILLION|B|BILLION)?"
+)
+_VALUE_SINGLE_FULL_RE = re.compile(_BOUND_AMOUNT.format("amount"))
+_VALUE_RANGE_FULL_RE = re.compile(
+    rf"(?:BETWEEN\s+)?{_BOUND_AMOUNT.format('low')}\s*(?:-|–|TO|AND)\s*{_BOUND_AMOUNT.format('high')}"
+)
+_NO_VALUE_STRINGS = {
+    "",
+    "TBD",
+    "TBA",
+    "N/A",
+    "NA",
+    "NONE",
+    "UNKNOWN",
+    "TO BE DETERMINED",
+}
+
+# Fiscal quarter parsing: 'Qn' or 'Nth' formats, with year potentially before or after
+_FISCAL_QUARTER_RE = re.compile(
+    r"(?:FY)?(\d{2,4})?\s*(?:Q([1-4])|([1-4])(?:ST|ND|RD|TH))|(?:Q([1-4])|([1-4])(?:ST|ND|RD|TH))\s*(?:FY)?(\d{2,4})?"
+)
+# Quarter -> (start month, calendar year offset); fiscal Q1 starts in October
+_FISCAL_QUARTER_STARTS = {1: (10, -1), 2: (1, 0), 3: (4, 0), 4: (7, 0)}
+
+_NAICS_CODE_RE = re.compile(r"^(\d+)(?:\s*-.*)?$")
+
+
+def map_unique(values: Iterable[Any], parser: Callable[[Any], Any]) -> list[Any]:
+    """Apply ``parser`` once per distinct value and return results in input order.
+
+    Forecast exports repeat the same strings ("FY25 Q2", "$1M-$5M", ...) many
+    times, so parsing each unique value once is much cheaper than a per-row
+    apply. Values are keyed by type as well as value so that e.g. ``1`` and
+    ``1.0`` (which stringify differently) are parsed separately.
+    """
+    cache: dict[tuple[type, Any], Any] = {}
+    results = []
+    for value in values:
+        try:
+            key = (value.__class__, value)
+            result = cache[key]
+        except KeyError:
+            result = cache[key] = parser(value)
+        except TypeError:  # Unhashable value
+            result = parser(value)
+        results.append(result)
+    return results
+
+
+def _results_to_frame(
+    results: list[tuple], index: pd.Index, columns: list[str]
+) -> pd.DataFrame:
+    """Unpack per-row result tuples into columns aligned to ``index``."""
+    results = pd.Series(results, index=index, dtype=object)
+    return pd.DataFrame(
+        {
+            column: results.map(itemgetter(position))
+            for position, column in enumerate(columns)
+        },
+        index=index,
+    )
+
 
 def parse_value_range(value_str):
     """Parses common value range strings into a numeric value and a unit string."""
@@ -31,37 +119,21 @@ def parse_value_range(value_str):
     except ValueError:
         pass
 
-    # Define multipliers
-    multipliers = {"K": 1000, "THOUSAND": 1000, "M": 1000000, "MILLION": 1000000}
-    unit_pattern = r"(K|THOUSAND|M|MILLION)?"
-
-    # Regex patterns:
-    # 1. Range pattern
-    range_pattern = re.compile(
-        rf"(?:BETWEEN\s*\$?|\$?)(?P<low>[\d.]+)\s*{unit_pattern}\s*(?:-|TO|AND)\s*\$?\s*(?P<high>[\d.]+)\s*{unit_pattern}"
-    )
-    # 2. Threshold pattern (Updated to include >=, <=, < OR =, > OR =)
-    threshold_pattern = re.compile(
-        rf"(?:OVER|UNDER|LESS THAN|>=|<=|>|<|< OR =|> OR =)\s*\$?(?P<thresh>[\d.]+)\s*{unit_pattern}"
-    )
-    # 3. Simple Number + Unit pattern
-    simple_unit_pattern = re.compile(rf"\$?([\d.]+)\s*{unit_pattern}")
-
-    range_match = range_pattern.search(value_str)
-    threshold_match = threshold_pattern.search(value_str)
-    simple_unit_match = simple_unit_pattern.match(value_str)
+    range_match = _VALUE_RANGE_RE.search(value_str)
+    threshold_match = _VALUE_THRESHOLD_RE.search(value_str)
+    simple_unit_match = _VALUE_SIMPLE_UNIT_RE.match(value_str)
 
     if range_match:
         low_val = float(range_match.group("low"))
         low_unit = range_match.group(
             2
         )  # Group index might change based on pattern structure
-        numeric_val = low_val * multipliers.get(low_unit, 1)
+        numeric_val = low_val * _VALUE_MULTIPLIERS.get(low_unit, 1)
         unit_str = value_str_orig  # Store original range string as unit
     elif threshold_match:
         val = float(threshold_match.group("thresh"))
         unit = threshold_match.group(2)  # Group index might change
-        numeric_val = val * multipliers.get(unit, 1)
+        numeric_val = val * _VALUE_MULTIPLIERS.get(unit, 1)
         unit_str = value_str_orig  # Store original threshold string as unit
     elif simple_unit_match:
         # Need to adjust group indices if unit_pattern changes captures
@@ -72,7 +144,7 @@ def parse_value_range(value_str):
 
         unit = simple_unit_match.group(2)  # Assuming unit is the second capture group
         if unit:
-            numeric_val = val * multipliers.get(unit, 1)
+            numeric_val = val * _VALUE_MULTIPLIERS.get(unit, 1)
             unit_str = unit
         else:  # It matched as a simple number without unit (already tried float conversion)
             # This case should ideally be caught by the initial float() try block,
@@ -87,6 +159,42 @@ def parse_value_range(value_str):
     return numeric_val, unit_str
 
 
+def parse_value_bounds(value_str) -> tuple[float | None, float | None] | None:
+    """Parse an unambiguous contract value into (low, high) amounts.
+
+    A single amount ("$2.5M", "1,250,000") gives equal bounds and a range
+    ("$1M - $5M", "between $100K and $500K") its two ends. Placeholders such
+    as "TBD" give (None, None). Anything else, such as thresholds, text
+    around the amounts, ranges without a currency sign or unit, or a unit on
+    one end of a range only, returns None.
+    """
+    if value_str is None or pd.isna(value_str):
+        return None, None
+    text = " ".join(str(value_str).upper().replace(",", "").split())
+    if text in _NO_VALUE_STRINGS:
+        return None, None
+
+    match = _VALUE_SINGLE_FULL_RE.fullmatch(text)
+    if match:
+        amount = float(match["amount"]) * _BOUND_MULTIPLIERS.get(
+            match["amount_unit"], 1
+        )
+        return amount, amount
+
+    # Bare number ranges ("10-20") may be in thousands or millions
+    match = _VALUE_RANGE_FULL_RE.fullmatch(text)
+    if (
+        match
+        and bool(match["low_unit"]) == bool(match["high_unit"])
+        and (match["low_unit"] or "$" in text)
+    ):
+        low = float(match["low"]) * _BOUND_MULTIPLIERS.get(match["low_unit"], 1)
+        high = float(match["high"]) * _BOUND_MULTIPLIERS.get(match["high_unit"], 1)
+        if low <= high:
+            return low, high
+    return None
+
+
 def fiscal_quarter_to_date(qtr_str):
     """Converts FY/Quarter string to a representative date and extracts the fiscal year.
     Returns a tuple: (pd.Timestamp, fiscal_year).
@@ -101,11 +209,7 @@ def fiscal_quarter_to_date(qtr_str):
     if qtr_str == "TBD":
         return pd.NaT, pd.NA  # Return tuple
 
-    # Updated regex to handle 'Qn' or 'Nth' formats, with year potentially before or after.
-    match = re.search(
-        r"(?:FY)?(\d{2,4})?\s*(?:Q([1-4])|([1-4])(?:ST|ND|RD|TH))|(?:Q([1-4])|([1-4])(?:ST|ND|RD|TH))\s*(?:FY)?(\d{2,4})?",
-        qtr_str,
-    )
+    match = _FISCAL_QUARTER_RE.search(qtr_str)
     if match:
         # Extract year and quarter from potentially different groups
         year_part = match.group(1) or match.group(6)
@@ -118,21 +222,13 @@ def fiscal_quarter_to_date(qtr_str):
             year = current_year
             if year_part:
                 year = 2000 + int(year_part) if int(year_part) < 100 else int(year_part)
-            # Adjust month based on fiscal quarter start (Oct = Q1, Jan = Q2, Apr = Q3, Jul = Q4)
-            # Target the *start* of the quarter
-            if quarter == 1:
-                month, year_offset = 10, -1  # Q1 starts in previous calendar year
-            elif quarter == 2:
-                month, year_offset = 1, 0
-            elif quarter == 3:
-                month, year_offset = 4, 0
-            elif quarter == 4:
-                month, year_offset = 7, 0
-            else:  # Should not happen due to regex
+            # Target the *start* of the quarter (Oct = Q1, Jan = Q2, Apr = Q3, Jul = Q4)
+            if quarter not in _FISCAL_QUARTER_STARTS:  # Should not happen due to regex
                 logger.warning(
                     f"Invalid quarter number {quarter} parsed from '{qtr_str_orig}'"
                 )
                 return pd.NaT, pd.NA  # Return tuple
+            month, year_offset = _FISCAL_QUARTER_STARTS[quarter]
 
             fiscal_year = year  # Use the derived/provided year as the fiscal year
             calendar_year = fiscal_year + year_offset
@@ -173,7 +269,7 @@ def normalize_naics_code(naics_str):
 
     # Extract numeric code if description is included (e.g., "541519 - Other Computer Related Services" -> "541519")
     # Look for pattern of digits followed by space and dash
-    match = re.match(r"^(\d+)(?:\s*-.*)?$", naics_str)
+    match = _NAICS_CODE_RE.match(naics_str)
     if match:
         naics_str = match.group(1)
 
@@ -241,3 +337,35 @@ def split_place(place_str):
     else:
         logger.warning(f"Could not confidently split place: {place_str}")
         return pd.NA, pd.NA
+
+
+def parse_value_range_series(values: pd.Series) -> pd.DataFrame:
+    """Bulk version of parse_value_range.
+
+    Returns a frame with 'value' and 'unit' columns aligned to ``values.index``.
+    """
+    return _results_to_frame(
+        map_unique(values, parse_value_range), values.index, ["value", "unit"]
+    )
+
+
+def parse_fiscal_quarter_series(values: pd.Series) -> pd.DataFrame:
+    """Bulk version of fiscal_quarter_to_date.
+
+    Returns a frame with 'date' and 'fiscal_year' columns aligned to ``values.index``.
+    """
+    return _results_to_frame(
+        map_unique(values, fiscal_quarter_to_date),
+        values.index,
+        ["date", "fiscal_year"],
+    )
+
+
+def parse_place_series(values: pd.Series) -> pd.DataFrame:
+    """Bulk version of split_place.
+
+    Returns a frame with 'city' and 'state' columns aligned to ``values.index``.
+    """
+    return _results_to_frame(
+        map_unique(values, split_place), values.index, ["city", "state"]
+    )
@@ -174,6 +174,12 @@ export function AIEnrichment() {
                     <span className="font-mono">{status?.model_version}</span>
                   </div>
                 )}
+                {status?.response_cache?.enabled && (
+                  <div className="flex justify-between">
+                    <span>Response cache hit rate:</span>
+                    <span>{(status.response_cache.hit_rate * 100).toFixed(1)}%</span>
+                  </div>
+                )}
               </div>
             )}
           </CardContent>
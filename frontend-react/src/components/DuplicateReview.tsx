@@ -8,6 +8,7 @@ import { DuplicateScanProgress } from '@/types';
 import { useToast } from '@/contexts/ToastContext';
 import { useConfirmationDialog } from '@/components/ui/ConfirmationDialog';
 import { ErrorSeverity, ErrorCategory } from '@/types/errors';
+import { useEventStream } from '@/hooks/api/useEventStream';
 
 interface DataSource {
   id: number;
@@ -46,6 +47,7 @@ interface DuplicateDetectionResult {
     source_id?: number;
     min_confidence: number;
     limit: number;
+    mode?: 'matches' | 'clusters';
   };
 }
 
@@ -67,12 +69,20 @@ export function DuplicateReview() {
     queryFn: () => get<{ status: string; data: { sources: DataSource[] } }>('/api/duplicates/sources'),
   });
 
+  // Scan progress is pushed over the event stream, each update refetches
+  // the progress endpoint; polling is the fallback while it is disconnected
+  const streaming = useEventStream('duplicate_scan', (event) => {
+    if (currentScanId && (event.scan_id === currentScanId || event.type === 'resync')) {
+      queryClient.invalidateQueries({ queryKey: ['duplicateProgress', currentScanId] });
+    }
+  });
+
   // Progress polling query
   const { data: progressData } = useQuery<{ data: DuplicateScanProgress } | null>({
     queryKey: ['duplicateProgress', currentScanId],
     queryFn: () => currentScanId ? get<{ data: DuplicateScanProgress }>(`/api/duplicates/progress/${currentScanId}`) : null,
     enabled: !!currentScanId,
-    refetchInterval: currentScanId ? 1000 : false, // Poll every second when scanning
+    refetchInterval: currentScanId && !streaming ? 1000 : false, // Poll every second when scanning
   });
 
   // Duplicate detection query
@@ -91,6 +101,7 @@ export function DuplicateReview() {
         source_id: selectedSourceId,
         min_confidence: minConfidence,
         limit: scanLimit || 10000, // Use a high number when "All" is selected
+        mode: 'clusters', // Non-overlapping groups that can be merged independently
       });
       
       // Set scan ID for progress tracking if provided
@@ -241,6 +252,9 @@ export function DuplicateReview() {
   };
 
   const duplicateGroups = duplicatesData?.data?.potential_duplicates || [];
+  // The detect request returns as soon as the scan is queued; keep showing
+  // progress until polling delivers the results
+  const isScanning = isDetecting || !!currentScanId;
 
   // Update scan progress from polling
   React.useEffect(() => {
@@ -283,7 +297,7 @@ export function DuplicateReview() {
 
   const renderProgressBar = () => {
     // Show progress bar when detecting (regardless of progress data)
-    if (!isDetecting) return null;
+    if (!isScanning) return null;
 
     // If we have progress data with error status, show error
     if (scanProgress && scanProgress.status === 'error') {
@@ -410,10 +424,10 @@ export function DuplicateReview() {
               <div className="flex items-end">
                 <button
                   onClick={() => detectDuplicates()}
-                  disabled={isDetecting}
+                  disabled={isScanning}
                   className="w-full inline-flex items-center justify-center gap-2 whitespace-nowrap rounded-md text-sm font-medium transition-all disabled:pointer-events-none disabled:opacity-50 bg-primary text-primary-foreground shadow-sm hover:bg-primary/80 h-9 px-4 py-2 border border-primary"
                 >
-                  {isDetecting ? (
+                  {isScanning ? (
                     <>
                       <div className="animate-spin rounded-full h-4 w-4 border-t-2 border-b-2 border-white mr-2"></div>
                       Scanning...
@@ -434,7 +448,7 @@ export function DuplicateReview() {
               </div>
             )}
 
-            {duplicatesData?.data && (
+            {!isScanning && duplicatesData?.data && (
               <div className="bg-primary/10 border border-primary/20 rounded-md p-4">
                 <p className="text-primary">
                   Found {duplicatesData.data.total_found || 0} potential duplicate group(s)
@@ -649,7 +663,7 @@ export function DuplicateReview() {
         </Card>
       )}
 
-      {duplicatesData && duplicateGroups.length === 0 && (
+      {!isScanning && duplicatesData && duplicateGroups.length === 0 && (
         <Card>
           <CardContent className="text-center py-8">
             <div className="text-emerald-600 dark:text-emerald-400 text-lg font-medium mb-2">
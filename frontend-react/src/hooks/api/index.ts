@@ -4,4 +4,5 @@ export * from './useProspects';
 export * from './useAuth';
 export * from './useDecisions';
 export * from './useEnhancementSimple';
-export * from './useEnhancementQueueService';
\ No newline at end of file
+export * from './useEnhancementQueueService';
+export * from './useEventStream';
\ No newline at end of file
@@ -2,6 +2,7 @@ import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { get, post, buildQueryString } from '@/utils/apiUtils';
 import type { ApiResponse } from '@/types/api';
 import { LLMParsedResult } from '@/types';
+import { useEventStream } from './useEventStream';
 
 /**
  * Unified queue management service that consolidates all queue-related operations
@@ -88,6 +89,13 @@ export interface AIEnrichmentStatus {
   };
   last_processed: string | null;
   model_version: string | null;
+  response_cache?: {
+    enabled: boolean;
+    hits: number;
+    misses: number;
+    hit_rate: number;
+    entries: number | null;
+  };
 }
 
 // LLM output log entry
@@ -124,6 +132,19 @@ export function useEnhancementQueueService(options?: {
   const queryClient = useQueryClient();
   const { llmOutputsLimit = 50, llmOutputsType = 'all' } = options || {};
 
+  // Queue and item updates are pushed over the event stream, polling is the
+  // fallback while it is disconnected
+  const streaming = useEventStream('enhancement', (event) => {
+    if (event.type === 'queue') {
+      queryClient.setQueryData(queryKeys.queueStatus, event as unknown as QueueStatus);
+    } else if (event.type === 'item' && typeof event.item_id === 'string') {
+      queryClient.setQueryData(queryKeys.queueItem(event.item_id), event as unknown as QueueItem);
+    } else if (event.type === 'resync') {
+      queryClient.invalidateQueries({ queryKey: queryKeys.queueStatus });
+      queryClient.invalidateQueries({ queryKey: ['queue-item-status'] });
+    }
+  });
+
   // Queue status monitoring
   const queueStatus = useQuery<QueueStatus>({
     queryKey: queryKeys.queueStatus,
@@ -131,7 +152,7 @@ export function useEnhancementQueueService(options?: {
       const resp = await get<ApiResponse<QueueStatus>>('/api/llm/queue/status');
       return resp.data as QueueStatus;
     },
-    refetchInterval: 1000,
+    refetchInterval: streaming ? false : 1000,
     staleTime: 500,
     refetchOnWindowFocus: true
   });
@@ -181,7 +202,7 @@ export function useEnhancementQueueService(options?: {
       return resp.data as QueueItem;
     },
     enabled: !!itemId,
-    refetchInterval: 1000,
+    refetchInterval: streaming ? (false as const) : 1000,
     staleTime: 500
   });
 
@@ -0,0 +1,140 @@
+import { useEffect, useRef, useState } from 'react';
+
+/**
+ * Shared connection to the server-sent events stream at /api/events/stream.
+ *
+ * One EventSource is opened while any component listens and closed when the
+ * last one unmounts. Polling queries should only fall back to their interval
+ * while the stream is disconnected.
+ *
+ * The server ends each stream after a while to free its thread; EventSource
+ * reconnects with Last-Event-ID, so a quick reconnect is not reported as a
+ * disconnection. When the server has no free stream slot it answers 503 and
+ * the stream is retried later.
+ */
+
+export type EventTopic = 'enhancement' | 'field_update' | 'scraper' | 'duplicate_scan';
+
+export interface StreamEvent {
+  type: string;
+  [key: string]: unknown;
+}
+
+type Listener = (event: StreamEvent) => void;
+type ConnectionListener = (connected: boolean) => void;
+
+const TOPICS: EventTopic[] = ['enhancement', 'field_update', 'scraper', 'duplicate_scan'];
+
+const listeners = new Map<EventTopic, Set<Listener>>();
+const connectionListeners = new Set<ConnectionListener>();
+let source: EventSource | null = null;
+let connected = false;
+let disconnectTimer: ReturnType<typeof setTimeout> | null = null;
+let reopenTimer: ReturnType<typeof setTimeout> | null = null;
+
+// Reconnects quicker than this keep the stream reported as connected
+const RECONNECT_GRACE_MS = 5000;
+// Wait before asking again for a stream the server refused
+const REOPEN_DELAY_MS = 30000;
+
+function setConnected(value: boolean) {
+  if (connected === value) return;
+  connected = value;
+  connectionListeners.forEach((listener) => listener(value));
+}
+
+function dispatch(topic: EventTopic, event: StreamEvent) {
+  listeners.get(topic)?.forEach((listener) => listener(event));
+}
+
+function clearTimers() {
+  if (disconnectTimer) clearTimeout(disconnectTimer);
+  if (reopenTimer) clearTimeout(reopenTimer);
+  disconnectTimer = null;
+  reopenTimer = null;
+}
+
+function inUse() {
+  return Array.from(listeners.values()).some((set) => set.size > 0);
+}
+
+function open() {
+  if (source || typeof EventSource === 'undefined') return;
+
+  source = new EventSource('/api/events/stream', { withCredentials: true });
+  source.onopen = () => {
+    clearTimers();
+    setConnected(true);
+  };
+  source.onerror = () => {
+    if (source?.readyState === EventSource.CLOSED) {
+      // The server refused the stream, poll until asking again
+      clearTimers();
+      source = null;
+      setConnected(false);
+      reopenTimer = setTimeout(() => {
+        reopenTimer = null;
+        if (inUse()) open();
+      }, REOPEN_DELAY_MS);
+      return;
+    }
+    // EventSource retries on its own, e.g. after the server ended the stream
+    if (!disconnectTimer) {
+      disconnectTimer = setTimeout(() => {
+        disconnectTimer = null;
+        if (source?.readyState !== EventSource.OPEN) setConnected(false);
+      }, RECONNECT_GRACE_MS);
+    }
+  };
+  TOPICS.forEach((topic) => {
+    source?.addEventListener(topic, (message) => {
+      try {
+        dispatch(topic, JSON.parse((message as MessageEvent).data) as StreamEvent);
+      } catch {
+        // Ignore malformed events
+      }
+    });
+  });
+  // Events were dropped, every listener should re-read its data
+  source.addEventListener('resync', () => {
+    TOPICS.forEach((topic) => dispatch(topic, { type: 'resync' }));
+  });
+}
+
+function closeIfUnused() {
+  if (inUse()) return;
+  clearTimers();
+  if (source) {
+    source.close();
+    source = null;
+    setConnected(false);
+  }
+}
+
+/**
+ * Subscribe to events of a topic.
+ *
+ * @returns Whether the stream is connected, callers poll only when it is not
+ */
+export function useEventStream(topic: EventTopic, onEvent: Listener): boolean {
+  const [isConnected, setIsConnected] = useState(connected);
+  const handlerRef = useRef(onEvent);
+  handlerRef.current = onEvent;
+
+  useEffect(() => {
+    const listener: Listener = (event) => handlerRef.current(event);
+    if (!listeners.has(topic)) listeners.set(topic, new Set());
+    listeners.get(topic)!.add(listener);
+    connectionListeners.add(setIsConnected);
+    open();
+    setIsConnected(connected);
+
+    return () => {
+      listeners.get(topic)?.delete(listener);
+      connectionListeners.delete(setIsConnected);
+      closeIfUnused();
+    };
+  }, [topic]);
+
+  return isConnected;
+}
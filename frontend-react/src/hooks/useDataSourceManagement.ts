@@ -1,6 +1,7 @@
 import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { postProcessing } from '@/utils/apiUtils';
 import { useClearDataSourceData, useListDataSourcesAdmin } from '@/hooks/api/useDataSources';
+import { useEventStream } from '@/hooks/api/useEventStream';
 import { useToast } from '@/contexts/ToastContext';
 import { formatScraperResults } from '@/utils/statusUtils';
 import { DataSource } from '@/types';
@@ -25,10 +26,16 @@ export function useDataSourceManagement(enabled: boolean = true) {
   const { showSuccessToast, showErrorToast, showInfoToast } = useToast();
   const clearDataMutation = useClearDataSourceData();
 
+  // Scraper status transitions are pushed over the event stream, polling is
+  // the fallback while it is disconnected
+  const streaming = useEventStream('scraper', () => {
+    queryClient.invalidateQueries({ queryKey: ['dataSources', 'admin'] });
+  });
+
   // Fetch data sources with frequent updates when scrapers are running
   // Using admin endpoint for full data (includes status, last_scraped, etc.)
   const { data: sourcesData, isLoading, error } = useListDataSourcesAdmin({
-    refetchInterval: 5000, // Check every 5 seconds for simplicity
+    refetchInterval: streaming ? undefined : 5000, // Check every 5 seconds for simplicity
     refetchIntervalInBackground: true,
     enabled,
   });
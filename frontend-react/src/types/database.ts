@@ -30,7 +30,7 @@ export interface QueryResult {
 
 // Duplicate scan progress
 export interface DuplicateScanProgress {
-  status: 'in_progress' | 'completed' | 'error';
+  status: 'queued' | 'processing' | 'completed' | 'error' | 'interrupted';
   message: string;
   current?: number;
   total?: number;
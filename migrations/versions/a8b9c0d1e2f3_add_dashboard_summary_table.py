@@ -0,0 +1,31 @@
+"""Add dashboard_summary table for stored dashboard aggregates
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-16 20:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8b9c0d1e2f3'
+down_revision = 'f7a8b9c0d1e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Filled on the next dashboard visit or data load
+    op.create_table('dashboard_summary',
+    sa.Column('key', sa.String(length=50), nullable=False),
+    sa.Column('data', sa.JSON(), nullable=False),
+    sa.Column('summary_date', sa.Date(), nullable=False),
+    sa.Column('refreshed_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade():
+    op.drop_table('dashboard_summary')
@@ -0,0 +1,69 @@
+"""Key the SQLite prospect search index on prospect ids instead of rowids
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+from alembic import op
+
+from app.database.search import create_search_index, drop_search_index
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9c0d1e2f3a4'
+down_revision = 'a8b9c0d1e2f3'
+branch_labels = None
+depends_on = None
+
+# The rowid keyed layout of e6f7a8b9c0d1
+_EXTRAS = (
+    "CASE WHEN json_valid({row}.extra) THEN "
+    "(SELECT group_concat(atom, ' ') FROM json_tree({row}.extra) "
+    "WHERE atom IS NOT NULL) END"
+)
+_COLUMNS = "rowid, title, ai_enhanced_title, description, agency, extras"
+_VALUES = (
+    "{row}.rowid, {row}.title, {row}.ai_enhanced_title, {row}.description, "
+    "{row}.agency, " + _EXTRAS
+)
+_ROWID_DDL = (
+    "CREATE VIRTUAL TABLE prospects_fts USING fts5("
+    "title, ai_enhanced_title, description, agency, extras, "
+    "tokenize = 'unicode61 remove_diacritics 2')",
+    f"""CREATE TRIGGER prospects_fts_insert AFTER INSERT ON prospects
+    BEGIN
+        INSERT INTO prospects_fts ({_COLUMNS}) VALUES ({_VALUES.format(row="new")});
+    END""",
+    """CREATE TRIGGER prospects_fts_delete AFTER DELETE ON prospects
+    BEGIN
+        DELETE FROM prospects_fts WHERE rowid = old.rowid;
+    END""",
+    f"""CREATE TRIGGER prospects_fts_update
+    AFTER UPDATE OF title, ai_enhanced_title, description, agency, extra
+    ON prospects
+    BEGIN
+        DELETE FROM prospects_fts WHERE rowid = old.rowid;
+        INSERT INTO prospects_fts ({_COLUMNS}) VALUES ({_VALUES.format(row="new")});
+    END""",
+    f"INSERT INTO prospects_fts ({_COLUMNS}) "
+    f"SELECT {_VALUES.format(row='prospects')} FROM prospects",
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+    # Rebuilds the index with its triggers and fills it from prospects
+    drop_search_index(bind)
+    create_search_index(bind)
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+    drop_search_index(bind)
+    for statement in _ROWID_DDL:
+        bind.exec_driver_sql(statement)
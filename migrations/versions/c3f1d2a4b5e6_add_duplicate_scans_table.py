@@ -0,0 +1,49 @@
+"""Add duplicate_scans table for background duplicate detection
+
+Revision ID: c3f1d2a4b5e6
+Revises: 8d8b7ee0b3ea
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f1d2a4b5e6'
+down_revision = '8d8b7ee0b3ea'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('duplicate_scans',
+    sa.Column('id', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('source_id', sa.Integer(), nullable=True),
+    sa.Column('min_confidence', sa.Float(), nullable=False),
+    sa.Column('scan_limit', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('current', sa.Integer(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=True),
+    sa.Column('completed_sources', sa.JSON(), nullable=True),
+    sa.Column('matches', sa.JSON(), nullable=True),
+    sa.Column('results', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('completed_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('duplicate_scans', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_duplicate_scans_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_duplicate_scans_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_duplicate_scans_updated_at'), ['updated_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('duplicate_scans', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_duplicate_scans_updated_at'))
+        batch_op.drop_index(batch_op.f('ix_duplicate_scans_created_at'))
+        batch_op.drop_index(batch_op.f('ix_duplicate_scans_status'))
+
+    op.drop_table('duplicate_scans')
@@ -0,0 +1,26 @@
+"""Add mode to duplicate_scans for clustered duplicate detection
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3f1d2a4b5e6
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e5f6a7b8c9'
+down_revision = 'c3f1d2a4b5e6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('duplicate_scans', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('mode', sa.String(length=20), nullable=False, server_default='matches'))
+
+
+def downgrade():
+    with op.batch_alter_table('duplicate_scans', schema=None) as batch_op:
+        batch_op.drop_column('mode')
@@ -0,0 +1,26 @@
+"""Add full-text search index for prospects (FTS5 on SQLite, tsvector on PostgreSQL)
+
+Revision ID: e6f7a8b9c0d1
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+
+from app.database.search import create_search_index, drop_search_index
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6f7a8b9c0d1'
+down_revision = 'd4e5f6a7b8c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Creates the index with its sync triggers and fills it from prospects
+    create_search_index(op.get_bind())
+
+
+def downgrade():
+    drop_search_index(op.get_bind())
@@ -0,0 +1,47 @@
+"""Add prospect_naics side table for NAICS filtering
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.models import Prospect
+from app.database.naics_index import sync_prospect_naics
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7a8b9c0d1e2'
+down_revision = 'e6f7a8b9c0d1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('prospect_naics',
+    sa.Column('prospect_id', sa.String(), nullable=False),
+    sa.Column('code', sa.String(length=6), nullable=False),
+    sa.Column('source', sa.String(length=20), nullable=False),
+    sa.Column('is_primary', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['prospect_id'], ['prospects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('prospect_id', 'code', 'source')
+    )
+    with op.batch_alter_table('prospect_naics', schema=None) as batch_op:
+        batch_op.create_index('ix_prospect_naics_code', ['code', 'prospect_id'], unique=False)
+
+    # Backfill from the NAICS column and extra field of existing prospects
+    connection = op.get_bind()
+    result = connection.execute(
+        sa.select(Prospect.id, Prospect.naics, Prospect.extra)
+    )
+    while batch := result.fetchmany(1000):
+        sync_prospect_naics(connection, batch)
+
+
+def downgrade():
+    with op.batch_alter_table('prospect_naics', schema=None) as batch_op:
+        batch_op.drop_index('ix_prospect_naics_code')
+
+    op.drop_table('prospect_naics')
@@ -13,6 +13,7 @@ from pathlib import Path
 from waitress import serve
 
 from app import create_app
+from app.config import active_config
 from app.utils.logger import logger
 
 # Add the project root to the path
@@ -68,10 +69,17 @@ def main():
     if DEBUG:
         app.run(host=HOST, port=PORT, debug=True)
     else:
-        # Use single thread to avoid session race conditions in production
-        # This is fine for a small-scale application
+        # Each open event stream holds a thread, leave room for other requests
+        threads = active_config.WAITRESS_THREADS
+        if threads <= active_config.EVENT_STREAM_MAX_CONNECTIONS:
+            logger.warning(
+                f"WAITRESS_THREADS ({threads}) should exceed "
+                f"EVENT_STREAM_MAX_CONNECTIONS "
+                f"({active_config.EVENT_STREAM_MAX_CONNECTIONS}), open event "
+                f"streams can block every other request"
+            )
         # ProxyFix is applied to app.wsgi_app internally, so serving app works correctly
-        serve(app, host=HOST, port=PORT, threads=1)
+        serve(app, host=HOST, port=PORT, threads=threads)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark preparing a transformed prospect frame for bulk upsert.
+
+Compares the previous multi-copy path (to_dict -> per-value cleanup ->
+DataFrame rebuild -> _preprocess_dataframe -> to_dict) with the single
+dataframe_to_records conversion stage, reporting wall time and peak
+traced memory for each.
+
+Usage:
+  python scripts/data_processing/benchmark_record_preparation.py [--rows 50000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from app.database.crud import dataframe_to_records  # noqa: E402
+
+
+def build_frame(rows: int) -> pd.DataFrame:
+    """Build a frame shaped like ConsolidatedScraperBase.transform_dataframe output."""
+    idx = np.arange(rows)
+    release = pd.to_datetime("2024-01-01") + pd.to_timedelta(idx % 365, unit="D")
+    release = release.where(idx % 7 != 0)  # Some NaT values
+    return pd.DataFrame(
+        {
+            "id": [f"{i:032x}" for i in idx],
+            "native_id": [f"NID-{i}" for i in idx],
+            "title": [f"Requirement {i % 500}" for i in idx],
+            "description": ["Professional services " * 5] * rows,
+            "agency": np.where(idx % 3 == 0, "DHS", "DOT"),
+            "naics": np.where(idx % 4 == 0, None, "541511"),
+            "naics_description": "Custom Computer Programming Services",
+            "estimated_value_text": np.where(idx % 2 == 0, "$1M-$5M", "TBD"),
+            "estimated_value_single": np.where(idx % 5 == 0, np.nan, idx * 1000.0),
+            "release_date": release,
+            "award_date": [
+                None if i % 6 == 0 else datetime(2025, 1 + i % 12, 1).date()
+                for i in idx
+            ],
+            "award_fiscal_year": pd.array(
+                np.where(idx % 6 == 0, None, 2025), dtype="Int64"
+            ),
+            "place_city": np.where(idx % 9 == 0, None, "Washington"),
+            "place_state": "DC",
+            "set_aside": np.where(idx % 2 == 0, "Small Business", None),
+            "extras_json": [{"row": int(i), "vehicle": "GSA"} for i in idx],
+            "source_id": 1,
+            "loaded_at": datetime.now(timezone.utc),
+        }
+    )
+
+
+def legacy_prepare(df: pd.DataFrame) -> list[dict]:
+    """The previous preparation path, kept here as the 'before' baseline."""
+    df = df.rename(columns={"extras_json": "extra"})
+    records = df.to_dict("records")
+    cleaned_records = []
+    for record in records:
+        cleaned_record = {}
+        for key, value in record.items():
+            if pd.isna(value):
+                cleaned_record[key] = None
+            elif hasattr(value, "item"):
+                cleaned_record[key] = value.item() if pd.notna(value) else None
+            else:
+                cleaned_record[key] = value
+        cleaned_records.append(cleaned_record)
+    df = pd.DataFrame(cleaned_records)
+
+    # crud._preprocess_dataframe
+    df = df.copy()
+    for col in ["release_date", "award_date"]:
+        if col in df.columns:
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = df[col].apply(lambda x: x.date() if pd.notna(x) else None)
+            else:
+                df[col] = pd.to_datetime(df[col], errors="coerce").dt.date
+    with pd.option_context("future.no_silent_downcasting", True):
+        df = df.fillna(value=np.nan).replace([np.nan], [None])
+    df = df.infer_objects(copy=False)
+    df = df.drop(columns=["loaded_at"])
+
+    # enhanced_bulk_upsert_prospects
+    return df.to_dict(orient="records")
+
+
+def new_prepare(df: pd.DataFrame) -> list[dict]:
+    return dataframe_to_records(df, rename={"extras_json": "extra"})
+
+
+def measure(label: str, func, df: pd.DataFrame) -> list[dict]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(df)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<8} {elapsed:8.3f}s  peak {peak / 1024 / 1024:8.1f} MiB")
+    return result
+
+
+def _null(value):
+    return (
+        None
+        if value is None or (isinstance(value, float) and np.isnan(value))
+        else value
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+    print(f"Preparing {len(df):,} rows x {len(df.columns)} columns")
+
+    before = measure("before", legacy_prepare, df)
+    after = measure("after", new_prepare, df)
+
+    # The old path could leave NaN in numeric columns; both mean NULL
+    mismatches = sum(
+        {k: _null(v) for k, v in old.items()} != new for old, new in zip(before, after)
+    )
+    print(f"Records: {len(after):,}, mismatches vs before: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,7 @@ def check_ollama_status(model_name: str = "qwen3:latest") -> bool:
     try:
         from app.utils.llm_utils import call_ollama
 
-        response = call_ollama("Test", model_name)
+        response = call_ollama("Test", model_name, use_cache=False)
         if response:
             logger.info(f"✓ Ollama is running with {model_name} model")
             return True
@@ -0,0 +1,68 @@
+"""
+Tests for ETag / If-None-Match support on read-heavy endpoints.
+"""
+
+import pytest
+
+from app.database.models import Prospect
+
+PROSPECT_ID = "etag-test-1"
+
+
+@pytest.fixture
+def prospect(db):
+    def clear():
+        db.session.query(Prospect).filter_by(id=PROSPECT_ID).delete()
+        db.session.commit()
+
+    clear()
+    db.session.add(Prospect(id=PROSPECT_ID, title="Before"))
+    db.session.commit()
+    yield db.session.get(Prospect, PROSPECT_ID)
+    db.session.rollback()
+    clear()
+
+
+class TestConditionalGet:
+    """Unchanged responses are revalidated with a 304 instead of re-sent."""
+
+    def test_not_modified_until_written(self, client, db, prospect):
+        url = f"/api/prospects/{PROSPECT_ID}"
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+
+        prospect.title = "After"
+        db.session.commit()
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.get_json()["data"]["title"] == "After"
+        assert response.headers["ETag"] != etag
+
+    def test_tags_differ_by_query_and_user(self, auth_client):
+        first = auth_client.get("/api/prospects?page=1").headers["ETag"]
+        assert auth_client.get("/api/prospects?page=2").headers["ETag"] != first
+
+        stats = auth_client.get("/api/decisions/stats")
+        assert stats.status_code == 200
+        etag = stats.headers["ETag"]
+        auth_client.set_role("admin")
+        response = auth_client.get(
+            "/api/decisions/stats", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+        # Auth is checked before the ETag, a known tag never skips it
+        with auth_client.session_transaction() as session:
+            session.clear()
+        response = auth_client.get(
+            "/api/decisions/stats", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 401
@@ -0,0 +1,247 @@
+"""
+Tests for background duplicate scans behind /api/duplicates/detect.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config import active_config
+from app.database.models import DuplicateScan, Prospect
+from app.services import duplicate_scan
+from app.services.duplicate_scan import duplicate_scan_service
+
+SOURCE_A = 987001
+SOURCE_B = 987002
+
+
+def _prospect(prospect_id, source_id, native_id, title):
+    return Prospect(
+        id=prospect_id,
+        source_id=source_id,
+        native_id=native_id,
+        title=title,
+        description=f"{title} for the agency",
+        agency="DHS",
+        place_city="Washington",
+        place_state="DC",
+    )
+
+
+@pytest.fixture
+def scan_data(db):
+    def clear():
+        db.session.query(Prospect).filter(
+            Prospect.source_id.in_([SOURCE_A, SOURCE_B])
+        ).delete()
+        db.session.query(DuplicateScan).delete()
+        db.session.commit()
+
+    clear()
+    db.session.add_all(
+        [
+            _prospect("scan-a1", SOURCE_A, "A-1", "Cloud Hosting Services"),
+            _prospect("scan-a2", SOURCE_A, "A-1", "Cloud Hosting Service"),
+            _prospect("scan-a3", SOURCE_A, "A-3", "Fleet Vehicle Leasing"),
+            _prospect("scan-b1", SOURCE_B, "B-1", "Janitorial Services"),
+            _prospect("scan-b2", SOURCE_B, "B-1", "Janitorial Service"),
+        ]
+    )
+    db.session.commit()
+    yield db
+    db.session.rollback()
+    clear()
+
+
+def _wait_for_scan(client, scan_id, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        data = client.get(f"/api/duplicates/progress/{scan_id}").get_json()["data"]
+        if data["status"] in ("completed", "error"):
+            return data
+        time.sleep(0.1)
+    raise AssertionError(f"Scan {scan_id} did not finish")
+
+
+def _group_ids(results):
+    return sorted(
+        (group["original"]["id"], sorted(m["id"] for m in group["matches"]))
+        for group in results["potential_duplicates"]
+    )
+
+
+EXPECTED_GROUPS = [
+    ("scan-a1", ["scan-a2"]),
+    ("scan-a2", ["scan-a1"]),
+    ("scan-b1", ["scan-b2"]),
+    ("scan-b2", ["scan-b1"]),
+]
+
+
+class TestDuplicateScanJobs:
+    """Scans run in the background and persist their results."""
+
+    def test_detect_returns_scan_id_and_completes(self, client, scan_data):
+        response = client.post(
+            "/api/duplicates/detect", json={"min_confidence": 0.7, "limit": 10000}
+        )
+        assert response.status_code == 202
+        scan_id = response.get_json()["data"]["scan_id"]
+
+        progress = _wait_for_scan(client, scan_id)
+
+        assert progress["status"] == "completed"
+        assert progress["current"] == progress["total"]
+        assert _group_ids(progress["results"]) == EXPECTED_GROUPS
+        assert progress["duplicates_found"] == 4
+
+        # Results are served from the database once the job is done
+        scan = scan_data.session.get(DuplicateScan, scan_id)
+        assert scan.status == "completed"
+        assert scan.matches is None
+
+    def test_source_filter_and_limit(self, client, scan_data):
+        response = client.post(
+            "/api/duplicates/detect",
+            json={"source_id": SOURCE_B, "min_confidence": 0.7, "limit": 1},
+        )
+        progress = _wait_for_scan(client, response.get_json()["data"]["scan_id"])
+
+        assert progress["total"] == 1
+        assert len(progress["results"]["potential_duplicates"]) == 1
+
+    def test_resume_skips_checkpointed_sources(self, client, scan_data, monkeypatch):
+        scan_data.session.add(
+            DuplicateScan(
+                id="scan_resume_test",
+                status="interrupted",
+                min_confidence=0.7,
+                scan_limit=10000,
+                completed_sources=[SOURCE_A],
+                matches={
+                    "scan-a1": [
+                        {
+                            "prospect_id": "scan-a3",
+                            "native_id": "A-3",
+                            "title": "Fleet Vehicle Leasing",
+                            "confidence_score": 0.9,
+                            "match_type": "strong",
+                            "matched_fields": ["native_id"],
+                        }
+                    ]
+                },
+            )
+        )
+        scan_data.session.commit()
+
+        scanned = []
+        original = duplicate_scan.scan_source
+
+        def tracking_scan_source(source_id, *args, **kwargs):
+            scanned.append(source_id)
+            return original(source_id, *args, **kwargs)
+
+        monkeypatch.setattr(duplicate_scan, "scan_source", tracking_scan_source)
+
+        response = client.post("/api/duplicates/scans/scan_resume_test/resume")
+        assert response.status_code == 202
+        progress = _wait_for_scan(client, "scan_resume_test")
+
+        assert scanned == [SOURCE_B]
+        assert _group_ids(progress["results"]) == [
+            ("scan-a1", ["scan-a3"]),
+            ("scan-b1", ["scan-b2"]),
+            ("scan-b2", ["scan-b1"]),
+        ]
+
+        # Completed scans cannot be resumed again
+        response = client.post("/api/duplicates/scans/scan_resume_test/resume")
+        assert response.status_code == 404
+
+    def test_sources_scanned_in_processes(self, client, scan_data, monkeypatch):
+        monkeypatch.setattr(active_config, "DUPLICATE_SCAN_PROCESSES", 2)
+        monkeypatch.setattr(active_config, "DUPLICATE_SCAN_PARALLEL_MIN_PROSPECTS", 1)
+
+        response = client.post(
+            "/api/duplicates/detect", json={"min_confidence": 0.7, "limit": 10000}
+        )
+        progress = _wait_for_scan(client, response.get_json()["data"]["scan_id"])
+
+        assert progress["status"] == "completed"
+        assert _group_ids(progress["results"]) == EXPECTED_GROUPS
+
+    def test_expired_scans_are_evicted(self, app, scan_data):
+        stale = datetime.now(timezone.utc) - timedelta(
+            hours=active_config.DUPLICATE_SCAN_TTL_HOURS + 1
+        )
+        for scan_id, status in [
+            ("scan_old_done", "completed"),
+            ("scan_old_run", "processing"),
+        ]:
+            scan_data.session.add(
+                DuplicateScan(
+                    id=scan_id,
+                    status=status,
+                    min_confidence=0.7,
+                    scan_limit=100,
+                    updated_at=stale,
+                )
+            )
+        scan_data.session.commit()
+
+        assert duplicate_scan_service.evict_expired() == 1
+        assert scan_data.session.get(DuplicateScan, "scan_old_done") is None
+        assert scan_data.session.get(DuplicateScan, "scan_old_run") is not None
+
+    def test_cluster_mode_scores_each_pair_once(self, client, scan_data):
+        response = client.post(
+            "/api/duplicates/detect",
+            json={"min_confidence": 0.7, "limit": 10000, "mode": "clusters"},
+        )
+        assert response.status_code == 202
+        progress = _wait_for_scan(client, response.get_json()["data"]["scan_id"])
+
+        assert progress["status"] == "completed"
+        assert progress["results"]["scan_parameters"]["mode"] == "clusters"
+        clusters = progress["results"]["potential_duplicates"]
+        assert sorted(
+            sorted([c["original"]["id"]] + [m["id"] for m in c["matches"]])
+            for c in clusters
+        ) == [["scan-a1", "scan-a2"], ["scan-b1", "scan-b2"]]
+        assert all(len(cluster["pairs"]) == 1 for cluster in clusters)
+
+    def test_clusters_merge_chained_matches(self, app, scan_data):
+        def match(prospect_id, confidence):
+            return {
+                "prospect_id": prospect_id,
+                "native_id": "",
+                "title": "",
+                "confidence_score": confidence,
+                "match_type": "strong",
+                "matched_fields": ["title_similar"],
+            }
+
+        clusters = duplicate_scan._build_duplicate_clusters(
+            ["scan-a1", "scan-a2", "scan-a3", "scan-b1"],
+            {
+                "scan-a1": [match("scan-a2", 0.9)],
+                "scan-a2": [match("scan-a3", 0.8)],
+                "scan-b1": [match("scan-b2", 0.75)],
+            },
+        )
+
+        assert len(clusters) == 2
+        # The member matching both others represents the cluster
+        assert clusters[0]["original"]["id"] == "scan-a2"
+        assert [m["id"] for m in clusters[0]["matches"]] == ["scan-a1", "scan-a3"]
+        assert len(clusters[0]["pairs"]) == 2
+        assert clusters[1]["original"]["id"] == "scan-b1"
+
+    def test_unknown_mode(self, client, scan_data):
+        response = client.post("/api/duplicates/detect", json={"mode": "nope"})
+        assert response.status_code == 400
+
+    def test_unknown_scan(self, client, scan_data):
+        response = client.get("/api/duplicates/progress/scan_missing")
+        assert response.status_code == 404
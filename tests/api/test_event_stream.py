@@ -0,0 +1,87 @@
+"""
+Tests for the /api/events/stream server-sent events endpoint.
+"""
+
+import json
+import threading
+
+from app.api import events
+from app.config import active_config
+from app.services.event_bus import event_bus
+
+
+def _read_events(response, count):
+    """Read count events from a streamed response, skipping comments."""
+    events = []
+    chunks = iter(response.response)
+    while len(events) < count:
+        chunk = next(chunks)
+        chunk = chunk.decode() if isinstance(chunk, bytes) else chunk
+        if chunk.startswith((":", "retry:")):
+            continue
+        fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestEventStream:
+    """Clients subscribe to topics they may read."""
+
+    def test_requires_login(self, client):
+        assert client.get("/api/events/stream").status_code == 401
+
+    def test_rejects_unknown_and_forbidden_topics(self, auth_client):
+        response = auth_client.get("/api/events/stream?topics=nope")
+        assert response.status_code == 400
+
+        # Scraper events are limited to super admins
+        response = auth_client.get("/api/events/stream?topics=scraper")
+        assert response.status_code == 403
+
+    def test_streams_and_replays_events(self, auth_client):
+        before = event_bus.publish("scraper", "status", {"source_id": 1})
+        event_bus.publish("duplicate_scan", "progress", {"scan_id": "scan_a"})
+        event_bus.publish("field_update", "field_update", {"prospect_id": "p1"})
+
+        response = auth_client.get(
+            "/api/events/stream?topics=duplicate_scan,field_update",
+            headers={"Last-Event-ID": str(before.id)},
+        )
+        try:
+            assert response.status_code == 200
+            assert response.mimetype == "text/event-stream"
+            assert _read_events(response, 2) == [
+                ("duplicate_scan", {"type": "progress", "scan_id": "scan_a"}),
+                ("field_update", {"type": "field_update", "prospect_id": "p1"}),
+            ]
+
+            event_bus.publish("duplicate_scan", "progress", {"scan_id": "scan_b"})
+            assert _read_events(response, 1) == [
+                ("duplicate_scan", {"type": "progress", "scan_id": "scan_b"}),
+            ]
+        finally:
+            response.close()
+
+    def test_stream_ends_and_frees_its_slot(self, auth_client, monkeypatch):
+        monkeypatch.setattr(active_config, "EVENT_STREAM_MAX_SECONDS", 0.2)
+        monkeypatch.setattr(events, "_stream_slots", threading.BoundedSemaphore(1))
+
+        response = auth_client.get("/api/events/stream?topics=duplicate_scan")
+        try:
+            assert response.status_code == 200
+            # Other clients are turned away while the only slot is taken
+            busy = auth_client.get("/api/events/stream?topics=duplicate_scan")
+            assert busy.status_code == 503
+            assert busy.headers["Retry-After"] == "30"
+
+            chunks = [
+                chunk.decode() if isinstance(chunk, bytes) else chunk
+                for chunk in response.response
+            ]
+            assert chunks[0].startswith("retry: ")
+        finally:
+            response.close()
+
+        response = auth_client.get("/api/events/stream?topics=duplicate_scan")
+        response.close()
+        assert response.status_code == 200
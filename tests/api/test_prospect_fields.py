@@ -0,0 +1,60 @@
+"""
+Tests for field projection of /api/prospects list responses.
+"""
+
+import json
+
+import pytest
+
+from app.database.models import DataSource, Prospect
+
+PROSPECT_ID = "fields-test-1"
+
+
+@pytest.fixture
+def projected(db):
+    source = DataSource(name="Fields Test Source", url="https://example.com")
+    db.session.add(source)
+    db.session.flush()
+    prospect = Prospect(
+        id=PROSPECT_ID,
+        title="Projected",
+        description="A long description",
+        extra={"summary": "s", "score": float("nan")},
+        source_id=source.id,
+    )
+    db.session.add(prospect)
+    db.session.commit()
+    yield prospect
+    db.session.rollback()
+    db.session.delete(prospect)
+    db.session.delete(source)
+    db.session.commit()
+
+
+class TestProspectFields:
+    """List responses carry only the requested fields."""
+
+    def test_default_matches_to_dict(self, app, client, projected):
+        response = client.get(f"/api/prospects?source_ids={projected.source_id}")
+        assert response.status_code == 200
+        expected = json.loads(app.json.dumps(projected.to_dict()))
+        assert response.get_json()["data"]["items"] == [expected]
+
+    def test_presets_fields_and_truncation(self, client, projected):
+        url = f"/api/prospects?source_ids={projected.source_id}"
+
+        item = client.get(f"{url}&fields=table").get_json()["data"]["items"][0]
+        assert "description" not in item and "extra" not in item
+        assert item["source_name"] == "Fields Test Source"
+
+        item = client.get(
+            f"{url}&fields=title,description&description_length=6&cursor="
+        ).get_json()["data"]["items"][0]
+        assert item == {
+            "id": PROSPECT_ID,
+            "title": "Projected",
+            "description": "A long",
+        }
+
+        assert client.get(f"{url}&fields=title,secret").status_code == 400
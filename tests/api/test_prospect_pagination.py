@@ -0,0 +1,103 @@
+"""
+Tests for keyset (cursor) pagination of /api/prospects.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.database.models import Prospect
+
+SOURCE_ID = 987101
+IDS = [f"cursor-test-{i}" for i in range(7)]
+
+
+@pytest.fixture
+def page_data(db):
+    def clear():
+        db.session.query(Prospect).filter(Prospect.id.in_(IDS)).delete()
+        db.session.commit()
+
+    clear()
+    # Repeated and missing titles exercise the id tie-break and NULL ordering
+    titles = ["Alpha", "Bravo", "Bravo", None, "Charlie", None, "Bravo"]
+    db.session.add_all(
+        Prospect(id=prospect_id, source_id=SOURCE_ID, title=title)
+        for prospect_id, title in zip(IDS, titles)
+    )
+    db.session.commit()
+    yield db
+    db.session.rollback()
+    clear()
+
+
+def _walk(client, query):
+    ids = []
+    cursor = ""
+    while cursor is not None:
+        response = client.get(
+            f"/api/prospects?source_ids={SOURCE_ID}&{query}&cursor={cursor}"
+        )
+        assert response.status_code == 200
+        data = response.get_json()["data"]
+        ids.extend(item["id"] for item in data["items"])
+        assert len(ids) <= len(IDS), "pagination did not end"
+        cursor = data["pagination"]["next_cursor"]
+        assert data["pagination"]["has_next"] is (cursor is not None)
+    return ids
+
+
+class TestProspectCursorPagination:
+    """Cursor pages seek past the last row instead of using an offset."""
+
+    def test_walk_matches_offset_order(self, client, page_data):
+        for sort in ("sort_by=title&sort_order=desc", "sort_by=title&sort_order=asc"):
+            ids = _walk(client, f"limit=2&{sort}")
+            assert sorted(ids) == IDS
+            assert len(ids) == len(set(ids))
+
+        # Descending titles, ties broken by id and missing titles last
+        assert _walk(client, "limit=3&sort_by=title&sort_order=desc") == [
+            IDS[4],
+            IDS[6],
+            IDS[2],
+            IDS[1],
+            IDS[0],
+            IDS[5],
+            IDS[3],
+        ]
+        assert _walk(client, "limit=4&sort_by=id&sort_order=asc") == IDS
+
+    def test_walk_equal_server_default_timestamps(self, client, page_data):
+        # Server defaults store whole seconds, unlike bound datetimes
+        page_data.session.execute(
+            text(
+                "UPDATE prospects SET loaded_at = '2025-01-01 12:00:00' "
+                "WHERE source_id = :source_id"
+            ),
+            {"source_id": SOURCE_ID},
+        )
+        page_data.session.commit()
+
+        assert _walk(client, "limit=2&sort_by=loaded_at&sort_order=desc") == IDS[::-1]
+        assert _walk(client, "limit=2&sort_by=loaded_at&sort_order=asc") == IDS
+
+    def test_total_is_optional(self, client, page_data):
+        url = f"/api/prospects?source_ids={SOURCE_ID}&limit=5&cursor="
+        pagination = client.get(url).get_json()["data"]["pagination"]
+        assert "total_items" not in pagination
+
+        pagination = client.get(url + "&include_total=true").get_json()["data"][
+            "pagination"
+        ]
+        assert pagination["total_items"] == len(IDS)
+
+    def test_invalid_cursor(self, client, page_data):
+        response = client.get("/api/prospects?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+        # Cursors only continue the sort they were issued for
+        cursor = client.get(
+            f"/api/prospects?source_ids={SOURCE_ID}&limit=2&sort_by=title&cursor="
+        ).get_json()["data"]["pagination"]["next_cursor"]
+        response = client.get(f"/api/prospects?sort_by=id&cursor={cursor}")
+        assert response.status_code == 400
@@ -0,0 +1,125 @@
+"""
+Tests for full-text search behind /api/prospects search filters.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.database.models import Prospect
+from app.database.search import create_search_index, drop_search_index
+
+IDS = ["fts-test-1", "fts-test-2", "fts-test-3"]
+
+
+@pytest.fixture
+def search_data(db):
+    def clear():
+        db.session.query(Prospect).filter(Prospect.id.in_(IDS)).delete()
+        db.session.commit()
+
+    clear()
+    db.session.add_all(
+        [
+            Prospect(
+                id=IDS[0],
+                title="Cloud Hosting Services",
+                description="Managed hosting for agency systems",
+                agency="DHS",
+                extra={"alternate_naics": ["541519"], "office": "Cloud Office"},
+            ),
+            Prospect(
+                id=IDS[1],
+                title="Janitorial Support",
+                description="Cleaning of the cloud lab",
+                agency="DOT",
+                naics="561720",
+            ),
+            Prospect(
+                id=IDS[2],
+                title="Fleet Vehicle Leasing",
+                ai_enhanced_title="Vehicle Fleet Lease",
+                agency="Treasury",
+            ),
+        ]
+    )
+    db.session.commit()
+    yield db
+    db.session.rollback()
+    clear()
+
+
+def _ids(client, query):
+    response = client.get(f"/api/prospects?limit=100&{query}")
+    assert response.status_code == 200
+    return [item["id"] for item in response.get_json()["data"]["items"]]
+
+
+class TestProspectSearch:
+    """Search, keywords and NAICS filters go through the search index."""
+
+    def test_search_matches_word_prefixes(self, client, search_data):
+        assert _ids(client, "search=cloud host") == [IDS[0]]
+        assert sorted(_ids(client, "search=cloud")) == IDS[:2]
+        assert _ids(client, "search=lease") == [IDS[2]]
+        assert _ids(client, "search=treasury") == [IDS[2]]
+
+    def test_keywords_and_naics_filters(self, client, search_data):
+        assert _ids(client, "keywords=cleaning") == [IDS[1]]
+        # Agency is not a keywords column
+        assert _ids(client, "keywords=treasury") == []
+        assert _ids(client, "naics=541519") == [IDS[0]]
+        assert _ids(client, "naics=561720") == [IDS[1]]
+        assert _ids(client, "search=cloud&keywords=managed") == [IDS[0]]
+
+    def test_relevance_sort_prefers_title_matches(self, client, search_data):
+        assert _ids(client, "search=cloud&sort_by=relevance") == IDS[:2]
+
+    def test_index_follows_updates_and_deletes(self, client, search_data):
+        prospect = search_data.session.get(Prospect, IDS[1])
+        prospect.title = "Snow Removal"
+        search_data.session.commit()
+
+        assert _ids(client, "search=janitorial") == []
+        assert _ids(client, "search=snow") == [IDS[1]]
+
+        search_data.session.delete(prospect)
+        search_data.session.commit()
+        assert _ids(client, "search=snow") == []
+
+    def test_index_survives_renumbered_rowids(self, client, search_data):
+        # VACUUM may renumber the implicit rowid of a text-keyed table
+        search_data.session.execute(
+            text("UPDATE prospects SET rowid = -rowid WHERE id IN (:a, :b)"),
+            {"a": IDS[0], "b": IDS[2]},
+        )
+        search_data.session.commit()
+
+        assert _ids(client, "search=cloud host") == [IDS[0]]
+        assert _ids(client, "search=lease") == [IDS[2]]
+
+        # Moving a prospect to a new id moves its index row
+        search_data.session.execute(
+            text("UPDATE prospects SET id = :new WHERE id = :old"),
+            {"new": IDS[2] + "-moved", "old": IDS[2]},
+        )
+        search_data.session.commit()
+        try:
+            assert _ids(client, "search=lease") == [IDS[2] + "-moved"]
+        finally:
+            search_data.session.execute(
+                text("DELETE FROM prospects WHERE id = :id"), {"id": IDS[2] + "-moved"}
+            )
+            search_data.session.commit()
+
+    def test_falls_back_to_ilike_without_index(self, client, search_data):
+        with search_data.engine.begin() as connection:
+            drop_search_index(connection)
+        try:
+            assert sorted(_ids(client, "search=cloud")) == IDS[:2]
+            assert _ids(client, "naics=541519") == [IDS[0]]
+        finally:
+            with search_data.engine.begin() as connection:
+                create_search_index(connection)
+
+        # Recreating the index fills it from the existing rows
+        assert _ids(client, "search=fleet") == [IDS[2]]
@@ -74,6 +74,25 @@ def client(app):
     return app.test_client()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def llm_cache_path(tmp_path_factory):
+    """Keep the LLM response cache of the test run out of the data directory."""
+    from app.config import active_config
+    from app.utils import llm_cache
+
+    patch = pytest.MonkeyPatch()
+    patch.setattr(
+        active_config,
+        "LLM_CACHE_PATH",
+        str(tmp_path_factory.mktemp("llm_cache") / "llm_cache.db"),
+    )
+    yield
+    if llm_cache._cache is not None:
+        llm_cache._cache.close()
+        llm_cache._cache = None
+    patch.undo()
+
+
 # Global deterministic seeding for stable tests
 @pytest.fixture(scope="session", autouse=True)
 def seed_random():
@@ -0,0 +1,128 @@
+"""
+Tests for the columnar extras_json builder used during scraper transforms.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.scrapers import SCRAPERS
+
+
+def legacy_collect_extras(df: pd.DataFrame, columns: list[str]) -> list:
+    """Row-wise reference implementation of unmapped column collection."""
+
+    def create_extras_json(row):
+        extras = {}
+        for col in columns:
+            value = row.get(col)
+            if pd.notna(value) and value != "" and value is not None:
+                if isinstance(value, (int, float, str, bool)):
+                    extras[col] = value
+                else:
+                    extras[col] = str(value)
+        return extras if extras else None
+
+    def merge_with_existing_extras(row):
+        new_extras = create_extras_json(row)
+        existing = row.get("extras_json")
+        if isinstance(existing, str):
+            try:
+                existing = json.loads(existing) if existing and existing != "{}" else {}
+            except (json.JSONDecodeError, TypeError):
+                existing = {}
+        elif not isinstance(existing, dict):
+            existing = {}
+        if new_extras:
+            return {**existing, **new_extras}
+        return existing if existing else None
+
+    if "extras_json" in df.columns:
+        return df.apply(merge_with_existing_extras, axis=1).tolist()
+    return df.apply(create_extras_json, axis=1).tolist()
+
+
+@pytest.fixture
+def scraper(app):
+    return SCRAPERS["DOT"]()
+
+
+@pytest.fixture
+def mixed_df():
+    return pd.DataFrame(
+        {
+            "title": ["A", "B", "C", "D"],
+            "Contract Vehicle": ["GSA", "", None, np.nan],
+            "Count": [1, 2, 3, 4],
+            "Ratio": [0.5, np.nan, 1.5, 2.0],
+            "Flag": [True, False, True, False],
+            "When": pd.to_datetime(["2024-01-01", None, "2024-02-01", None]),
+        }
+    )
+
+
+class TestCollectUnmappedExtras:
+    """Unmapped columns are collected into the same dicts as before."""
+
+    def test_matches_legacy_without_existing(self, scraper, mixed_df):
+        columns = ["Contract Vehicle", "Count", "Ratio", "Flag", "When"]
+        expected = legacy_collect_extras(mixed_df.copy(), columns)
+
+        result = scraper._collect_unmapped_columns_to_extras(mixed_df.copy())
+
+        assert result["extras_json"].tolist() == expected
+        for actual, legacy in zip(result["extras_json"], expected):
+            assert {k: type(v) for k, v in actual.items()} == {
+                k: type(v) for k, v in legacy.items()
+            }
+
+    def test_merges_existing_json_strings_and_dicts(self, scraper, mixed_df):
+        mixed_df["extras_json"] = [
+            '{"Count": 99, "kept": "x"}',
+            {"from_dict": 1},
+            "not json",
+            '{"kept": "x"}',
+        ]
+        columns = ["Contract Vehicle", "Count", "Ratio", "Flag", "When"]
+        expected = legacy_collect_extras(mixed_df.copy(), columns)
+
+        result = scraper._collect_unmapped_columns_to_extras(mixed_df.copy())
+
+        assert result["extras_json"].tolist() == expected
+        # New values win over existing keys
+        assert result["extras_json"].iloc[0]["Count"] == 1
+        assert result["extras_json"].iloc[0]["kept"] == "x"
+
+    def test_rows_without_extras_are_none(self, scraper):
+        df = pd.DataFrame({"title": ["A", "B"], "Notes": ["", None]})
+
+        result = scraper._collect_unmapped_columns_to_extras(df)
+
+        assert result["extras_json"].tolist() == [None, None]
+
+
+class TestApplyExtrasMapping:
+    """Configured extras_fields_map values are stringified and merged."""
+
+    def test_mapping_merges_with_existing(self, scraper, mixed_df, monkeypatch):
+        monkeypatch.setattr(
+            scraper.config,
+            "extras_fields_map",
+            {
+                "Contract Vehicle": "contract_vehicle",
+                "Count": "count",
+                "Missing": "missing",
+            },
+        )
+        mixed_df["extras_json"] = ['{"count": "old", "a": 1}', None, "{}", ""]
+
+        result = scraper._apply_extras_mapping(mixed_df)
+
+        assert result["extras_json"].tolist() == [
+            {"count": "1", "a": 1, "contract_vehicle": "GSA"},
+            {"count": "2"},
+            {"count": "3"},
+            {"count": "4"},
+        ]
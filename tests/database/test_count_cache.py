@@ -0,0 +1,85 @@
+"""
+Tests for cached prospect counts and their write generation.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app.database.count_cache import count_cache
+from app.database.crud import get_prospect_statistics
+from app.database.models import Prospect
+from app.utils.duplicate_prevention import enhanced_bulk_upsert_prospects
+
+SOURCE_ID = 987201
+IDS = [f"count-test-{i}" for i in range(4)]
+
+
+@pytest.fixture
+def session(db):
+    def clear():
+        db.session.query(Prospect).filter(Prospect.id.in_(IDS)).delete()
+        db.session.commit()
+
+    clear()
+    db.session.add_all(Prospect(id=i, source_id=SOURCE_ID) for i in IDS[:2])
+    db.session.commit()
+    yield db.session
+    db.session.rollback()
+    clear()
+
+
+def _total(client):
+    response = client.get(f"/api/prospects?source_ids={SOURCE_ID}")
+    assert response.status_code == 200
+    return response.get_json()["data"]["pagination"]["total_items"]
+
+
+class TestCountCache:
+    """Counts are reused until a write to prospects commits."""
+
+    def test_counts_follow_committed_writes(self, client, session):
+        assert _total(client) == 2
+
+        session.add(Prospect(id=IDS[2], source_id=SOURCE_ID))
+        session.commit()
+        assert _total(client) == 3
+
+        enhanced_bulk_upsert_prospects(
+            [{"id": IDS[3], "source_id": SOURCE_ID}],
+            session,
+            enable_smart_matching=False,
+        )
+        assert _total(client) == 4
+
+        session.query(Prospect).filter(Prospect.source_id == SOURCE_ID).delete()
+        session.commit()
+        assert _total(client) == 0
+
+    def test_statistics_reused_until_write(self, session):
+        statements = []
+
+        def record(*args):
+            statements.append(args[2])
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            first = get_prospect_statistics()
+            assert len(statements) == 1
+            assert get_prospect_statistics() == first
+            assert len(statements) == 1
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        session.get(Prospect, IDS[0]).estimated_value_single = 1000
+        session.commit()
+        stats = get_prospect_statistics()
+        assert stats["total_prospects"] == first["total_prospects"]
+        assert stats["with_parsed_values"] == first["with_parsed_values"] + 1
+
+    def test_rollback_keeps_generation(self, session):
+        generation = count_cache.generation
+        session.add(Prospect(id=IDS[2], source_id=SOURCE_ID))
+        session.flush()
+        session.rollback()
+        assert count_cache.generation == generation
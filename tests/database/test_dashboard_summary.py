@@ -0,0 +1,60 @@
+"""
+Tests for the stored dashboard summary.
+"""
+
+import pytest
+
+from app.database import dashboard_summary
+from app.database.dashboard_summary import (
+    SUMMARY_KEY,
+    get_dashboard_summary,
+    refresh_dashboard_summary,
+)
+from app.database.models import DashboardSummary, Prospect
+
+PROSPECT_ID = "dashboard-summary-test-1"
+
+
+@pytest.fixture
+def summary_db(db):
+    def clear():
+        db.session.query(Prospect).filter_by(id=PROSPECT_ID).delete()
+        db.session.query(DashboardSummary).delete()
+        db.session.commit()
+
+    clear()
+    yield db
+    db.session.rollback()
+    clear()
+
+
+class TestDashboardSummary:
+    """The dashboard reads the stored row until prospects change."""
+
+    def test_fresh_summary_is_read_not_computed(self, summary_db, monkeypatch):
+        stored = refresh_dashboard_summary()
+        assert summary_db.session.get(DashboardSummary, SUMMARY_KEY).data == stored
+
+        def fail(session=None):
+            raise AssertionError("summary should not be recomputed")
+
+        monkeypatch.setattr(dashboard_summary, "compute_dashboard_summary", fail)
+        assert get_dashboard_summary() == stored
+
+    def test_stale_after_prospect_write(self, summary_db, monkeypatch):
+        before = refresh_dashboard_summary()["total_proposals"]
+        summary_db.session.add(Prospect(id=PROSPECT_ID, agency="Summary Agency"))
+        summary_db.session.commit()
+
+        summary = get_dashboard_summary()
+        assert summary["total_proposals"] == before + 1
+        row = summary_db.session.get(DashboardSummary, SUMMARY_KEY)
+        assert row.data["total_proposals"] == before + 1
+
+        # Disabled, every read computes live
+        monkeypatch.setattr(
+            dashboard_summary.active_config, "DASHBOARD_SUMMARY_MAX_AGE_SECONDS", 0
+        )
+        summary_db.session.query(Prospect).filter_by(id=PROSPECT_ID).delete()
+        summary_db.session.commit()
+        assert get_dashboard_summary()["total_proposals"] == before
@@ -0,0 +1,155 @@
+"""
+Tests for the prospect_naics side table and the NAICS filter built on it.
+"""
+
+import pytest
+
+from app.database.models import DataSource, Prospect, ProspectNaics
+from app.database.naics_index import replace_llm_naics_codes
+from app.utils.duplicate_prevention import enhanced_bulk_upsert_prospects
+
+IDS = ["naics-test-1", "naics-test-2", "naics-test-3"]
+
+
+@pytest.fixture
+def session(db):
+    def clear():
+        db.session.query(Prospect).filter(Prospect.id.in_(IDS)).delete()
+        db.session.query(ProspectNaics).filter(
+            ProspectNaics.prospect_id.in_(IDS)
+        ).delete()
+        db.session.commit()
+
+    clear()
+    yield db.session
+    db.session.rollback()
+    clear()
+
+
+def _codes(session, prospect_id):
+    return sorted(
+        (row.code, row.source, row.is_primary)
+        for row in session.query(ProspectNaics).filter_by(prospect_id=prospect_id)
+    )
+
+
+def _ids(client, naics):
+    response = client.get(f"/api/prospects?limit=100&naics={naics}")
+    assert response.status_code == 200
+    return sorted(item["id"] for item in response.get_json()["data"]["items"])
+
+
+class TestProspectNaics:
+    """Codes are indexed on every write path and matched by prefix."""
+
+    def test_orm_writes_are_indexed(self, session):
+        prospect = Prospect(
+            id=IDS[0],
+            title="Cloud Hosting",
+            naics="541511",
+            extra={"alternate_naics": ["541512", "518210"], "phone": "202555"},
+        )
+        session.add(prospect)
+        session.commit()
+
+        assert _codes(session, IDS[0]) == [
+            ("518210", "extra", False),
+            ("541511", "naics", True),
+            ("541512", "extra", False),
+        ]
+
+        prospect.naics = "541519"
+        prospect.extra = None
+        session.commit()
+        assert _codes(session, IDS[0]) == [("541519", "naics", True)]
+
+        session.delete(prospect)
+        session.commit()
+        assert _codes(session, IDS[0]) == []
+
+    def test_upsert_indexes_stored_rows(self, session):
+        enhanced_bulk_upsert_prospects(
+            [
+                {"id": IDS[0], "naics": "541511"},
+                {"id": IDS[1], "extra": {"primary_naics": "561720 | Janitorial"}},
+            ],
+            session,
+            enable_smart_matching=False,
+        )
+        assert _codes(session, IDS[0]) == [("541511", "naics", True)]
+        assert _codes(session, IDS[1]) == [("561720", "extra", False)]
+
+        # LLM codes survive re-ingesting the source data
+        replace_llm_naics_codes(
+            session, IDS[0], [{"code": "541512"}, {"code": "541519"}]
+        )
+        session.commit()
+        enhanced_bulk_upsert_prospects(
+            [{"id": IDS[0], "naics": "336411"}],
+            session,
+            enable_smart_matching=False,
+        )
+        assert _codes(session, IDS[0]) == [
+            ("336411", "naics", True),
+            ("541512", "llm", True),
+            ("541519", "llm", False),
+        ]
+
+    def test_reinserted_prospects_start_clean(self, session):
+        session.add(Prospect(id=IDS[0], naics="541511"))
+        session.commit()
+        replace_llm_naics_codes(session, IDS[0], [{"code": "541512"}])
+        session.commit()
+
+        # Query deletes skip the flush hook, leaving the rows behind
+        session.query(Prospect).filter(Prospect.id == IDS[0]).delete()
+        session.commit()
+        enhanced_bulk_upsert_prospects(
+            [{"id": IDS[0], "naics": "336411"}],
+            session,
+            enable_smart_matching=False,
+        )
+        assert _codes(session, IDS[0]) == [("336411", "naics", True)]
+
+        session.query(Prospect).filter(Prospect.id == IDS[0]).delete()
+        session.commit()
+        session.add(Prospect(id=IDS[0], naics="561720"))
+        session.commit()
+        assert _codes(session, IDS[0]) == [("561720", "naics", True)]
+
+    def test_clearing_a_source_drops_its_codes(self, auth_client, session):
+        source = DataSource(name="NAICS Test Source", url="https://example.com")
+        session.add(source)
+        session.flush()
+        session.add(Prospect(id=IDS[0], naics="541511", source_id=source.id))
+        session.commit()
+        replace_llm_naics_codes(session, IDS[0], [{"code": "541512"}])
+        session.commit()
+
+        auth_client.set_role("super_admin")
+        response = auth_client.post(f"/api/data-sources/{source.id}/clear-data")
+        assert response.status_code == 200
+        session.expire_all()
+        assert _codes(session, IDS[0]) == []
+
+        session.delete(source)
+        session.commit()
+
+    def test_filter_matches_codes_and_prefixes(self, client, session):
+        session.add_all(
+            [
+                Prospect(id=IDS[0], naics="541511"),
+                Prospect(id=IDS[1], naics="561720", extra={"naics_alt": "541330"}),
+                Prospect(id=IDS[2], naics="TBD"),
+            ]
+        )
+        session.commit()
+        replace_llm_naics_codes(session, IDS[2], [{"code": "541519"}])
+        session.commit()
+
+        assert _ids(client, "541511") == [IDS[0]]
+        assert _ids(client, "5415") == [IDS[0], IDS[2]]
+        assert _ids(client, "54") == IDS
+        assert _ids(client, "56") == [IDS[1]]
+        # Non-numeric terms match the NAICS column text
+        assert _ids(client, "tbd") == [IDS[2]]
@@ -0,0 +1,292 @@
+"""
+Tests for the batch upsert paths with and without smart matching.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.database.models import Prospect
+from app.utils.duplicate_prevention import (
+    CandidateIndex,
+    DuplicateDetector,
+    enhanced_bulk_upsert_prospects,
+)
+
+IDS = ["upsert-test-1", "upsert-test-2", "upsert-test-3"]
+
+
+@pytest.fixture
+def session(db):
+    db.session.query(Prospect).filter(Prospect.id.in_(IDS)).delete()
+    db.session.commit()
+    yield db.session
+    db.session.rollback()
+    db.session.query(Prospect).filter(Prospect.id.in_(IDS)).delete()
+    db.session.commit()
+
+
+def _upsert(session, records, preserve_ai_data=True):
+    return enhanced_bulk_upsert_prospects(
+        records,
+        session,
+        preserve_ai_data=preserve_ai_data,
+        enable_smart_matching=False,
+    )
+
+
+class TestBatchUpsert:
+    """Inserts, updates and AI field preservation through ON CONFLICT."""
+
+    def test_inserts_then_updates(self, session):
+        stats = _upsert(
+            session,
+            [
+                {"id": IDS[0], "title": "First", "naics": "541511"},
+                {"id": IDS[1], "title": "Second", "naics": None},
+            ],
+        )
+        assert stats["inserted"] == 2
+        assert stats["matched"] == 0
+
+        stats = _upsert(
+            session,
+            [
+                {"id": IDS[0], "title": "First v2", "naics": "541512"},
+                {"id": IDS[2], "title": "Third", "naics": None},
+            ],
+        )
+        assert stats["processed"] == 2
+        assert stats["inserted"] == 1
+        assert stats["matched"] == stats["updated"] == 1
+        assert stats["ai_preserved"] == 0
+
+        first = session.get(Prospect, IDS[0])
+        assert first.title == "First v2"
+        assert first.naics == "541512"
+        assert first.enhancement_status == "idle"
+        assert session.get(Prospect, IDS[2]).title == "Third"
+
+    def test_preserves_ai_fields_on_processed_rows(self, session):
+        _upsert(session, [{"id": IDS[0], "title": "Old"}, {"id": IDS[1]}])
+        processed = session.get(Prospect, IDS[0])
+        processed.naics = "541511"
+        processed.ai_enhanced_title = "AI Title"
+        processed.ollama_processed_at = datetime.now(timezone.utc)
+        session.commit()
+
+        records = [
+            {
+                "id": IDS[0],
+                "title": "New",
+                "naics": None,
+                "ai_enhanced_title": None,
+                "ollama_processed_at": None,
+            },
+            {
+                "id": IDS[1],
+                "title": "New",
+                "naics": "336411",
+                "ai_enhanced_title": None,
+                "ollama_processed_at": None,
+            },
+        ]
+        stats = _upsert(session, records)
+        assert stats["ai_preserved"] == 1
+        assert stats["matched"] == 2
+
+        processed = session.get(Prospect, IDS[0])
+        assert processed.title == "New"
+        assert processed.naics == "541511"
+        assert processed.ai_enhanced_title == "AI Title"
+        assert processed.ollama_processed_at is not None
+        # Rows without AI processing take the incoming values
+        assert session.get(Prospect, IDS[1]).naics == "336411"
+
+        # Without preservation everything is overwritten
+        stats = _upsert(session, records[:1], preserve_ai_data=False)
+        assert stats["ai_preserved"] == 0
+        processed = session.get(Prospect, IDS[0])
+        assert processed.naics is None
+        assert processed.ollama_processed_at is None
+
+    def test_chunks_rows_and_mixed_columns(self, session, monkeypatch):
+        monkeypatch.setattr("app.utils.duplicate_prevention.UPSERT_MAX_PARAMS", 2)
+        stats = _upsert(
+            session,
+            [
+                {"id": IDS[0], "title": "A"},
+                {"id": IDS[1], "title": "B"},
+                {"id": IDS[2], "description": "C only", "unknown_key": 1},
+            ],
+        )
+        assert stats["inserted"] == 3
+        assert session.get(Prospect, IDS[2]).description == "C only"
+
+
+SMART_SOURCE_ID = 987654
+
+EXISTING = [
+    {
+        "id": "smart-test-1",
+        "native_id": "N-1",
+        "title": "Cloud Hosting Services",
+        "description": "Managed cloud hosting",
+        "agency": "DHS",
+        "naics": "518210",
+        "place_city": "Washington",
+        "place_state": "DC",
+    },
+    {
+        "id": "smart-test-2",
+        "native_id": None,
+        "title": "Network Security Operations Center Support",
+        "description": "24x7 SOC monitoring",
+        "agency": "DOT",
+        "naics": "541512",
+        "place_city": "Austin",
+        "place_state": "TX",
+    },
+    {
+        "id": "smart-test-3",
+        "native_id": "N-3",
+        "title": "Janitorial Services",
+        "description": "Facility cleaning",
+        "agency": "DHS",
+        "naics": "561720",
+        "place_city": "Boston",
+        "place_state": "MA",
+    },
+]
+
+
+@pytest.fixture
+def smart_session(db):
+    def clear():
+        db.session.query(Prospect).filter(
+            Prospect.source_id == SMART_SOURCE_ID
+        ).delete()
+        db.session.commit()
+
+    clear()
+    db.session.add_all(
+        Prospect(source_id=SMART_SOURCE_ID, **fields) for fields in EXISTING
+    )
+    db.session.commit()
+    yield db.session
+    db.session.rollback()
+    clear()
+
+
+class TestSmartMatchingUpsert:
+    """Smart matching consults the per-source candidate index."""
+
+    RECORDS = [
+        # Same native_id, slightly edited title
+        {**EXISTING[0], "title": "Cloud Hosting Service"},
+        # No native_id, NAICS + location with a retitled requirement
+        {**EXISTING[1], "title": "Network Security Operations Centre Support"},
+        # Same native_id reused for different work
+        {**EXISTING[2], "title": "Snow Removal", "description": "Winter"},
+        # Unrelated new requirement
+        {
+            "native_id": "N-9",
+            "title": "Fleet Vehicle Leasing",
+            "agency": "DOT",
+            "naics": "532112",
+            "place_city": "Denver",
+            "place_state": "CO",
+        },
+    ]
+    RECORDS = [
+        {**{k: v for k, v in record.items() if k != "id"}, "source_id": SMART_SOURCE_ID}
+        for record in RECORDS
+    ]
+
+    def test_index_matches_unindexed_queries(self, smart_session):
+        indexed = DuplicateDetector()
+        indexed.preload_source_prospects(smart_session, SMART_SOURCE_ID)
+        unindexed = DuplicateDetector()
+
+        for record in self.RECORDS:
+            expected = unindexed.find_potential_matches(
+                smart_session, record, SMART_SOURCE_ID
+            )
+            actual = indexed.find_potential_matches(
+                smart_session, record, SMART_SOURCE_ID
+            )
+            assert actual == expected
+
+    def test_upsert_updates_matches_and_inserts_new(self, smart_session):
+        records = [dict(record) for record in self.RECORDS]
+        stats = enhanced_bulk_upsert_prospects(
+            records, smart_session, source_id=SMART_SOURCE_ID
+        )
+
+        # Only the native_id match clears DUPLICATE_MIN_CONFIDENCE
+        assert stats["processed"] == 4
+        assert stats["duplicates_prevented"] == 1
+        assert stats["inserted"] == 3
+        matched = smart_session.query(Prospect).filter_by(native_id="N-1").one()
+        assert matched.title == "Cloud Hosting Service"
+        assert (
+            smart_session.query(Prospect)
+            .filter(Prospect.source_id == SMART_SOURCE_ID)
+            .count()
+            == 6
+        )
+
+        # Re-running the same batch matches every record by primary ID
+        stats = enhanced_bulk_upsert_prospects(
+            records, smart_session, source_id=SMART_SOURCE_ID
+        )
+        assert stats["inserted"] == 0
+        assert stats["matched"] == 4
+
+
+class TestCandidateIndex:
+    """Blocking keys are maintained as prospects change."""
+
+    def test_reindexing_moves_blocks(self):
+        prospect = Prospect(
+            id="p1",
+            native_id="N-1",
+            title="Cloud Hosting",
+            agency="DHS",
+            naics="518210",
+            place_city="Washington",
+            place_state="DC",
+        )
+        index = CandidateIndex([prospect])
+
+        assert index.naics_location_candidates("518210", "WASHINGTON", "dc") == [
+            prospect
+        ]
+        assert index.title_candidates("Hosting for the cloud") == [prospect]
+
+        prospect.title = "Data Analytics"
+        prospect.place_city = "Austin"
+        index.add(prospect)
+
+        assert index.title_candidates("Cloud Hosting") == []
+        assert index.title_candidates("analytics") == [prospect]
+        assert index.naics_location_candidates("518210", "Washington", "DC") == []
+        assert index.agency_location_candidates("DHS", "austin", "DC") == [prospect]
+
+        index.remove("p1")
+        assert len(index) == 0
+        assert index.native_id_candidates("N-1") == []
+
+    def test_title_candidates_keep_most_shared_tokens(self):
+        prospects = [
+            Prospect(id="p1", title="Cloud Hosting Services"),
+            Prospect(id="p2", title="Cloud Storage"),
+            Prospect(id="p3", title="Hosting Data"),
+            Prospect(id="p4", title="Cloud Hosting Migration"),
+        ]
+        index = CandidateIndex(prospects)
+        index.FUZZY_BLOCK_LIMIT = 3
+
+        candidates = [p.id for p in index.title_candidates("Cloud Hosting")]
+        assert len(candidates) == 3
+        assert candidates[:2] == ["p1", "p4"]
@@ -0,0 +1,87 @@
+"""
+Tests for converting prospect DataFrames into bulk upsert records.
+"""
+
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from app.database.crud import dataframe_to_records
+
+
+class TestDataFrameToRecords:
+    """Test the single-pass frame to record conversion."""
+
+    def test_nulls_become_none_and_scalars_are_unboxed(self):
+        df = pd.DataFrame(
+            {
+                "id": ["a", "b"],
+                "estimated_value_single": [1500.0, np.nan],
+                "award_fiscal_year": pd.array([2025, None], dtype="Int64"),
+                "place_city": [None, "Austin"],
+                "naics": pd.Series([np.int64(541511), None], dtype=object),
+                "source_id": [1, 1],
+            }
+        )
+
+        records = dataframe_to_records(df)
+
+        assert records == [
+            {
+                "id": "a",
+                "estimated_value_single": 1500.0,
+                "award_fiscal_year": 2025,
+                "place_city": None,
+                "naics": 541511,
+                "source_id": 1,
+            },
+            {
+                "id": "b",
+                "estimated_value_single": None,
+                "award_fiscal_year": None,
+                "place_city": "Austin",
+                "naics": None,
+                "source_id": 1,
+            },
+        ]
+        for record in records:
+            for value in record.values():
+                assert not isinstance(value, np.generic)
+
+    def test_date_columns_become_dates(self):
+        df = pd.DataFrame(
+            {
+                "release_date": pd.to_datetime(["2024-01-15", None]),
+                "award_date": [date(2025, 3, 1), None],
+            }
+        )
+
+        records = dataframe_to_records(df)
+
+        assert records[0] == {
+            "release_date": date(2024, 1, 15),
+            "award_date": date(2025, 3, 1),
+        }
+        assert records[1] == {"release_date": None, "award_date": None}
+        assert type(records[0]["release_date"]) is date
+
+    def test_column_selection_rename_and_loaded_at(self):
+        df = pd.DataFrame(
+            {
+                "id": ["a"],
+                "extras_json": [{"vehicle": "GSA"}],
+                "unmapped": ["dropped"],
+                "loaded_at": [datetime.now(timezone.utc)],
+            }
+        )
+
+        records = dataframe_to_records(
+            df,
+            columns=["id", "extras_json", "loaded_at"],
+            rename={"extras_json": "extra"},
+        )
+
+        assert records == [{"id": "a", "extra": {"vehicle": "GSA"}}]
+        # The source frame is left untouched
+        assert list(df.columns) == ["id", "extras_json", "unmapped", "loaded_at"]
@@ -0,0 +1,88 @@
+"""
+Tests for the bulk enhancement worker pool.
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.database.models import Prospect
+from app.services.enhancement_workers import AdaptiveBackoff, EnhancementWorkerPool
+
+PROSPECT_IDS = [f"worker-pool-test-{i}" for i in range(6)]
+
+
+@pytest.fixture
+def pool_db(db):
+    def clear():
+        db.session.query(Prospect).filter(Prospect.id.in_(PROSPECT_IDS)).delete()
+        db.session.commit()
+
+    clear()
+    db.session.add_all(
+        Prospect(id=prospect_id, title=f"Title {i}", agency="Pool Agency")
+        for i, prospect_id in enumerate(PROSPECT_IDS)
+    )
+    db.session.commit()
+    yield db
+    db.session.rollback()
+    clear()
+
+
+class TestEnhancementWorkerPool:
+    """Workers enhance prospects concurrently and commit their results."""
+
+    def test_enhances_on_several_workers(self, app, pool_db, monkeypatch):
+        monkeypatch.setattr(
+            "app.services.enhancement_workers.active_config.LLM_BACKOFF_BASE_SECONDS",
+            0.01,
+        )
+        lock = threading.Lock()
+        running, peak, threads = [0], [0], set()
+
+        def enhance(prospect):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+                threads.add(threading.get_ident())
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            if prospect.id == PROSPECT_IDS[0]:
+                raise ValueError("bad prospect")
+            prospect.ai_enhanced_title = f"Enhanced {prospect.title}"
+            return {"titles": True}
+
+        processed = []
+        pool = EnhancementWorkerPool(
+            app,
+            enhance,
+            workers=3,
+            commit_batch_size=2,
+            on_processed=lambda *args: processed.append(args),
+        )
+        stats = pool.run(PROSPECT_IDS)
+
+        assert (stats.processed, stats.enhanced, stats.errors) == (6, 5, 1)
+        assert stats.per_minute > 0
+        assert len(threads) == 3 and peak[0] > 1
+        assert len(processed) == 6
+
+        pool_db.session.expire_all()
+        titles = {
+            prospect.id: prospect.ai_enhanced_title
+            for prospect in Prospect.query.filter(Prospect.id.in_(PROSPECT_IDS))
+        }
+        assert titles[PROSPECT_IDS[0]] is None
+        assert titles[PROSPECT_IDS[5]] == "Enhanced Title 5"
+        assert sum(title is not None for title in titles.values()) == 5
+
+    def test_backoff_grows_on_failure_and_recovers(self):
+        backoff = AdaptiveBackoff(base_seconds=1, max_seconds=4)
+        for expected in (1, 2, 4, 4):
+            backoff.failed()
+            assert backoff.delay == expected
+        for expected in (2, 1, 0):
+            backoff.succeeded()
+            assert backoff.delay == expected
@@ -0,0 +1,84 @@
+"""
+Tests for the in-process event bus behind /api/events/stream.
+"""
+
+import pytest
+
+from app.database.models import DataSource, ScraperStatus
+from app.services import event_bus as event_bus_module
+from app.services.event_bus import EventBus, event_bus
+
+
+class TestEventBus:
+    """Events fan out by topic and are retained for reconnecting clients."""
+
+    def test_subscribers_get_their_topics(self):
+        bus = EventBus()
+        scans = bus.subscribe(["duplicate_scan"])
+        everything = bus.subscribe(["duplicate_scan", "scraper"])
+
+        bus.publish("scraper", "status", {"source_id": 1})
+        bus.publish("duplicate_scan", "progress", {"scan_id": "s"})
+
+        assert scans.get(timeout=0).data == {"scan_id": "s"}
+        assert scans.get(timeout=0) is None
+        assert [everything.get(timeout=0).topic for _ in range(2)] == [
+            "scraper",
+            "duplicate_scan",
+        ]
+
+        bus.unsubscribe(scans)
+        bus.publish("duplicate_scan", "progress", {"scan_id": "t"})
+        assert scans.get(timeout=0) is None
+
+        with pytest.raises(ValueError):
+            bus.publish("nope", "x", {})
+
+    def test_replay_and_overflow(self, monkeypatch):
+        bus = EventBus()
+        first = bus.publish("enhancement", "item", {"n": 1})
+        bus.publish("scraper", "status", {"n": 2})
+        bus.publish("enhancement", "item", {"n": 3})
+
+        # Reconnecting clients get the retained events they missed
+        replay = bus.subscribe(["enhancement"], last_event_id=first.id)
+        assert replay.get(timeout=0).data == {"n": 3}
+        assert replay.get(timeout=0) is None
+
+        monkeypatch.setattr(event_bus_module, "SUBSCRIBER_QUEUE_SIZE", 1)
+        slow = bus.subscribe(["enhancement"])
+        bus.publish("enhancement", "item", {"n": 4})
+        bus.publish("enhancement", "item", {"n": 5})
+        assert slow.overflowed
+        assert slow.get(timeout=0).data == {"n": 4}
+
+    def test_scraper_transitions_published_on_commit(self, db):
+        source = DataSource(name="Event Bus Test Source", url="https://example.com")
+        db.session.add(source)
+        db.session.commit()
+        subscription = event_bus.subscribe(["scraper"])
+        try:
+            status = ScraperStatus(source_id=source.id, status="working")
+            db.session.add(status)
+            db.session.flush()
+            assert subscription.get(timeout=0) is None
+            db.session.commit()
+            published = subscription.get(timeout=0)
+            assert (published.data["source_id"], published.data["status"]) == (
+                source.id,
+                "working",
+            )
+
+            # Rolled back and unchanged statuses are not published
+            status.status = "failed"
+            db.session.flush()
+            db.session.rollback()
+            status.details = "still working"
+            db.session.commit()
+            assert subscription.get(timeout=0) is None
+        finally:
+            event_bus.unsubscribe(subscription)
+            db.session.rollback()
+            db.session.query(ScraperStatus).filter_by(source_id=source.id).delete()
+            db.session.delete(source)
+            db.session.commit()
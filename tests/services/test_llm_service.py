@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from app.database.models import Prospect
 from app.services.llm_service import LLMService
+from app.services.set_aside_standardization import StandardSetAside
 
 @pytest.fixture
 def service():
@@ -38,6 +42,32 @@ def test_check_ollama_status_unavailable(service, monkeypatch):
     assert "connection refused" in status["error"]
 
 
+def test_get_ollama_status_served_from_heartbeat(service, monkeypatch):
+    checks = []
+
+    def fake_check(timeout=5.0):
+        checks.append(timeout)
+        return {"available": len(checks) > 1}
+
+    monkeypatch.setattr(service, "check_ollama_status", fake_check)
+    monkeypatch.setattr(
+        "app.services.llm_service.active_config.OLLAMA_HEARTBEAT_SECONDS", 0.05
+    )
+    try:
+        # The first call checks inline, later ones read the heartbeat result
+        assert service.get_ollama_status()["available"] is False
+        assert "checked_at" in service.get_ollama_status()
+        assert len(checks) == 1
+
+        deadline = time.time() + 5
+        while len(checks) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert service.get_ollama_status()["available"] is True
+    finally:
+        service._heartbeat_stop.set()
+        service._heartbeat_thread.join(timeout=5)
+
+
 @patch("app.services.llm_service.call_ollama")
 def test_parse_contract_value_with_llm_success(mock_call, service):
     mock_call.return_value = json.dumps({"single": 100000, "min": 90000, "max": 110000})
@@ -65,3 +95,98 @@ def test_parse_contract_value_with_llm_empty_response(mock_call, service, caplog
         )
         is False
     )
+
+
+def test_enhance_single_prospect_sends_prompts_concurrently(service, monkeypatch):
+    threads = set()
+
+    def slow(result):
+        def call(*args, **kwargs):
+            threads.add(threading.get_ident())
+            time.sleep(0.2)
+            return result
+
+        return call
+
+    monkeypatch.setattr(
+        service,
+        "enhance_title_with_llm",
+        slow({"enhanced_title": "Better Title", "confidence": 0.9}),
+    )
+    monkeypatch.setattr(
+        service,
+        "parse_contract_value_with_llm",
+        slow({"single": 100000.0, "min": None, "max": None}),
+    )
+    monkeypatch.setattr(
+        service,
+        "classify_naics_with_llm",
+        slow(
+            {
+                "code": "541511",
+                "description": "Custom Computer Programming Services",
+                "confidence": 0.8,
+                "all_codes": [],
+            }
+        ),
+    )
+    monkeypatch.setattr(
+        service,
+        "standardize_set_aside_with_llm",
+        slow(StandardSetAside.SMALL_BUSINESS),
+    )
+    monkeypatch.setattr(
+        "app.services.llm_service.replace_llm_naics_codes", lambda *args: None
+    )
+
+    prospect = Prospect(
+        id="concurrent-test-1",
+        title="IT support",
+        description="Help desk and software support",
+        estimated_value_text="Up to $100k",
+        set_aside="Partial Small Business",
+        extra={},
+    )
+    updates = []
+
+    started = time.perf_counter()
+    results = service.enhance_single_prospect(
+        prospect, "all", updates.append, concurrent=True
+    )
+    elapsed = time.perf_counter() - started
+
+    assert all(results.values())
+    assert elapsed < 0.6
+    assert len(threads) == 4
+    assert prospect.ai_enhanced_title == "Better Title"
+    assert prospect.estimated_value_single == 100000.0
+    assert prospect.naics == "541511"
+    assert prospect.set_aside_standardized == StandardSetAside.SMALL_BUSINESS.code
+
+    fields = ["titles", "values", "naics", "set_asides"]
+    assert [(u["status"], u["field"]) for u in updates] == [
+        ("processing", field) for field in fields
+    ] + [("completed", field) for field in fields]
+
+
+@patch("app.services.llm_service.call_ollama")
+def test_enhance_single_prospect_parses_plain_inputs_without_llm(mock_call, service):
+    prospect = Prospect(
+        id="rule-test-1",
+        estimated_value_text="$1M - $5M",
+        set_aside="Small Business Set-Aside",
+        extra={},
+    )
+
+    results = service.enhance_single_prospect(prospect, "values,set_asides")
+
+    assert results["values"] and results["set_asides"]
+    mock_call.assert_not_called()
+    assert (prospect.estimated_value_min, prospect.estimated_value_max) == (
+        1000000.0,
+        5000000.0,
+    )
+    assert prospect.estimated_value_single is None
+    assert prospect.set_aside_standardized == "SMALL_BUSINESS"
+    assert prospect.extra["value_parsing"]["source"] == "rule"
+    assert prospect.extra["set_aside_standardization"]["source"] == "rule"
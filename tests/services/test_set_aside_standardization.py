@@ -209,3 +209,26 @@ class TestSetAsideStandardization:
 
         # Should end with clear instruction
         assert "Respond with ONLY the exact category name" in prompt
+
+    def test_match_exact(self, standardizer):
+        """Texts naming one standard type match it, anything else does not."""
+        test_cases = [
+            ("Small Business Set-Aside", StandardSetAside.SMALL_BUSINESS),
+            ("8(a) Competitive", StandardSetAside.EIGHT_A),
+            ("HubZone", StandardSetAside.HUBZONE),
+            ("WOSB Sole Source", StandardSetAside.WOMEN_OWNED),
+            ("Service-Disabled Veteran Owned", StandardSetAside.VETERAN_OWNED),
+            ("Unrestricted", StandardSetAside.FULL_AND_OPEN),
+            ("TBD", StandardSetAside.NOT_AVAILABLE),
+            ("Small Business Program: 8(a)", StandardSetAside.EIGHT_A),
+            (
+                "Set-aside: SDVOSB; Small Business Program: VOSB",
+                StandardSetAside.VETERAN_OWNED,
+            ),
+            ("Set-aside: Full; Small Business Program: WOSB", None),
+            ("Partial Small Business", None),
+            ("", None),
+        ]
+
+        for text, expected in test_cases:
+            assert standardizer.match_exact(text) is expected, text
@@ -0,0 +1,48 @@
+"""
+Tests for the JSON provider used by API responses.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.utils import json_provider
+
+VALUES = {
+    "value": Decimal("1250000.50"),
+    "release_date": date(2025, 1, 31),
+    "naive": datetime(2025, 1, 31, 8, 30, 15, 120000),
+    "aware": datetime(2025, 1, 31, 8, 30, tzinfo=timezone.utc),
+    "offset": datetime(2025, 1, 31, 8, 30, tzinfo=timezone(timedelta(hours=-5))),
+    "nested": [{"when": date(2024, 12, 1)}],
+}
+
+EXPECTED = (
+    '{"aware":"2025-01-31T08:30:00Z",'
+    '"naive":"2025-01-31T08:30:15.120000Z",'
+    '"nested":[{"when":"2024-12-01"}],'
+    '"offset":"2025-01-31T08:30:00-05:00",'
+    '"release_date":"2025-01-31",'
+    '"value":"1250000.50"}'
+)
+
+
+class TestJSONProvider:
+    """orjson and the standard library fallback write the same JSON."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_native_types(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(json_provider, "orjson", None)
+        elif json_provider.orjson is None:
+            pytest.skip("orjson is not installed")
+        assert json_provider.dumps(VALUES) == EXPECTED
+
+    def test_flask_responses(self, app, monkeypatch):
+        # Debug mode pretty-prints unless compact output is forced
+        monkeypatch.setattr(app.json, "compact", True)
+        with app.test_request_context():
+            response = app.json.response(VALUES)
+        assert response.get_data(as_text=True) == EXPECTED + "\n"
+        assert response.mimetype == "application/json"
@@ -0,0 +1,104 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+
+import pytest
+
+from app.config import active_config
+from app.services.llm_service import LLMService
+from app.utils import llm_cache, llm_utils
+from app.utils.llm_cache import LLMResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(active_config, "LLM_CACHE_ENABLED", True)
+    cache = LLMResponseCache(
+        path=str(tmp_path / "llm_cache.db"), ttl_seconds=3600, max_entries=2
+    )
+    yield cache
+    cache.close()
+
+
+class TestLLMResponseCache:
+    """Responses are found by model and prompt, and evicted by age and count."""
+
+    def test_get_and_put(self, cache):
+        assert cache.get("model", "Parse: $1M - $5M") is None
+        cache.put("model", "Parse: $1M - $5M", '{"min": 1000000}')
+
+        assert cache.get("model", "Parse:  $1M - $5M\n") == '{"min": 1000000}'
+        assert cache.get("other-model", "Parse: $1M - $5M") is None
+        assert cache.get("model", "Parse: $1M - $5M", {"temperature": 0}) is None
+        assert cache.stats() == {
+            "enabled": True,
+            "hits": 1,
+            "misses": 3,
+            "hit_rate": 0.25,
+            "entries": 1,
+        }
+
+    def test_expiry_and_eviction(self, cache, monkeypatch):
+        monkeypatch.setattr(llm_cache, "_PRUNE_EVERY", 1)
+        now = [1000.0]
+        monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+
+        for prompt in ("a", "b"):
+            cache.put("model", prompt, prompt.upper())
+            now[0] += 1
+        cache.get("model", "a")  # b is now least recently used
+        cache.put("model", "c", "C")
+        assert [cache.get("model", p) for p in "abc"] == ["A", None, "C"]
+
+        now[0] += 3600
+        assert cache.get("model", "c") is None
+
+    def test_call_ollama_uses_cache(self, cache, monkeypatch):
+        calls = []
+
+        class Client:
+            def generate(self, prompt, model_name, options=None):
+                calls.append(prompt)
+                return None if prompt == "down" else f"echo {prompt}"
+
+        monkeypatch.setattr(llm_utils, "get_ollama_client", Client)
+        monkeypatch.setattr(llm_utils, "get_llm_cache", lambda: cache)
+
+        # Responses are only stored once their caller parsed them
+        assert llm_utils.call_ollama("title", "model") == "echo title"
+        assert calls == ["title"]
+        llm_utils.cache_llm_response("title", "model", "echo title")
+        assert llm_utils.call_ollama("title", "model") == "echo title"
+        assert llm_utils.call_ollama("title", "model", use_cache=False)
+        assert llm_utils.call_ollama("down", "model") is None
+        llm_utils.cache_llm_response("down", "model", None)
+        assert llm_utils.call_ollama("down", "model") is None
+        assert calls == ["title", "title", "down", "down"]
+
+    def test_unparsed_responses_are_not_replayed(self, cache, monkeypatch):
+        replies = iter(["not json", '{"single": 5000}'])
+        calls = []
+
+        class Client:
+            def generate(self, prompt, model_name, options=None):
+                calls.append(prompt)
+                return next(replies)
+
+        monkeypatch.setattr(llm_utils, "get_ollama_client", Client)
+        monkeypatch.setattr(llm_utils, "get_llm_cache", lambda: cache)
+
+        service = LLMService(model_name="test-model")
+        for expected in (None, 5000.0, 5000.0):
+            result = service.parse_contract_value_with_llm("About 5k")
+            assert result["single"] == expected
+        assert len(calls) == 2
+
+    def test_storing_again_keeps_age(self, cache, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+
+        cache.put("model", "a", "A")
+        now[0] += 3000
+        cache.put("model", "a", "A")
+        now[0] += 1000
+        assert cache.get("model", "a") is None
@@ -0,0 +1,88 @@
+"""
+Tests for the pooled Ollama client, run against a local stub server.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.utils.llm_utils import OllamaClient
+
+
+class _StubOllama(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections alive
+
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server.requests.append(payload)
+        server.client_ports.add(self.client_address[1])
+
+        status, delay = server.replies.pop(0) if server.replies else (200, 0)
+        time.sleep(delay)
+        body = json.dumps({"response": f" echo {payload['prompt']} "}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOllama)
+    server.requests, server.client_ports, server.replies = [], set(), []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, **kwargs):
+    host, port = server.server_address
+    kwargs.setdefault("backoff_seconds", 0.01)
+    return OllamaClient(generate_url=f"http://{host}:{port}/api/generate", **kwargs)
+
+
+class TestOllamaClient:
+    """Calls reuse pooled connections and retry transient failures."""
+
+    def test_reuses_connection(self, stub):
+        client = _client(stub, keep_alive="10m")
+        try:
+            for prompt in ("title", "value", "naics", "set-aside"):
+                assert client.generate(prompt, "test-model") == f"echo {prompt}"
+        finally:
+            client.close()
+
+        assert len(stub.client_ports) == 1
+        assert stub.requests[0] == {
+            "model": "test-model",
+            "prompt": "title",
+            "stream": False,
+            "options": {},
+            "keep_alive": "10m",
+        }
+
+    def test_retries_server_errors_and_timeouts(self, stub):
+        client = _client(stub, max_retries=2)
+        stub.replies = [(503, 0), (200, 0.5)]
+        try:
+            assert client.generate("retry", "test-model", timeout=0.2) == "echo retry"
+            assert len(stub.requests) == 3
+
+            # Client errors are not retried, retries give up eventually
+            stub.replies = [(400, 0)]
+            assert client.generate("bad", "test-model") is None
+            stub.replies = [(500, 0)] * 3
+            assert client.generate("down", "test-model") is None
+            assert len(stub.requests) == 7
+        finally:
+            client.close()
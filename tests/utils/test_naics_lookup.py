@@ -6,9 +6,15 @@ Tests NAICS code validation and description lookup functionality.
 
 from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
+
 from app.utils.naics_lookup import (
+    extract_naics_from_extra,
     get_naics_description,
     get_naics_info,
+    normalize_naics_series,
+    parse_naics_value,
     validate_naics_code,
 )
 
@@ -199,3 +205,67 @@ class TestNAICSDataLoading:
             # These should be handled as invalid by validation
             is_valid = validate_naics_code(partial_code)
             assert is_valid is False, f"Partial code {partial_code} should be invalid"
+
+
+class TestExtractNAICSFromExtra:
+    """Test NAICS extraction from a prospect's extra JSON."""
+
+    def test_known_keys_and_fallbacks(self):
+        """Test keys are tried in order before scanning every value."""
+        assert extract_naics_from_extra({"naics_code": "541511"})["code"] == "541511"
+        found = extract_naics_from_extra('{"primary_naics": "561720 | Janitorial"}')
+        assert found == {
+            "code": "561720",
+            "description": "Janitorial",
+            "found_in_extra": True,
+        }
+        assert extract_naics_from_extra({"notes": "Code 541512 work"})["code"] == (
+            "541512"
+        )
+        for extra in (None, "not json", ["541511"], {"naics": "TBD"}):
+            assert extract_naics_from_extra(extra)["found_in_extra"] is False
+
+
+class TestNormalizeNAICSSeries:
+    """Test vectorized NAICS normalization used during ingest."""
+
+    def test_matches_parse_naics_value(self):
+        """Test codes and descriptions match the scalar parser."""
+        values = pd.Series(
+            [
+                "541511 | Custom Programming",
+                "541511: Colon Format",
+                "541519 - Other Computer Related Services",
+                "541511 Space Format",
+                "541511",
+                "336510.0",
+                541512,
+                541512.0,
+                "541511 - foo | bar",
+                "541511 |",
+                "54-1511",
+                "ABC",
+                "541511 | Custom Programming",
+            ],
+            index=range(10, 23),
+        )
+
+        result = normalize_naics_series(values)
+
+        assert result.index.equals(values.index)
+        for label, value in values.items():
+            expected = parse_naics_value(str(value).strip())
+            assert result.at[label, "code"] == expected["code"], value
+            if expected["description"] is None:
+                assert pd.isna(result.at[label, "description"]), value
+            else:
+                assert result.at[label, "description"] == expected["description"]
+
+    def test_blank_and_placeholder_values(self):
+        """Test blanks and placeholders yield no code or description."""
+        result = normalize_naics_series(
+            pd.Series([None, np.nan, "", "  ", "TBD", "n/a"])
+        )
+
+        assert result["code"].isna().all()
+        assert result["description"].isna().all()
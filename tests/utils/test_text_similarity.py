@@ -0,0 +1,82 @@
+"""
+Tests for the duplicate detection text similarity backends.
+"""
+
+import difflib
+import gc
+import random
+import weakref
+
+import pytest
+
+from app.config import active_config
+from app.utils.duplicate_prevention import DuplicateDetector
+from app.utils.text_similarity import get_similarity_backend, text_similarity
+
+WORDS = [
+    "cloud",
+    "hosting",
+    "network",
+    "security",
+    "support",
+    "services",
+    "janitorial",
+    "training",
+    "logistics",
+    "engineering",
+]
+
+
+def _random_pairs(count: int):
+    rng = random.Random(7)
+    for _ in range(count):
+        first = " ".join(rng.choices(WORDS, k=rng.randint(1, 6)))
+        second = list(first)
+        for _ in range(rng.randint(0, 8)):
+            second[rng.randrange(len(second))] = rng.choice("abcdefgh ")
+        yield first, "".join(second)
+
+
+class TestTextSimilarity:
+    """Thresholded scoring agrees with the exact difflib ratio."""
+
+    def test_matches_difflib_ratio(self):
+        for first, second in _random_pairs(200):
+            expected = difflib.SequenceMatcher(
+                None, first.lower(), second.strip().lower()
+            ).ratio()
+            if second.strip() and len(second.strip()) >= 3:
+                assert text_similarity(first, second) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("threshold", [0.6, 0.7, 0.8, 0.9])
+    def test_threshold_never_changes_the_outcome(self, threshold):
+        for first, second in _random_pairs(300):
+            exact = text_similarity(first, second)
+            bounded = text_similarity(first, second, threshold)
+            assert (bounded >= threshold) == (exact >= threshold)
+            if exact >= threshold:
+                assert bounded == exact
+
+    def test_trigram_backend_skips_unrelated_text(self, monkeypatch):
+        monkeypatch.setattr(active_config, "DUPLICATE_SIMILARITY_BACKEND", "trigram")
+        assert get_similarity_backend().name == "trigram"
+
+        long_a = "cloud hosting and managed network services " * 40
+        long_b = "janitorial and grounds maintenance support " * 40
+        assert text_similarity(long_a, long_b, 0.8) == 0.0
+        assert text_similarity(long_a, long_a + " extra", 0.8) > 0.8
+
+    def test_unknown_backend(self, monkeypatch):
+        monkeypatch.setattr(active_config, "DUPLICATE_SIMILARITY_BACKEND", "nope")
+        with pytest.raises(ValueError):
+            get_similarity_backend()
+
+    def test_detector_is_not_kept_alive_by_cache(self):
+        detector = DuplicateDetector()
+        detector._calculate_text_similarity("Cloud Hosting", "Cloud Hosted")
+        ref = weakref.ref(detector)
+
+        del detector
+        gc.collect()
+
+        assert ref() is None
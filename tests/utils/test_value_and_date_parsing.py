@@ -8,8 +8,13 @@ import pandas as pd
 
 from app.utils.value_and_date_parsing import (
     fiscal_quarter_to_date,
+    map_unique,
     normalize_naics_code,
+    parse_fiscal_quarter_series,
+    parse_place_series,
+    parse_value_bounds,
     parse_value_range,
+    parse_value_range_series,
     split_place,
 )
 
@@ -90,6 +95,27 @@ class TestValueRangeParsing:
         num, unit = parse_value_range("N/A")
         assert pd.isna(num) and unit == "N/A"
 
+    def test_parse_value_bounds(self):
+        """Unambiguous values parse to bounds, anything else to None."""
+        test_cases = [
+            ("$1,250,000", (1250000.0, 1250000.0)),
+            ("$2.5 Million", (2500000.0, 2500000.0)),
+            ("500K", (500000.0, 500000.0)),
+            ("$1M - $5M", (1000000.0, 5000000.0)),
+            ("between $100K and $500K", (100000.0, 500000.0)),
+            ("$250,000 to $700,000", (250000.0, 700000.0)),
+            ("TBD", (None, None)),
+            ("Over $5M", None),
+            ("NTE $500K", None),
+            ("5-year $10M", None),
+            ("$1 - 5M", None),
+            ("10-20", None),
+            ("$5M - $1M", None),
+        ]
+
+        for input_value, expected in test_cases:
+            assert parse_value_bounds(input_value) == expected, input_value
+
 
 class TestFiscalQuarterToDate:
     """Test fiscal quarter to date conversion."""
@@ -391,3 +417,56 @@ class TestPerformanceAndEdgeCases:
                 assert (
                     unit_str == expected_unit
                 ), f"Unit failed for {input_value}: got {unit_str}, expected {expected_unit}"
+
+
+class TestSeriesParsing:
+    """Test bulk Series parsers against their scalar counterparts."""
+
+    def test_map_unique_parses_each_distinct_value_once(self):
+        calls = []
+
+        def parser(value):
+            calls.append(value)
+            return str(value)
+
+        values = ["FY25 Q2", "FY25 Q2", 1, 1.0, "FY25 Q2", 1]
+        assert map_unique(values, parser) == [
+            "FY25 Q2",
+            "FY25 Q2",
+            "1",
+            "1.0",
+            "FY25 Q2",
+            "1",
+        ]
+        # 1 and 1.0 stringify differently so they are parsed separately
+        assert calls == ["FY25 Q2", 1, 1.0]
+
+    def test_series_parsers_match_scalar_parsers(self):
+        values = pd.Series(
+            ["$1M-$5M", "FY25 Q2", None, "$1M-$5M", "500K", "TBD", "Washington, DC"],
+            index=[10, 11, 12, 13, 14, 15, 16],
+        )
+
+        cases = [
+            (parse_value_range_series, parse_value_range, ["value", "unit"]),
+            (
+                parse_fiscal_quarter_series,
+                fiscal_quarter_to_date,
+                ["date", "fiscal_year"],
+            ),
+            (parse_place_series, split_place, ["city", "state"]),
+        ]
+        for series_parser, scalar_parser, columns in cases:
+            result = series_parser(values)
+            assert list(result.columns) == columns
+            assert result.index.equals(values.index)
+            for label, value in values.items():
+                expected = scalar_parser(value)
+                for column, expected_item in zip(columns, expected):
+                    actual = result.at[label, column]
+                    if pd.isna(expected_item):
+                        assert pd.isna(actual), f"{series_parser.__name__}({value!r})"
+                    else:
+                        assert (
+                            actual == expected_item
+                        ), f"{series_parser.__name__}({value!r})"